@@ -0,0 +1,3 @@
+# benchmarks/__init__.py
+
+"""Reproducible benchmark suite for social_graph (run: python -m benchmarks)."""
@@ -0,0 +1,84 @@
+# benchmarks/generators.py
+
+"""
+Synthetic social graphs for benchmarking.
+
+Every generator yields (u, v) user-ID pairs lazily and is seeded, so the
+same arguments always produce the same graph. build_graph() turns the
+pairs into a Graph with users named User_0 .. User_{n-1}.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from random import Random
+from typing import Iterator, Tuple
+
+from social_graph.graph import Graph
+
+
+Edge = Tuple[int, int]
+
+
+def erdos_renyi(n: int, avg_degree: float = 10.0, seed: int = 0) -> Iterator[Edge]:
+    """G(n, m) random graph with m = n * avg_degree / 2 sampled pairs."""
+    rng = Random(seed)
+    m = int(n * avg_degree / 2)
+    for _ in range(m):
+        u, v = rng.randrange(n), rng.randrange(n)
+        if u != v:
+            yield u, v
+
+
+def barabasi_albert(n: int, m: int = 5, seed: int = 0) -> Iterator[Edge]:
+    """Preferential attachment: each new user befriends m existing ones."""
+    rng = Random(seed)
+    # Every edge endpoint appears once here, so sampling it picks users
+    # proportionally to their degree.
+    endpoints = []
+
+    core = min(n, m + 1)
+    for u in range(core):
+        for v in range(u):
+            yield u, v
+            endpoints += (u, v)
+
+    for u in range(core, n):
+        targets = set()
+        while len(targets) < m:
+            targets.add(rng.choice(endpoints))
+        for v in targets:
+            yield u, v
+            endpoints += (u, v)
+
+
+def power_law(n: int, exponent: float = 2.5, avg_degree: float = 10.0, seed: int = 0) -> Iterator[Edge]:
+    """Chung–Lu graph whose expected degrees follow a power law."""
+    rng = Random(seed)
+    weights = [(i + 1) ** (-1.0 / (exponent - 1)) for i in range(n)]
+    cumulative = list(accumulate(weights))
+    total = cumulative[-1]
+
+    m = int(n * avg_degree / 2)
+    for _ in range(m):
+        u = bisect_right(cumulative, rng.random() * total)
+        v = bisect_right(cumulative, rng.random() * total)
+        if u != v:
+            yield min(u, n - 1), min(v, n - 1)
+
+
+GENERATORS = {
+    "er": erdos_renyi,
+    "ba": barabasi_albert,
+    "pl": power_law,
+}
+
+
+def user_name(uid: int) -> str:
+    return f"User_{uid}"
+
+
+def build_graph(n: int, edges) -> Graph:
+    return Graph.from_edge_list(
+        ((user_name(u), user_name(v)) for u, v in edges),
+        users=(user_name(i) for i in range(n)),
+    )
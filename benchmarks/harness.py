@@ -0,0 +1,157 @@
+# benchmarks/harness.py
+
+import gc
+import json
+import sys
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import resource
+except ImportError:   # Windows
+    resource = None
+
+
+# =====================================================================
+# Result container
+# =====================================================================
+class BenchmarkResult:
+    def __init__(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        samples_ms: List[float],
+        peak_alloc_bytes: int,
+        peak_rss_bytes: Optional[int],
+    ):
+        self.name = name
+        self.params = params
+        self.samples_ms = samples_ms
+        self.peak_alloc_bytes = peak_alloc_bytes
+        self.peak_rss_bytes = peak_rss_bytes
+
+        ordered = sorted(samples_ms)
+        self.p50 = percentile(ordered, 50)
+        self.p95 = percentile(ordered, 95)
+        self.p99 = percentile(ordered, 99)
+        self.mean = sum(ordered) / len(ordered)
+        self.throughput = 1000.0 / self.mean if self.mean else float("inf")  # ops/s
+
+    @property
+    def key(self) -> str:
+        """Identifies the same measurement across runs (for compare)."""
+        params = ",".join(f"{k}={v}" for k, v in sorted(self.params.items()))
+        return f"{self.name}[{params}]"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "params": self.params,
+            "runs": len(self.samples_ms),
+            "p50_ms": self.p50,
+            "p95_ms": self.p95,
+            "p99_ms": self.p99,
+            "mean_ms": self.mean,
+            "throughput_per_s": self.throughput,
+            "peak_alloc_bytes": self.peak_alloc_bytes,
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+    def summary(self) -> str:
+        return (
+            f"{self.key:<58} p50={self.p50:9.3f}ms p95={self.p95:9.3f}ms "
+            f"p99={self.p99:9.3f}ms  {self.throughput:10.1f} ops/s  "
+            f"alloc={self.peak_alloc_bytes / 1e6:8.2f}MB"
+        )
+
+
+# =====================================================================
+# Measurement
+# =====================================================================
+def percentile(ordered: List[float], pct: float) -> float:
+    """Linear-interpolated percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    pos = (len(ordered) - 1) * pct / 100
+    lo = int(pos)
+    hi = min(lo + 1, len(ordered) - 1)
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo)
+
+
+def peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024   # Linux reports KiB
+
+
+def run_benchmark(
+    name: str,
+    func: Callable[[int], Any],
+    params: Optional[Dict[str, Any]] = None,
+    runs: int = 20,
+    warmup: int = 3,
+) -> BenchmarkResult:
+    """
+    Time func(i) for i in range(runs) after `warmup` untimed calls.
+
+    The run index lets callers vary inputs (e.g. start users) per run in
+    a reproducible way. Peak allocation is measured in one extra traced
+    call so tracemalloc overhead never leaks into the timings.
+    """
+    for i in range(warmup):
+        func(i)
+
+    samples = []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for i in range(runs):
+            t0 = perf_counter()
+            func(i)
+            samples.append((perf_counter() - t0) * 1000)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    tracemalloc.start()
+    try:
+        func(runs)
+        _, peak_alloc = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(name, params or {}, samples, peak_alloc, peak_rss_bytes())
+
+
+# =====================================================================
+# Results files & regression checks
+# =====================================================================
+def write_results(results: List[BenchmarkResult], path: str, meta: Dict[str, Any]) -> None:
+    with open(path, "w") as f:
+        json.dump({"meta": meta, "results": [r.to_dict() | {"key": r.key} for r in results]}, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Dict[str, Any]]:
+    with open(path, "r") as f:
+        data = json.load(f)
+    return {entry["key"]: entry for entry in data["results"]}
+
+
+def compare_results(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    threshold: float = 0.10,
+    metric: str = "p50_ms",
+) -> List[str]:
+    """Describe every benchmark whose `metric` grew by more than threshold."""
+    regressions = []
+    for key, entry in current.items():
+        if key not in baseline or not baseline[key][metric]:
+            continue
+        before, after = baseline[key][metric], entry[metric]
+        change = (after - before) / before
+        if change > threshold:
+            regressions.append(f"{key}: {metric} {before:.3f} -> {after:.3f} ({change:+.1%})")
+    return regressions
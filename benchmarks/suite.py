@@ -0,0 +1,174 @@
+# benchmarks/suite.py
+
+"""
+Benchmark every social_graph algorithm on generated graphs.
+
+    python -m benchmarks --sizes 1000 10000 --generators er ba pl \\
+        --runs 30 --out results.json --compare baseline.json
+"""
+
+import argparse
+import os
+import platform
+import sys
+import tempfile
+from random import Random
+from typing import Callable, Dict, List, Optional, Tuple
+
+from social_graph.bfs import bfs_shortest_path
+from social_graph.components import ComponentIndex
+from social_graph.dfs import dfs_shortest_path, dfs_traversal
+from social_graph.dfs_iterative import dfs_iterative
+from social_graph.dsu import DSU
+from social_graph.graph import Graph
+from social_graph.recommendation import recommend_by_score, recommend_friends
+from social_graph.snapshot import load_snapshot, save_snapshot
+
+from .generators import GENERATORS, build_graph, user_name
+from .harness import (
+    BenchmarkResult, compare_results, load_results, run_benchmark, write_results,
+)
+
+
+Case = Tuple[str, Callable[[int], object]]
+
+
+# =====================================================================
+# CASES
+# =====================================================================
+def algorithm_cases(g: Graph, pairs: List[Tuple[str, str]], workdir: str) -> List[Case]:
+    """(name, func(run_index)) for every read-only operation on g."""
+    start = lambda i: pairs[i % len(pairs)][0]
+    target = lambda i: pairs[i % len(pairs)][1]
+
+    edges = [x for u in range(g.id_capacity()) for v in g.get_neighbors_unsorted(u) if u < v for x in (u, v)]
+    snap_path = os.path.join(workdir, "graph.sgs")
+    json_path = os.path.join(workdir, "graph.json")
+    graph_path = os.path.join(workdir, "graph_data.sgs")
+
+    g.export_json(json_path)
+    save_snapshot(g, snap_path)
+    g.save(graph_path)
+
+    return [
+        ("bfs_shortest_path", lambda i: bfs_shortest_path(g, start(i), target(i))),
+        ("bfs_path_only", lambda i: bfs_shortest_path(g, start(i), target(i), return_full_result=False)),
+        ("bfs_bidirectional", lambda i: bfs_shortest_path(g, start(i), target(i), bidirectional=True)),
+        ("bfs_unordered", lambda i: bfs_shortest_path(g, start(i), target(i), deterministic=False)),
+        ("dfs_traversal", lambda i: dfs_traversal(g, start(i))),
+        ("dfs_iterative", lambda i: dfs_iterative(g, start(i))),
+        ("dfs_shortest_path", lambda i: dfs_shortest_path(g, start(i), target(i))),
+        ("recommend_friends", lambda i: recommend_friends(g, start(i))),
+        ("recommend_by_score", lambda i: recommend_by_score(g, start(i))),
+        ("components_build", lambda i: ComponentIndex(g)),
+        ("dsu_union_edges", lambda i: DSU(g.id_capacity(), compact=True).union_edges(edges)),
+        ("stats", lambda i: g.stats()),
+        ("to_csr", lambda i: g.to_csr()),
+        ("save_json", lambda i: g.export_json(json_path)),
+        ("load_json", lambda i: Graph().load(json_path)),
+        ("graph_save", lambda i: g.save(graph_path)),
+        ("graph_load", lambda i: Graph().load(graph_path)),
+        ("save_snapshot", lambda i: save_snapshot(g, snap_path)),
+        ("load_snapshot_mmap", lambda i: load_snapshot(snap_path)),
+    ]
+
+
+def run_suite(
+    sizes: List[int],
+    generators: List[str],
+    runs: int = 20,
+    warmup: int = 3,
+    seed: int = 0,
+    only: Optional[List[str]] = None,
+    log=print,
+) -> List[BenchmarkResult]:
+    results = []
+
+    def selected(name: str) -> bool:
+        return not only or any(pattern in name for pattern in only)
+
+    def record(name, func, params, n_runs=runs):
+        if selected(name):
+            result = run_benchmark(name, func, params, runs=n_runs, warmup=warmup)
+            results.append(result)
+            log(result.summary())
+
+    for gen_name in generators:
+        generate = GENERATORS[gen_name]
+
+        for n in sizes:
+            params = {"generator": gen_name, "n": n}
+            log(f"\n=== {gen_name.upper()} graph, N = {n} users ===")
+
+            # Construction is expensive: time a few seeded builds only
+            record("build_graph", lambda i: build_graph(n, generate(n, seed=seed + i)),
+                   params, n_runs=max(3, runs // 5))
+
+            g = build_graph(n, generate(n, seed=seed))
+            rng = Random(seed)
+            pairs = [(user_name(rng.randrange(n)), user_name(rng.randrange(n)))
+                     for _ in range(runs + warmup + 1)]
+
+            with tempfile.TemporaryDirectory() as workdir:
+                for name, func in algorithm_cases(g, pairs, workdir):
+                    record(name, func, params)
+
+            # Destructive, so last: each call deletes a different user
+            # (warm-up and timed runs reuse indices, so draw from an
+            # iterator). run_benchmark makes one extra traced call, and
+            # graphs with fewer users than calls skip the case.
+            calls = runs + warmup + 1
+            if n >= calls:
+                victims = iter([user_name(uid) for uid in Random(seed + 1).sample(range(n), calls)])
+                record("delete_user", lambda i: g.delete_user(next(victims)), params)
+            elif selected("delete_user"):
+                log(f"delete_user skipped: needs at least {calls} users")
+
+    return results
+
+
+# =====================================================================
+# CLI
+# =====================================================================
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Social graph benchmark suite")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000, 10000])
+    parser.add_argument("--generators", nargs="+", choices=sorted(GENERATORS), default=["er", "ba", "pl"])
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--only", nargs="+", help="run only benchmarks whose name contains one of these")
+    parser.add_argument("--out", help="write JSON results here")
+    parser.add_argument("--compare", help="baseline JSON results to check for regressions")
+    parser.add_argument("--threshold", type=float, default=0.10,
+                        help="relative p50 slowdown counted as a regression (default 0.10)")
+    args = parser.parse_args(argv)
+
+    print("\n===== SOCIAL GRAPH BENCHMARKS =====")
+    print(f"Sizes: {args.sizes}  Generators: {args.generators}  Runs: {args.runs} (+{args.warmup} warm-up)")
+
+    results = run_suite(args.sizes, args.generators, args.runs, args.warmup, args.seed, args.only)
+
+    if args.out:
+        meta: Dict[str, object] = {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "sizes": args.sizes,
+            "generators": args.generators,
+            "runs": args.runs,
+            "seed": args.seed,
+        }
+        write_results(results, args.out, meta)
+        print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        current = {r.key: r.to_dict() for r in results}
+        regressions = compare_results(load_results(args.compare), current, args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s) over {args.threshold:.0%}:")
+            for line in regressions:
+                print("  " + line)
+            return 1
+        print("\nNo regressions against baseline.")
+
+    return 0
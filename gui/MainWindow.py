@@ -30,9 +30,10 @@ class MainWindow(QMainWindow):
         self.resize(900, 600)
         self.setMinimumSize(750, 500)
 
-        # Load graph
+        # Load graph (binary snapshot + any edits logged since), then log new edits
         self.graph = Graph()
         self.graph.load()
+        self.graph.enable_wal()
 
         # =======================================================
         # COMPLETELY NEW THEME (Lavender & Purple)
@@ -150,7 +151,13 @@ class MainWindow(QMainWindow):
         self.setCentralWidget(container)
 
     def _refresh_and_save(self):
+        # Appends to the write-ahead log; checkpoints only now and then
+        self.graph.sync()
+
+    def closeEvent(self, event):
+        # Fold the log into a fresh snapshot on exit
         self.graph.save()
+        super().closeEvent(event)
 
     # =======================================================
     # Button Handlers
@@ -0,0 +1,59 @@
+# gui/animation_frames.py
+
+"""
+Frame planning for the BFS / DFS animators.
+
+Pure Python (no Qt), so it can be tested without a display.
+"""
+
+import math
+from typing import Hashable, List, Optional, Sequence
+
+ADAPTIVE_THRESHOLD = 60   # up to this many nodes, "auto" keeps one node per frame
+MAX_FRAMES = 120          # "budget" mode never plays longer than this many frames
+MODES = ("auto", "step", "level", "budget")
+
+
+def plan_frames(
+    ids: Sequence[Hashable],
+    levels: Optional[Sequence[Optional[int]]] = None,
+    mode: str = "auto",
+    max_frames: int = MAX_FRAMES,
+) -> List[List[Hashable]]:
+    """
+    Split a visiting order into frames, each painted in one timer tick.
+
+      step    one node per frame (the original animation)
+      level   runs of consecutive nodes with the same level, e.g. BFS
+              distance, so playback length follows the graph's depth
+      budget  equal slices, at most max_frames of them
+      auto    step for short orders, else level if levels are given,
+              else budget
+
+    levels[i] is the level of ids[i]; None counts as a level of its own.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown animation mode {mode!r} (expected one of {MODES})")
+    if mode == "auto":
+        if len(ids) <= ADAPTIVE_THRESHOLD:
+            mode = "step"
+        else:
+            mode = "level" if levels is not None else "budget"
+    if mode == "level" and levels is None:
+        raise ValueError("The level mode needs levels.")
+
+    if mode == "step":
+        return [[uid] for uid in ids]
+
+    if mode == "budget":
+        size = max(1, math.ceil(len(ids) / max(1, max_frames)))
+        return [list(ids[i:i + size]) for i in range(0, len(ids), size)]
+
+    frames = []
+    last = object()
+    for uid, level in zip(ids, levels):
+        if level != last or level is None:
+            frames.append([])
+            last = level
+        frames[-1].append(uid)
+    return frames
@@ -2,11 +2,21 @@
 
 from PyQt5.QtCore import QTimer
 
+from .animation_frames import plan_frames
+from .graph_canvas import VISITED_NODE, FRONTIER_NODE, PATH_NODE
+
 
 class BFSAnimator:
-    """Handles BFS animation timing and state transitions."""
+    """
+    Handles BFS animation timing and state transitions.
+
+    Each tick paints one frame. Small searches show one node per frame;
+    larger ones ("auto" mode) show a whole BFS level per frame, so
+    playback length follows the graph's depth, not its size (see
+    animation_frames.plan_frames for the other modes).
+    """
 
-    def __init__(self, canvas, bfs_result, graph):
+    def __init__(self, canvas, bfs_result, graph, mode="auto"):
         self.canvas = canvas
         self.graph = graph
         self.result = bfs_result
@@ -15,6 +25,11 @@ class BFSAnimator:
         self.visit_ids = [graph.get_user_id(name) for name in bfs_result.visited_order]
         self.path_ids = [graph.get_user_id(name) for name in bfs_result.path]
 
+        # Group the visiting order into frames by BFS distance
+        distances = bfs_result.distances
+        levels = [distances.get(name) for name in bfs_result.visited_order] if distances else None
+        self.frames = plan_frames(self.visit_ids, levels, mode)
+
         # Timers for animation
         self.timer = QTimer()
         self.timer.timeout.connect(self._step_exploration)
@@ -69,25 +84,32 @@ class BFSAnimator:
         self.timer.stop()
         self.path_timer.stop()
 
+    def skip_to_end(self):
+        """Jump straight to the final picture: everything visited, path shown."""
+        self.stop_all()
+        if not self.exploration_done:
+            self.canvas.set_node_colors(self.visit_ids, VISITED_NODE)
+            self.index = len(self.frames)
+            self.exploration_done = True
+        self.canvas.set_node_colors(self.path_ids[self.path_index:], PATH_NODE)
+        self.path_index = len(self.path_ids)
+
     # -------------------------------------------------------------
     # EXPLORATION PHASE (Visited Order)
     # -------------------------------------------------------------
     def _step_exploration(self):
-        """Animate BFS visiting order."""
-        if self.index >= len(self.visit_ids):
+        """Animate BFS visiting order, one frame per call."""
+        if self.index >= len(self.frames):
             # Move to shortest path phase
             self.timer.stop()
             self.exploration_done = True
             self._start_path_animation()
             return
 
-        uid = self.visit_ids[self.index]
-        self.canvas.mark_frontier(uid)
-
-        # Mark previous node as visited
+        # Previous frame becomes visited, this one is the frontier
         if self.index > 0:
-            prev_uid = self.visit_ids[self.index - 1]
-            self.canvas.mark_visited(prev_uid)
+            self.canvas.set_node_colors(self.frames[self.index - 1], VISITED_NODE)
+        self.canvas.set_node_colors(self.frames[self.index], FRONTIER_NODE)
 
         self.index += 1
 
@@ -10,6 +10,7 @@ from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 from social_graph.bfs import bfs_shortest_path
 from .graph_canvas import GraphCanvas
 from .bfs_animator import BFSAnimator
+from .task_executor import frozen_graph, shared_executor
 
 
 class BFSWindow(QDialog):
@@ -18,6 +19,8 @@ class BFSWindow(QDialog):
 
         self.graph = graph
         self.animator = None
+        self.executor = shared_executor()
+        self._task_key = ("bfs", id(self))
 
         # Much more compact & visible
         self.setWindowTitle("BFS Visualizer - Social Graph Explorer")
@@ -88,9 +91,11 @@ class BFSWindow(QDialog):
         self.btn_step.setProperty("class", "controlBtn")
         self.btn_restart = QPushButton("🔄 Restart")
         self.btn_restart.setProperty("class", "controlBtn")
+        self.btn_skip = QPushButton("⏩ Skip to End")
+        self.btn_skip.setProperty("class", "controlBtn")
 
 
-        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart):
+        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart, self.btn_skip):
             self._style_button(b)
             left_layout.addWidget(b)
 
@@ -98,6 +103,7 @@ class BFSWindow(QDialog):
         self.btn_pause.clicked.connect(self.pause_anim)
         self.btn_step.clicked.connect(self.step_anim)
         self.btn_restart.clicked.connect(self.restart_anim)
+        self.btn_skip.clicked.connect(self.skip_anim)
 
         # DETAILS LABEL ----------------------------------------
         lbl_details = QLabel("Details:")
@@ -230,7 +236,7 @@ class BFSWindow(QDialog):
         self.combo_end.addItems(users)
 
     def _update_button_states(self, disable_all=False):
-        buttons = [self.btn_play, self.btn_pause, self.btn_step, self.btn_restart]
+        buttons = [self.btn_play, self.btn_pause, self.btn_step, self.btn_restart, self.btn_skip]
 
         for b in buttons:
             b.setEnabled(not disable_all)
@@ -253,8 +259,24 @@ class BFSWindow(QDialog):
             self.output.setText("⚠ Start and Target cannot be the same.")
             return
 
-        result = bfs_shortest_path(self.graph, start, end, return_full_result=True)
-
+        # Repeated presses coalesce: only the latest search is shown.
+        # The task walks a frozen snapshot, never the live graph.
+        self.output.setText(f"⏳ Searching from {start} to {end}…")
+        snapshot = frozen_graph(self.graph)
+        self.executor.submit(
+            lambda task: bfs_shortest_path(
+                snapshot, start, end, return_full_result=True, progress=task.report
+            ),
+            key=self._task_key,
+            on_progress=lambda reached: self.output.setText(
+                f"⏳ Searching from {start} to {end}… {reached} users reached"
+            ),
+            on_result=lambda result: self._show_result(start, end, result),
+            on_error=lambda exc: self.output.setText(f"⚠ BFS failed: {exc}"),
+        )
+
+    def _show_result(self, start, end, result):
+        self.output.clear()
         if not result.path:
             self.output.setText(f"⚠ No path found between {start} and {end}.")
             return
@@ -269,6 +291,11 @@ class BFSWindow(QDialog):
         self.animator = BFSAnimator(self.canvas, result, self.graph)
         self._update_button_states(disable_all=False)
 
+    def done(self, result):
+        # Closing the window abandons a search still in flight
+        self.executor.cancel(self._task_key)
+        super().done(result)
+
     # Animation Controls
     def play_anim(self):
         if self.animator: self.animator.play()
@@ -283,3 +310,6 @@ class BFSWindow(QDialog):
         if self.animator:
             self.animator.restart()
             self.canvas.reset_colors()
+
+    def skip_anim(self):
+        if self.animator: self.animator.skip_to_end()
@@ -8,15 +8,18 @@ from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
-from social_graph.dsu import DSU
+from social_graph.components import connected_components
 from social_graph.graph import Graph
 from gui.graph_canvas import GraphCanvas
+from gui.task_executor import frozen_graph, shared_executor
 
 
 class CommunityWindow(QDialog):
     def __init__(self, graph: Graph):
         super().__init__()
         self.graph = graph
+        self.executor = shared_executor()
+        self._task_key = ("communities", id(self))
 
         # Window size (more compact like BFS/DFS)
         self.setWindowTitle("🌐 Community Detection (DSU)")
@@ -157,23 +160,27 @@ class CommunityWindow(QDialog):
     # COMMUNITY DETECTION LOGIC
     # -------------------------------------------------------
     def show_communities(self):
-        users = self.graph.get_all_users()
-        n = len(users)
-        user_to_id = {u: self.graph.get_user_id(u) for u in users}
-
-        # DSU over friendships
-        dsu = DSU(n)
-        for u in users:
-            for v in self.graph.get_friends(u):
-                dsu.union(user_to_id[u], user_to_id[v])
-
-        # Group users by root
-        communities = {}
-        for u in users:
-            root = dsu.find(user_to_id[u])
-            communities.setdefault(root, []).append(u)
-
-        sorted_groups = sorted(communities.values(), key=lambda g: -len(g))
+        # Grouping and sorting run off the UI thread on a frozen
+        # snapshot with a DSU of its own, so the graph's live component
+        # index is only ever touched here. Repeated refreshes coalesce.
+        self.output.setText("⏳ Finding communities…")
+        snapshot = frozen_graph(self.graph)
+        self.executor.submit(
+            lambda task: self._find_communities(snapshot, task),
+            key=self._task_key,
+            on_result=self._show_communities,
+            on_error=lambda exc: self.output.setText(f"⚠ Community detection failed: {exc}"),
+        )
+
+    @staticmethod
+    def _find_communities(snapshot, task):
+        groups = connected_components(snapshot, progress=task.report)
+        task.check()
+        get_name = snapshot.get_user_name
+        return sorted(([get_name(uid) for uid in group] for group in groups), key=lambda g: -len(g))
+
+    def _show_communities(self, sorted_groups):
+        n = sum(len(group) for group in sorted_groups)
 
         # Display info
         self.output.clear()
@@ -188,6 +195,10 @@ class CommunityWindow(QDialog):
         # Color communities visually
         self._color_communities(sorted_groups)
 
+    def done(self, result):
+        self.executor.cancel(self._task_key)
+        super().done(result)
+
     # -------------------------------------------------------
     # COLOR COMMUNITIES
     # -------------------------------------------------------
@@ -204,4 +215,4 @@ class CommunityWindow(QDialog):
             color = pastel_palette[idx % len(pastel_palette)]
             for username in group:
                 uid = self.graph.get_user_id(username)
-                self.canvas.nodes[uid].item.setBrush(color)
+                self.canvas.set_node_color(uid, color)
@@ -1,6 +1,11 @@
 from PyQt5.QtCore import QTimer
+
+from gui.animation_frames import plan_frames
+from gui.graph_canvas import VISITED_NODE, FRONTIER_NODE, PATH_NODE
+
+
 class DFSAnimator:
-    def __init__(self, canvas, dfs_result, graph):
+    def __init__(self, canvas, dfs_result, graph, mode="auto"):
         self.canvas = canvas
         self.graph = graph
         self.result = dfs_result
@@ -11,6 +16,9 @@ class DFSAnimator:
         # Convert path to IDs (NEW!)
         self.path_ids = [graph.get_user_id(name) for name in dfs_result.path]
 
+        # DFS has no levels: long orders are cut into a bounded number of frames
+        self.frames = plan_frames(self.order_ids, None, mode)
+
         # Timers
         self.timer = QTimer()
         self.timer.timeout.connect(self._step_visit)
@@ -58,23 +66,28 @@ class DFSAnimator:
         self.timer.stop()
         self.path_timer.stop()
 
+    def skip_to_end(self):
+        self.stop_all()
+        if not self.exploration_done:
+            self.canvas.set_node_colors(self.order_ids, VISITED_NODE)
+            self.index = len(self.frames)
+            self.exploration_done = True
+        self.canvas.set_node_colors(self.path_ids[self.path_index:], PATH_NODE)
+        self.path_index = len(self.path_ids)
+
     # ---------------------------------------------------------
     # DFS VISITING ORDER ANIMATION
     # ---------------------------------------------------------
     def _step_visit(self):
-        if self.index >= len(self.order_ids):
+        if self.index >= len(self.frames):
             self.timer.stop()
             self.exploration_done = True
             self._start_path_animation()
             return
 
-        uid = self.order_ids[self.index]
-
-        self.canvas.mark_frontier(uid)
-
         if self.index > 0:
-            prev = self.order_ids[self.index - 1]
-            self.canvas.mark_visited(prev)
+            self.canvas.set_node_colors(self.frames[self.index - 1], VISITED_NODE)
+        self.canvas.set_node_colors(self.frames[self.index], FRONTIER_NODE)
 
         self.index += 1
 
@@ -9,6 +9,7 @@ from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
 from gui.graph_canvas import GraphCanvas
 from gui.dfs_animator import DFSAnimator
+from gui.task_executor import frozen_graph, shared_executor
 from social_graph.dfs import dfs_shortest_path
 
 
@@ -18,6 +19,8 @@ class DFSWindow(QDialog):
         super().__init__()
 
         self.graph = graph
+        self.executor = shared_executor()
+        self._task_key = ("dfs", id(self))
         self.animator = None
 
         self.setWindowTitle("DFS Visualizer - Social Graph Explorer")
@@ -88,8 +91,10 @@ class DFSWindow(QDialog):
         self.btn_step.setProperty("class", "controlBtn")
         self.btn_restart = QPushButton("🔄 Restart")
         self.btn_restart.setProperty("class", "controlBtn")
+        self.btn_skip = QPushButton("⏩ Skip to End")
+        self.btn_skip.setProperty("class", "controlBtn")
 
-        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart):
+        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart, self.btn_skip):
             self._style_button(b)
             left_layout.addWidget(b)
 
@@ -97,6 +102,7 @@ class DFSWindow(QDialog):
         self.btn_pause.clicked.connect(self.pause_anim)
         self.btn_step.clicked.connect(self.step_anim)
         self.btn_restart.clicked.connect(self.restart_anim)
+        self.btn_skip.clicked.connect(self.skip_anim)
 
         # DETAILS LABEL ----------------------------------------
         lbl_details = QLabel("Details:")
@@ -190,7 +196,7 @@ class DFSWindow(QDialog):
 
     # ---------------------------------------------------------
     def _update_button_states(self, disable_all=False):
-        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart):
+        for b in (self.btn_play, self.btn_pause, self.btn_step, self.btn_restart, self.btn_skip):
             b.setEnabled(not disable_all)
 
     # ---------------------------------------------------------
@@ -205,11 +211,25 @@ class DFSWindow(QDialog):
             self.output.setText("⚠ Start and Target cannot be the same.")
             return
 
-        # result = dfs_traversal(self.graph, start, end, return_full_result=True)
-        result = dfs_shortest_path(self.graph, start, end, return_full_result=True)
-
-
-
+        # Runs off the UI thread: DFS can take a long time on big graphs.
+        # Repeated presses coalesce, closing the window cancels it, and
+        # the task walks a frozen snapshot, never the live graph.
+        self.output.setText(f"⏳ Searching from {start} to {end}…")
+        snapshot = frozen_graph(self.graph)
+        self.executor.submit(
+            lambda task: dfs_shortest_path(
+                snapshot, start, end, return_full_result=True, progress=task.report
+            ),
+            key=self._task_key,
+            on_progress=lambda reached: self.output.setText(
+                f"⏳ Searching from {start} to {end}… {reached} users reached"
+            ),
+            on_result=lambda result: self._show_result(start, end, result),
+            on_error=lambda exc: self.output.setText(f"⚠ DFS failed: {exc}"),
+        )
+
+    def _show_result(self, start, end, result):
+        self.output.clear()
         if not result.path:
             self.output.setText(f"⚠ No path found between {start} and {end}.")
             return
@@ -225,6 +245,11 @@ class DFSWindow(QDialog):
         self.animator = DFSAnimator(self.canvas, result, self.graph)
         self._update_button_states(disable_all=False)
 
+    def done(self, result):
+        # Closing the window stops a search still in flight
+        self.executor.cancel(self._task_key)
+        super().done(result)
+
     # ---------------------------------------------------------
     # Animation Controls
     # ---------------------------------------------------------
@@ -242,4 +267,7 @@ class DFSWindow(QDialog):
             self.animator.restart()
             self.canvas.reset_colors()
 
+    def skip_anim(self):
+        if self.animator: self.animator.skip_to_end()
+
 
@@ -1,18 +1,15 @@
 # gui/graph_canvas.py
 
-from PyQt5.QtWidgets import (
-    QGraphicsView, QGraphicsScene, QGraphicsEllipseItem, QGraphicsLineItem
-)
-from PyQt5.QtGui import QBrush, QPen, QColor, QPainter, QLinearGradient
+from PyQt5.QtWidgets import QGraphicsView
+from PyQt5.QtGui import QBrush, QColor, QPainter
 from PyQt5.QtCore import Qt, QPointF
 
+from .scene_model import SceneModel, NODE_RADIUS, LOD_AUTO_THRESHOLD, node_rect
+
 # ---------------------------------------------------------
 # Updated color palette (Lavender Theme)
 # ---------------------------------------------------------
 BACKGROUND_COLOR = QColor("#f3eaff")        # soft lavender
-EDGE_COLOR = QColor("#bba4ff")              # light purple lines
-LABEL_COLOR = QColor("#372f5c")             # deep purple text
-NODE_BORDER = QColor("#8f7bff")             # medium-purple ring
 
 # Base node
 DEFAULT_NODE = QBrush(QColor("#ffffff"))
@@ -22,67 +19,40 @@ VISITED_NODE = QBrush(QColor("#d8c9ff"))    # light lavender (visited)
 FRONTIER_NODE = QBrush(QColor("#ffe8a3"))   # soft yellow (frontier)
 PATH_NODE = QBrush(QColor("#b1f7dd"))       # mint green (shortest path)
 
-NODE_RADIUS = 26
 FONT_OFFSET_Y = -6
+ZOOM_STEP = 1.15             # per wheel notch
+BATCH_FULL_UPDATE = 64       # recolouring more nodes than this repaints the whole viewport
 
 
-class VisualNode:
-    def __init__(self, node_id, name, scene: QGraphicsScene, pos: QPointF):
-        self.id = node_id
-        self.name = name
-        self.pos = pos
-
-        # Circle item (node)
-        ellipse = QGraphicsEllipseItem(
-            -NODE_RADIUS, -NODE_RADIUS,
-            NODE_RADIUS * 2, NODE_RADIUS * 2
-        )
-
-        # ✨ New gradient fill for nodes
-        gradient = QLinearGradient(0, -NODE_RADIUS, 0, NODE_RADIUS)
-        gradient.setColorAt(0, QColor("#ffffff"))
-        gradient.setColorAt(1, QColor("#f1e8ff"))
-        ellipse.setBrush(QBrush(gradient))
-
-        ellipse.setPen(QPen(NODE_BORDER, 2))
-        ellipse.setZValue(10)
-        ellipse.setPos(pos)
-
-        scene.addItem(ellipse)
-        self.item = ellipse
-
-        # Label
-        self.label = scene.addText(name)
-        self.label.setDefaultTextColor(LABEL_COLOR)
-        self.label.setScale(1.15)
-        self.label.setPos(pos.x() - NODE_RADIUS / 2, pos.y() + FONT_OFFSET_Y)
-        self.label.setZValue(20)
-
-
-class VisualEdge:
-    def __init__(self, u: VisualNode, v: VisualNode, scene: QGraphicsScene):
-        self.u = u
-        self.v = v
-        self.item = QGraphicsLineItem()
-        self.item.setPen(QPen(EDGE_COLOR, 2))
-        scene.addItem(self.item)
-        self.update()
+# =========================================================
+# Canvas
+# =========================================================
+class GraphCanvas(QGraphicsView):
+    """
+    View of a graph's shared SceneModel.
 
-    def update(self):
-        self.item.setLine(
-            self.u.pos.x(), self.u.pos.y(),
-            self.v.pos.x(), self.v.pos.y()
-        )
+    Every canvas on the same graph shows the same scene (built once and
+    kept up to date from graph events), but keeps its own node colours,
+    zoom and LOD setting, so one window's BFS highlight does not leak
+    into another window.
 
+    lod=None picks LOD mode automatically for graphs with more than
+    LOD_AUTO_THRESHOLD users. Without LOD everything is always drawn at
+    full detail, like the original per-item canvas.
+    """
 
-class GraphCanvas(QGraphicsView):
-    def __init__(self, graph):
+    def __init__(self, graph, lod=None):
         super().__init__()
         self.graph = graph
+        self.lod = graph.user_count() > LOD_AUTO_THRESHOLD if lod is None else lod
 
-        self.scene = QGraphicsScene()
+        self.model = SceneModel.for_graph(graph)
+        self.scene = self.model.scene
         self.setScene(self.scene)
         self.setRenderHint(QPainter.Antialiasing)
+        self.setViewportUpdateMode(QGraphicsView.SmartViewportUpdate)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
 
         # ✨ Canvas theme
         self.setStyleSheet("""
@@ -93,66 +63,109 @@ class GraphCanvas(QGraphicsView):
             }
         """)
 
-        self.nodes = {}
-        self.edges = []
+        self.node_brushes = {}     # uid -> QBrush, only for non-default colours
+        self._brush_generation = self.model.generation
+        self._fitted = False
+
+    @property
+    def positions(self):
+        return self.model.positions
+
+    @property
+    def index(self):
+        return self.model.index
 
-        self._build_graph()
+    def current_brushes(self):
+        """This view's colours; dropped if the graph renumbered its users."""
+        if self._brush_generation != self.model.generation:
+            self.node_brushes = {}
+            self._brush_generation = self.model.generation
+        return self.node_brushes
+
+    def edge_list(self):
+        """Every friendship between drawn users once, as (uid, vid)."""
+        return self.model._edge_list()
 
     # ---------------------------------------------------------
-    # Build graph visually
+    # Navigation
     # ---------------------------------------------------------
-    def _build_graph(self):
-        users = sorted(self.graph.get_all_users())
-        center_x, center_y = 400, 300
-        radius = 220
-
-        import math
-        n = len(users)
-
-        for i, name in enumerate(users):
-            angle = (2 * math.pi * i) / max(1, n)
-            x = center_x + radius * math.cos(angle)
-            y = center_y + radius * math.sin(angle)
-
-            uid = self.graph.get_user_id(name)
-            node = VisualNode(uid, name, self.scene, QPointF(x, y))
-            self.nodes[uid] = node
-
-        # Create edges
-        for uid in self.nodes:
-            for vid in self.graph.get_neighbors(uid):
-                if uid < vid:  # avoid duplicates
-                    self.edges.append(
-                        VisualEdge(self.nodes[uid], self.nodes[vid], self.scene)
-                    )
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self.lod and not self._fitted:
+            self.fitInView(self.scene.sceneRect(), Qt.KeepAspectRatio)
+            self._fitted = True
+
+    def wheelEvent(self, event):
+        steps = event.angleDelta().y() / 120
+        if steps:
+            factor = ZOOM_STEP ** steps
+            self.scale(factor, factor)
+
+    def node_at(self, scene_pos: QPointF):
+        """uid of the node under scene_pos, or None."""
+        return self.index.nearest(scene_pos.x(), scene_pos.y(), NODE_RADIUS)
 
     # ---------------------------------------------------------
     # Color helpers used by BFS / DFS
     # ---------------------------------------------------------
-    def reset_colors(self):
-        for node in self.nodes.values():
+    def set_node_color(self, uid, color):
+        """Fill node uid with a QColor / QBrush (None = default look)."""
+        if uid not in self.positions:
+            return
+        brushes = self.current_brushes()
+        if color is None:
+            brushes.pop(uid, None)
+        else:
+            brushes[uid] = color if isinstance(color, QBrush) else QBrush(color)
+        # Colours are per view: repaint this viewport only, not the scene
+        self.viewport().update(self.mapFromScene(node_rect(*self.positions[uid])).boundingRect())
+
+    def set_node_colors(self, uids, color):
+        """
+        Fill many nodes with one colour (None = default) and schedule a
+        single repaint for all of them.
+        """
+        positions = self.positions
+        uids = [uid for uid in uids if uid in positions]
+        if not uids:
+            return
+
+        brushes = self.current_brushes()
+        if color is None:
+            for uid in uids:
+                brushes.pop(uid, None)
+        else:
+            brush = color if isinstance(color, QBrush) else QBrush(color)
+            for uid in uids:
+                brushes[uid] = brush
+
+        if len(uids) > BATCH_FULL_UPDATE:
+            self.viewport().update()
+            return
+        region = node_rect(*positions[uids[0]])
+        for uid in uids[1:]:
+            region = region.united(node_rect(*positions[uid]))
+        self.viewport().update(self.mapFromScene(region).boundingRect())
 
-            gradient = QLinearGradient(0, -NODE_RADIUS, 0, NODE_RADIUS)
-            gradient.setColorAt(0, QColor("#ffffff"))
-            gradient.setColorAt(1, QColor("#f1e8ff"))
-            node.item.setBrush(QBrush(gradient))
+    def reset_colors(self):
+        self.node_brushes = {}
+        self.viewport().update()
 
     def mark_visited(self, uid):
-        self.nodes[uid].item.setBrush(VISITED_NODE)
+        self.set_node_color(uid, VISITED_NODE)
 
     def mark_frontier(self, uid):
-        self.nodes[uid].item.setBrush(FRONTIER_NODE)
+        self.set_node_color(uid, FRONTIER_NODE)
 
     def mark_path(self, uid):
-        self.nodes[uid].item.setBrush(PATH_NODE)
+        self.set_node_color(uid, PATH_NODE)
     # ---------------------------------------------------------
     # DELETE USER
     # ---------------------------------------------------------
     def delete_user_visual(self, username: str):
-        # 1. Clear scene and internal structures
-        self.scene.clear()
-        self.nodes = {}
-        self.edges = []
-
-        # 2. Rebuild the graph
-        self._build_graph()
+        # The shared scene already dropped the node and its edges when
+        # the graph emitted "delete_user"; only this view's colours remain.
+        brushes = self.current_brushes()
+        for uid in [uid for uid in brushes if uid not in self.positions]:
+            del brushes[uid]
+        self.viewport().update()
@@ -37,29 +37,43 @@ class MiniListCanvas(QWidget):
             y += 28
 
 
+# Largest corner of the matrix shown as text / heatmap
+MATRIX_PREVIEW_USERS = 60
+MIN_HEATMAP_CELL = 4
+
+
 # ------------------------------------------------------------
 # MINI HEATMAP FOR ADJACENCY MATRIX
 # ------------------------------------------------------------
 class MatrixHeatmap(QWidget):
-    def __init__(self, matrix):
+    """Paints only the tile of the matrix that fits, fetched on demand."""
+
+    def __init__(self, graph, row_start=0, col_start=0):
         super().__init__()
-        self.matrix = matrix
-        self.size = len(matrix)
+        self.graph = graph
+        self.row_start = row_start
+        self.col_start = col_start
         self.setMinimumHeight(240)
 
     def paintEvent(self, event):
         qp = QPainter(self)
         qp.setRenderHint(QPainter.Antialiasing)
 
-        n = self.size
+        n = self.graph.user_count()
         if n == 0:
             return
 
-        cell = min(self.width() // n, self.height() // n, 28)
+        cell = max(min(self.width() // n, self.height() // n, 28), MIN_HEATMAP_CELL)
+        rows = min(n - self.row_start, (self.height() - 20) // cell)
+        cols = min(n - self.col_start, (self.width() - 20) // cell)
 
-        for r in range(n):
-            for c in range(n):
-                val = self.matrix[r][c]
+        tile = self.graph.adjacency_matrix_window(
+            self.row_start, self.row_start + rows,
+            self.col_start, self.col_start + cols,
+        )
+
+        for r, tile_row in enumerate(tile):
+            for c, val in enumerate(tile_row):
                 color = QColor("#b8f5c4") if val == 1 else QColor("#eee8ff")
                 qp.setBrush(QBrush(color))
                 qp.setPen(QPen(QColor("#b7a2ff"), 1))
@@ -165,17 +179,21 @@ class GraphViewWindow(QDialog):
         label.setStyleSheet("font-size: 18px; font-weight: bold;")
         layout.addWidget(label)
 
-        matrix = self.graph.adjacency_matrix()
-
-        heatmap = MatrixHeatmap(matrix)
+        # Heatmap pulls just its visible tile; never the full V×V matrix
+        heatmap = MatrixHeatmap(self.graph)
         heatmap.setStyleSheet("background:#ffffff; border-radius:12px; border:2px solid #dcd2ff;")
         layout.addWidget(heatmap)
 
-        # Text version
+        # Text version (top-left corner on large graphs)
+        text = self.graph.print_adjacency_matrix(max_users=MATRIX_PREVIEW_USERS)
+        if self.graph.user_count() > MATRIX_PREVIEW_USERS:
+            text = (f"Showing the first {MATRIX_PREVIEW_USERS} of "
+                    f"{self.graph.user_count()} users.\n\n" + text)
+
         box = QTextEdit()
         box.setReadOnly(True)
         box.setMinimumHeight(220)
-        box.setText(self.graph.print_adjacency_matrix())
+        box.setText(text)
         layout.addWidget(box)
 
         w.setLayout(layout)
@@ -192,12 +210,13 @@ class GraphViewWindow(QDialog):
         label.setStyleSheet("font-size: 18px; font-weight: bold;")
         layout.addWidget(label)
 
+        # Counters are maintained by the graph; nothing is recomputed here
+        stats = self.graph.stats()
         users = self.graph.get_all_users()
-        matrix = self.graph.adjacency_matrix()
 
-        node_count = len(users)
-        edge_count = sum(sum(row) for row in matrix) // 2
-        isolated = [u for u in users if len(self.graph.get_friends(u)) == 0]
+        node_count = stats.users
+        edge_count = stats.friendships
+        isolated = self.graph.isolated_users()
 
         # ------------------------
         # Statistic Cards
@@ -205,7 +224,7 @@ class GraphViewWindow(QDialog):
         card_layout = QHBoxLayout()
         card_layout.addWidget(StatCard("Users (Nodes)", str(node_count), "#dec0ff"))
         card_layout.addWidget(StatCard("Friendships (Edges)", str(edge_count), "#b8e1ff"))
-        card_layout.addWidget(StatCard("Isolated Users", str(len(isolated)), "#ffd580"))
+        card_layout.addWidget(StatCard("Isolated Users", str(stats.isolated), "#ffd580"))
         layout.addLayout(card_layout)
 
         # ------------------------
@@ -215,13 +234,18 @@ class GraphViewWindow(QDialog):
         details.setReadOnly(True)
         details.setMinimumHeight(260)
 
-        stats = [
+        histogram = ", ".join(f"{d}: {c}" for d, c in stats.degree_histogram.items())
+        lines = [
             f"Users: {', '.join(sorted(users))}",
             "",
+            f"Max Degree: {stats.max_degree}",
+            f"Average Degree: {stats.average_degree:.2f}",
+            f"Degree Distribution (degree: users): {histogram or 'None'}",
+            "",
             "Isolated Users:",
             ", ".join(isolated) if isolated else "None"
         ]
-        details.setText("\n".join(stats))
+        details.setText("\n".join(lines))
 
         layout.addWidget(details)
         w.setLayout(layout)
@@ -285,7 +309,7 @@ class GraphViewWindow(QDialog):
 
         # Perform deletion in backend
         self.graph.delete_user(username)
-        self.graph.save()
+        self.graph.sync()
         self._refresh_tabs()
         # Refresh graph preview — adjacency list & matrix
         # (Tabs will rebuild when reopened)
@@ -0,0 +1,49 @@
+# gui/layout_worker.py
+
+import time
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+PROGRESS_INTERVAL = 0.05   # seconds between streamed frames
+
+
+class LayoutThread(QThread):
+    """
+    Runs a social_graph.layout Layout off the GUI thread.
+
+    The layout works on a (names, edges) snapshot taken before start(),
+    so the graph may change meanwhile. Intermediate positions are sent
+    through `progress` at most every PROGRESS_INTERVAL seconds (unless
+    stream=False), and the final ones through `done` (not sent if the
+    thread was interrupted). Both carry a {username: (x, y)} dict and
+    arrive on the GUI thread.
+    """
+
+    progress = pyqtSignal(object)
+    done = pyqtSignal(object)
+
+    def __init__(self, layout, names, edges, initial=None, stream=True):
+        super().__init__()
+        self.layout = layout
+        self.names = names
+        self.edges = edges
+        self.initial = initial
+        self.stream = stream
+
+    def run(self):
+        positions = {}
+        last_sent = time.monotonic()
+        for positions in self.layout.iterate(self.names, self.edges, self.initial):
+            if self.isInterruptionRequested():
+                return
+            if not self.stream:
+                continue
+            now = time.monotonic()
+            if now - last_sent >= PROGRESS_INTERVAL:
+                self.progress.emit(positions)
+                last_sent = now
+        self.done.emit(positions)
+
+    def stop(self):
+        self.requestInterruption()
+        self.wait()
@@ -0,0 +1,178 @@
+# gui/quadtree.py
+
+"""
+Point quadtree used by GraphCanvas for visible-region queries.
+
+Pure Python (no Qt), so it can be tested without a display.
+"""
+
+from typing import Hashable, List, Optional, Tuple
+
+Rect = Tuple[float, float, float, float]   # (x0, y0, x1, y1), x0 <= x1, y0 <= y1
+
+
+class QuadTree:
+    """
+    Stores (item, x, y) points and answers "which items lie in this
+    rectangle" in O(log n + k). A node splits into four children once it
+    holds more than `capacity` points; points outside the root bounds
+    grow the root, so callers never need to know the extent up front.
+    """
+
+    __slots__ = ("bounds", "capacity", "max_depth", "depth", "points", "children", "_size")
+
+    def __init__(self, bounds: Rect, capacity: int = 16, max_depth: int = 20, _depth: int = 0):
+        x0, y0, x1, y1 = bounds
+        if _depth == 0:   # growing the root doubles its size, so it must have one
+            bounds = (x0, y0, max(x1, x0 + 1.0), max(y1, y0 + 1.0))
+        self.bounds = bounds
+        self.capacity = capacity
+        self.max_depth = max_depth
+        self.depth = _depth
+        self.points: List[Tuple[Hashable, float, float]] = []
+        self.children: Optional[List["QuadTree"]] = None
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+    def insert(self, item: Hashable, x: float, y: float) -> None:
+        if not self._contains(x, y):
+            self._grow_towards(x, y)
+        self._insert(item, x, y)
+
+    def _insert(self, item, x, y) -> None:
+        node = self
+        while True:
+            node._size += 1
+            if node.children is None:
+                node.points.append((item, x, y))
+                if len(node.points) > node.capacity and node.depth < node.max_depth:
+                    node._split()
+                return
+            node = node.children[node._quadrant(x, y)]
+
+    def remove(self, item: Hashable, x: float, y: float) -> bool:
+        """Remove `item` stored at (x, y); False if it is not there."""
+        if not self._contains(x, y):
+            return False
+
+        path = []
+        node = self
+        while node.children is not None:
+            path.append(node)
+            node = node.children[node._quadrant(x, y)]
+
+        for i, point in enumerate(node.points):
+            if point[0] == item:
+                del node.points[i]
+                node._size -= 1
+                for parent in path:
+                    parent._size -= 1
+                return True
+        return False
+
+    def clear(self) -> None:
+        self.points = []
+        self.children = None
+        self._size = 0
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+    def query(self, rect: Rect) -> List[Hashable]:
+        """Items whose point lies inside rect (edges included)."""
+        qx0, qy0, qx1, qy1 = rect
+        found = []
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            x0, y0, x1, y1 = node.bounds
+            if x0 > qx1 or x1 < qx0 or y0 > qy1 or y1 < qy0 or not node._size:
+                continue
+
+            if node.children is not None:
+                stack.extend(node.children)
+            elif qx0 <= x0 and x1 <= qx1 and qy0 <= y0 and y1 <= qy1:
+                found.extend(p[0] for p in node.points)     # fully covered
+            else:
+                found.extend(p[0] for p in node.points if qx0 <= p[1] <= qx1 and qy0 <= p[2] <= qy1)
+        return found
+
+    def nearest(self, x: float, y: float, max_distance: float) -> Optional[Hashable]:
+        """Closest item within max_distance of (x, y), or None."""
+        best, best_d2 = None, max_distance * max_distance
+        rect = (x - max_distance, y - max_distance, x + max_distance, y + max_distance)
+
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            x0, y0, x1, y1 = node.bounds
+            if x0 > rect[2] or x1 < rect[0] or y0 > rect[3] or y1 < rect[1] or not node._size:
+                continue
+            if node.children is not None:
+                stack.extend(node.children)
+                continue
+            for item, px, py in node.points:
+                d2 = (px - x) ** 2 + (py - y) ** 2
+                if d2 <= best_d2:
+                    best, best_d2 = item, d2
+        return best
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+    def _contains(self, x: float, y: float) -> bool:
+        x0, y0, x1, y1 = self.bounds
+        return x0 <= x <= x1 and y0 <= y <= y1
+
+    def _quadrant(self, x: float, y: float) -> int:
+        x0, y0, x1, y1 = self.bounds
+        return (x > (x0 + x1) / 2) + 2 * (y > (y0 + y1) / 2)
+
+    def _split(self) -> None:
+        x0, y0, x1, y1 = self.bounds
+        mx, my = (x0 + x1) / 2, (y0 + y1) / 2
+        self.children = [
+            QuadTree(rect, self.capacity, self.max_depth, self.depth + 1)
+            for rect in ((x0, y0, mx, my), (mx, y0, x1, my), (x0, my, mx, y1), (mx, my, x1, y1))
+        ]
+        points, self.points = self.points, []
+        for item, px, py in points:
+            self.children[self._quadrant(px, py)]._insert(item, px, py)
+
+    def _grow_towards(self, x: float, y: float) -> None:
+        """Double the root until it covers (x, y), then re-insert everything."""
+        x0, y0, x1, y1 = self.bounds
+        while not (x0 <= x <= x1 and y0 <= y <= y1):
+            w, h = x1 - x0, y1 - y0
+            if x < x0:
+                x0 -= w
+            else:
+                x1 += w
+            if y < y0:
+                y0 -= h
+            else:
+                y1 += h
+
+        # Re-inserting (rather than grafting the old tree in as a child)
+        # keeps every point in the quadrant _quadrant() will look in,
+        # including points on the old boundary. Growth is rare: the
+        # extent doubles each time.
+        points = list(self._iter_points())
+        self.bounds = (x0, y0, x1, y1)
+        self.clear()
+        for item, px, py in points:
+            self._insert(item, px, py)
+
+    def _iter_points(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            if node.children is not None:
+                stack.extend(node.children)
+            else:
+                yield from node.points
@@ -9,13 +9,18 @@ from PyQt5.QtGui import QColor
 from PyQt5.QtWidgets import QGraphicsDropShadowEffect
 
 from gui.graph_canvas import GraphCanvas
-from social_graph.bfs import bfs_shortest_path
+from social_graph.recommendation import recommend_by_score
+from gui.task_executor import frozen_graph, shared_executor
+
+MAX_RECOMMENDATIONS = 10
 
 
 class RecommendationWindow(QDialog):
     def __init__(self, graph):
         super().__init__()
         self.graph = graph
+        self.executor = shared_executor()
+        self._task_key = ("recommendations", id(self))
 
         self.setWindowTitle("⭐ Friend Recommendations")
         self.resize(980, 540)          # smaller overall window
@@ -171,8 +176,18 @@ class RecommendationWindow(QDialog):
             self.output.setText("Please select a user.")
             return
 
-        recommendations = self.get_recommendations(username)
-
+        # Scored off the UI thread on a frozen snapshot; repeated presses
+        # coalesce and closing the window cancels the task
+        self.output.setText(f"⏳ Finding recommendations for {username}…")
+        snapshot = frozen_graph(self.graph)
+        self.executor.submit(
+            lambda task: self.get_recommendations(username, snapshot, progress=task.report),
+            key=self._task_key,
+            on_result=lambda recommendations: self._show_recommendations(username, recommendations),
+            on_error=lambda exc: self.output.setText(f"⚠ Recommendation failed: {exc}"),
+        )
+
+    def _show_recommendations(self, username, recommendations):
         self.output.clear()
         self.output.append(f"Recommendations for {username}:\n")
 
@@ -188,25 +203,15 @@ class RecommendationWindow(QDialog):
 
         self.highlight_recommendations([rec[0] for rec in recommendations])
 
-    # Ranking system (unchanged)
-    def get_recommendations(self, user):
-        all_users = set(self.graph.get_all_users())
-        friends = set(self.graph.get_friends(user))
-        candidates = all_users - friends - {user}
-
-        recommendations = []
-
-        for other in candidates:
-            mutual_count = len(friends.intersection(self.graph.get_friends(other)))
-            bfs_res = bfs_shortest_path(self.graph, user, other, return_full_result=True)
-            distance = bfs_res.distances.get(other, None)
-            distance_score = 0 if distance is None else 1 / (1 + distance)
-
-            final_score = (mutual_count * 0.7) + (distance_score * 0.3)
-            recommendations.append((other, final_score, mutual_count, distance))
+    def done(self, result):
+        self.executor.cancel(self._task_key)
+        super().done(result)
 
-        recommendations.sort(key=lambda x: -x[1])
-        return recommendations
+    # Ranking system: one BFS + one friends-of-friends pass, top-k via heap
+    def get_recommendations(self, user, graph=None, progress=None):
+        return recommend_by_score(
+            self.graph if graph is None else graph, user, max_results=MAX_RECOMMENDATIONS, progress=progress
+        )
 
     # Highlight recommended users
     def highlight_recommendations(self, recommended_users):
@@ -214,4 +219,4 @@ class RecommendationWindow(QDialog):
         rec_color = QColor("#b8f5c4")
         for u in recommended_users:
             uid = self.graph.get_user_id(u)
-            self.canvas.nodes[uid].item.setBrush(rec_color)
+            self.canvas.set_node_color(uid, rec_color)
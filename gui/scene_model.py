@@ -0,0 +1,525 @@
+# gui/scene_model.py
+
+import math
+import weakref
+
+from PyQt5.QtWidgets import QGraphicsScene, QGraphicsItem, QStyleOptionGraphicsItem
+from PyQt5.QtGui import (
+    QBrush, QPen, QColor, QLinearGradient, QGradient, QPainterPath, QFont
+)
+from PyQt5.QtCore import Qt, QPointF, QRectF, QCoreApplication
+
+from social_graph.layout import (
+    CircleLayout, ForceDirectedLayout, layout_input, fingerprint,
+    cache_path, load_cached_layout, save_cached_layout, have_numpy,
+)
+from .layout_worker import LayoutThread
+from .quadtree import QuadTree
+
+# ---------------------------------------------------------
+# Drawing palette (Lavender Theme)
+# ---------------------------------------------------------
+EDGE_COLOR = QColor("#bba4ff")              # light purple lines
+LABEL_COLOR = QColor("#372f5c")             # deep purple text
+NODE_BORDER = QColor("#8f7bff")             # medium-purple ring
+
+NODE_RADIUS = 26
+
+# ---------------------------------------------------------
+# Level of detail (LOD = screen pixels per scene unit)
+# ---------------------------------------------------------
+LOD_AUTO_THRESHOLD = 300     # more users than this → LOD mode by default
+NODE_DETAIL_LOD = 0.35       # below: nodes are flat squares, no ring/gradient
+LABEL_LOD = 0.6              # below: no labels
+EDGE_LOD = 0.08              # below: no edges at all
+EDGE_CHUNK_SIZE = 2000       # edges per batched QPainterPath
+EDGE_CHUNK_CELL = 2000.0     # grid cell used to keep chunks spatially compact
+
+# Layout
+LAYOUT_CENTER = (400, 300)
+MIN_LAYOUT_RADIUS = 220
+NODE_SPACING = NODE_RADIUS * 2.5
+GOLDEN_ANGLE = math.pi * (3 - math.sqrt(5))
+AUTO_LAYOUT_MAX_USERS = 2000   # without NumPy, bigger graphs keep the circle
+STREAM_LAYOUT_MAX_USERS = 1000   # bigger graphs show only the final layout
+
+
+def _node_gradient() -> QBrush:
+    # Object-bounding coordinates, so one brush fits every node
+    gradient = QLinearGradient(0, 0, 0, 1)
+    gradient.setCoordinateMode(QGradient.ObjectBoundingMode)
+    gradient.setColorAt(0, QColor("#ffffff"))
+    gradient.setColorAt(1, QColor("#f1e8ff"))
+    return QBrush(gradient)
+
+
+def default_layout():
+    return ForceDirectedLayout(spacing=NODE_SPACING * 1.5, center=LAYOUT_CENTER)
+
+
+def _view_settings(widget):
+    """(lod enabled, node brushes) of the GraphCanvas being painted."""
+    view = widget.parentWidget() if widget is not None else None
+    if view is None or not hasattr(view, "current_brushes"):
+        return False, {}   # e.g. QGraphicsScene.render(): full detail, default colours
+    return view.lod, view.current_brushes()
+
+
+# =========================================================
+# Scene layers: one item for all edges, one for all nodes
+# =========================================================
+class _EdgeChunk:
+    __slots__ = ("edges", "path", "rect")
+
+    def __init__(self):
+        self.edges = {}            # (u, v) -> None; a dict keeps order and O(1) removal
+        self.path = QPainterPath()
+        self.rect = QRectF()
+
+
+class EdgeLayer(QGraphicsItem):
+    """
+    Every friendship, painted as a handful of batched QPainterPaths.
+
+    Edges are grouped into chunks of nearby edges; only chunks whose
+    bounds meet the exposed region are drawn. A new edge is appended to
+    the open chunk's path in O(1); removing one redraws only its chunk.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        self._chunks = []
+        self._chunk_of = {}          # (u, v) -> index into _chunks
+        self._rect = QRectF()
+        self.setZValue(0)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+        self._pen = QPen(EDGE_COLOR, 2)
+        self._thin_pen = QPen(EDGE_COLOR, 1)
+        self._thin_pen.setCosmetic(True)   # stays 1px however far we zoom out
+
+    def rebuild(self, edges):
+        positions = self.model.positions
+
+        def cell(edge):
+            x, y = positions[edge[0]]
+            return int(x // EDGE_CHUNK_CELL), int(y // EDGE_CHUNK_CELL)
+
+        self._chunks = []
+        self._chunk_of = {}
+        for edge in sorted(edges, key=cell):
+            self._append(edge)
+        self._update_bounds()
+        self.update()
+
+    def add_edge(self, u, v):
+        edge = (u, v) if u < v else (v, u)
+        if edge in self._chunk_of:
+            return
+        chunk = self._append(edge)
+        if not self._rect.contains(chunk.rect):
+            self._update_bounds()
+        self.update(self._edge_rect(edge))
+
+    def remove_edges(self, pairs):
+        touched = set()
+        for u, v in pairs:
+            edge = (u, v) if u < v else (v, u)
+            index = self._chunk_of.pop(edge, None)
+            if index is not None:
+                del self._chunks[index].edges[edge]
+                touched.add(index)
+
+        positions = self.model.positions
+        for index in touched:
+            chunk = self._chunks[index]
+            dirty = chunk.rect
+            chunk.path = QPainterPath()
+            for a, b in chunk.edges:
+                chunk.path.moveTo(*positions[a])
+                chunk.path.lineTo(*positions[b])
+            chunk.rect = chunk.path.boundingRect()
+            self.update(dirty)
+
+    def _append(self, edge):
+        if not self._chunks or len(self._chunks[-1].edges) >= EDGE_CHUNK_SIZE:
+            self._chunks.append(_EdgeChunk())
+        chunk = self._chunks[-1]
+        chunk.edges[edge] = None
+        self._chunk_of[edge] = len(self._chunks) - 1
+
+        positions = self.model.positions
+        chunk.path.moveTo(*positions[edge[0]])
+        chunk.path.lineTo(*positions[edge[1]])
+        chunk.rect = chunk.rect.united(self._edge_rect(edge))
+        return chunk
+
+    def _edge_rect(self, edge):
+        (x1, y1), (x2, y2) = self.model.positions[edge[0]], self.model.positions[edge[1]]
+        return QRectF(QPointF(min(x1, x2), min(y1, y2)), QPointF(max(x1, x2), max(y1, y2))).adjusted(-2, -2, 2, 2)
+
+    def _update_bounds(self):
+        self.prepareGeometryChange()
+        self._rect = QRectF()
+        for chunk in self._chunks:
+            self._rect = self._rect.united(chunk.rect)
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        lod_mode, _ = _view_settings(widget)
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if lod_mode and lod < EDGE_LOD:
+            return
+
+        painter.setPen(self._thin_pen if lod_mode and lod < NODE_DETAIL_LOD else self._pen)
+        painter.setBrush(Qt.NoBrush)
+        exposed = option.exposedRect
+        for chunk in self._chunks:
+            if chunk.rect.intersects(exposed):
+                painter.drawPath(chunk.path)
+
+
+class NodeLayer(QGraphicsItem):
+    """
+    Every user, painted on demand from the model's quadtree.
+
+    Only nodes inside the exposed region are drawn. Zoomed out (in LOD
+    mode) they become flat squares batched per colour; rings, gradients
+    and labels appear as the zoom passes NODE_DETAIL_LOD / LABEL_LOD.
+    Colours come from the view being painted, so windows sharing the
+    scene can highlight different nodes.
+    """
+
+    def __init__(self, model):
+        super().__init__()
+        self.model = model
+        self._rect = QRectF()
+        self.setZValue(10)
+        self.setFlag(QGraphicsItem.ItemUsesExtendedStyleOption)
+
+        self._default_brush = _node_gradient()
+        self._flat_default = QBrush(QColor("#ffffff"))
+        self._border = QPen(NODE_BORDER, 2)
+        self._font = QFont()
+        self._font.setPointSizeF(self._font.pointSizeF() * 1.15)
+
+    def cover(self, rect: QRectF):
+        """Make sure the layer's bounds include rect (grows, never shrinks)."""
+        if not self._rect.contains(rect):
+            self.prepareGeometryChange()
+            self._rect = self._rect.united(rect)
+
+    def reset_bounds(self, rect: QRectF):
+        self.prepareGeometryChange()
+        self._rect = rect
+        self.update()
+
+    def boundingRect(self):
+        return self._rect
+
+    def paint(self, painter, option, widget=None):
+        model = self.model
+        lod_mode, brushes = _view_settings(widget)
+        lod = QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+
+        r = option.exposedRect.adjusted(-NODE_RADIUS, -NODE_RADIUS, NODE_RADIUS, NODE_RADIUS)
+        visible = model.index.query((r.left(), r.top(), r.right(), r.bottom()))
+        positions = model.positions
+
+        if lod_mode and lod < NODE_DETAIL_LOD:
+            # Flat squares, one drawRects call per colour
+            groups = {}
+            for uid in visible:
+                x, y = positions[uid]
+                square = QRectF(x - NODE_RADIUS, y - NODE_RADIUS, NODE_RADIUS * 2, NODE_RADIUS * 2)
+                brush = brushes.get(uid)
+                key = None if brush is None else brush.color().rgba()
+                groups.setdefault(key, (brush, []))[1].append(square)
+
+            painter.setPen(Qt.NoPen)
+            for brush, squares in groups.values():
+                painter.setBrush(brush if brush is not None else self._flat_default)
+                painter.drawRects(squares)
+            return
+
+        painter.setPen(self._border)
+        for uid in visible:
+            x, y = positions[uid]
+            painter.setBrush(brushes.get(uid, self._default_brush))
+            painter.drawEllipse(QPointF(x, y), NODE_RADIUS, NODE_RADIUS)
+
+        if not lod_mode or lod >= LABEL_LOD:
+            painter.setPen(LABEL_COLOR)
+            painter.setFont(self._font)
+            names = model.names
+            for uid in visible:
+                x, y = positions[uid]
+                painter.drawText(node_rect(x, y), Qt.AlignCenter, names[uid])
+
+
+def node_rect(x: float, y: float) -> QRectF:
+    """Scene area a node and its label may paint into."""
+    return QRectF(x - NODE_RADIUS * 3, y - NODE_RADIUS - 2, NODE_RADIUS * 6, NODE_RADIUS * 2 + 4)
+
+
+# =========================================================
+# Shared scene model
+# =========================================================
+class SceneModel:
+    """
+    Positions, spatial index and layer items for one graph, shared by
+    every GraphCanvas showing that graph (use SceneModel.for_graph).
+
+    The model subscribes to the graph's mutation events and applies
+    each one incrementally: a new user gets a free spot outside the
+    existing layout without moving anyone else, and a new or deleted
+    friendship/user touches only its own nodes and edge chunks, so
+    edits cost O(degree) rather than a rebuild. Only "reset" (IDs
+    renumbered or reloaded) rebuilds, keeping known users in place.
+
+    The first layout is a circle. A force-directed layout then runs in a
+    background thread, streaming positions into the scene as it settles
+    (each frame rebuilds both layers, so only up to
+    STREAM_LAYOUT_MAX_USERS users; bigger graphs keep the circle until
+    it finishes). Its result is cached next to the graph file, so the
+    next launch on an unchanged graph shows it straight away.
+    """
+
+    _models = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def for_graph(cls, graph) -> "SceneModel":
+        model = cls._models.get(graph)
+        if model is None:
+            model = cls._models[graph] = cls(graph)
+        return model
+
+    def __init__(self, graph):
+        # Weak, so the shared-model cache does not keep the graph alive
+        self._graph = weakref.ref(graph)
+
+        self.scene = QGraphicsScene()
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)   # two items; nodes indexed below
+
+        self.positions = {}        # uid -> (x, y) scene coordinates
+        self.names = {}            # uid -> username, for labels and stable re-layout
+        self.index = QuadTree((0, 0, 1, 1))
+        self.generation = 0        # bumped on every reset (uids may have changed)
+        self._radius = MIN_LAYOUT_RADIUS
+        self._appended = 0         # users placed after the last full layout
+
+        self.edge_layer = EdgeLayer(self)
+        self.node_layer = NodeLayer(self)
+        self.scene.addItem(self.edge_layer)
+        self.scene.addItem(self.node_layer)
+
+        self._layout_thread = None
+
+        self.rebuild()
+        graph.subscribe(self._on_graph_event)
+        self._restore_layout()
+
+    @property
+    def graph(self):
+        return self._graph()
+
+    # ---------------------------------------------------------
+    # Full build
+    # ---------------------------------------------------------
+    def rebuild(self, keep: dict = None):
+        """
+        Lay out every user on a circle and rebuild both layers.
+
+        keep maps username -> (x, y) for users that must stay put; the
+        rest are placed around them.
+        """
+        graph = self.graph
+        users = sorted(graph.get_all_users())
+        self.names = {graph.get_user_id(name): name for name in users}
+
+        if not keep:
+            circle = CircleLayout(LAYOUT_CENTER, MIN_LAYOUT_RADIUS, NODE_SPACING).compute(users, [])
+            self.relayout({uid: circle[name] for uid, name in self.names.items()})
+            return
+
+        self.relayout({uid: keep[name] for uid, name in self.names.items() if name in keep})
+        for uid, name in self.names.items():
+            if name not in keep:
+                self._place(uid, name, *self._free_position())
+        self._update_scene_rect()
+
+    def relayout(self, positions: dict):
+        """Move nodes to new uid -> (x, y) positions and rebuild the layers."""
+        self.positions = dict(positions)
+        x0, y0, x1, y1 = self._extent()
+        self.index = QuadTree((x0, y0, x1, y1))
+        for uid, (x, y) in self.positions.items():
+            self.index.insert(uid, x, y)
+
+        # Users added from now on go on a spiral just outside this layout
+        cx, cy = LAYOUT_CENTER
+        self._radius = max(
+            [MIN_LAYOUT_RADIUS] + [math.hypot(x - cx, y - cy) for x, y in self.positions.values()]
+        )
+        self._appended = 0
+
+        self.edge_layer.rebuild(self._edge_list())
+        if self.positions:
+            rect = QRectF(QPointF(x0, y0), QPointF(x1, y1))
+            self.node_layer.reset_bounds(rect.adjusted(-NODE_RADIUS * 3, -NODE_RADIUS - 2, NODE_RADIUS * 3, NODE_RADIUS + 2))
+        else:
+            self.node_layer.reset_bounds(QRectF())
+        self._update_scene_rect()
+
+    def apply_layout(self, by_name: dict):
+        """Move users to username -> (x, y) positions; others stay put."""
+        names = self.names
+        self.relayout({
+            uid: by_name.get(names[uid], pos) for uid, pos in self.positions.items()
+        })
+
+    def _extent(self):
+        if not self.positions:
+            return 0.0, 0.0, 1.0, 1.0
+        xs = [p[0] for p in self.positions.values()]
+        ys = [p[1] for p in self.positions.values()]
+        return min(xs), min(ys), max(xs), max(ys)
+
+    def _edge_list(self):
+        """Every friendship between placed users once, as (uid, vid)."""
+        get_neighbors = self.graph.get_neighbors_unsorted
+        return [
+            (uid, vid)
+            for uid in self.positions
+            for vid in get_neighbors(uid)
+            if uid < vid and vid in self.positions
+        ]
+
+    def _update_scene_rect(self):
+        pad = NODE_RADIUS * 4
+        rect = self.node_layer.boundingRect().united(self.edge_layer.boundingRect())
+        self.scene.setSceneRect(rect.adjusted(-pad, -pad, pad, pad))
+
+    # ---------------------------------------------------------
+    # Background layout
+    # ---------------------------------------------------------
+    def start_layout(self, layout=None, initial: dict = None):
+        """
+        Run `layout` (default: force-directed) in a background thread.
+
+        Positions stream into the scene while it runs (small graphs only,
+        see STREAM_LAYOUT_MAX_USERS); the final ones are applied once and
+        cached next to the graph file. Any layout already running stops.
+        """
+        self.stop_layout()
+        layout = layout or default_layout()
+        names, edges = layout_input(self.graph)
+        digest = fingerprint(names, edges)
+
+        stream = len(names) <= STREAM_LAYOUT_MAX_USERS
+        thread = LayoutThread(layout, names, edges, initial, stream=stream)
+        if stream:
+            thread.progress.connect(self.apply_layout)
+        thread.done.connect(lambda positions: self._layout_done(layout, digest, positions))
+        thread.finished.connect(lambda: self._layout_finished(thread))
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(thread.stop)
+        self._layout_thread = thread
+        thread.start()
+
+    def stop_layout(self):
+        if self._layout_thread is not None:
+            self._layout_thread.stop()
+            self._layout_thread = None
+
+    @property
+    def layout_running(self) -> bool:
+        return self._layout_thread is not None
+
+    def _restore_layout(self):
+        """Use the cached layout if it matches the graph, else compute one."""
+        graph = self.graph
+        layout = default_layout()
+        cached = load_cached_layout(cache_path(graph.path)) if graph.path else None
+        if cached and (cached.get("layout"), cached.get("params")) != (layout.name, layout.params()):
+            cached = None
+
+        if cached and cached.get("fingerprint") == fingerprint(*layout_input(graph)):
+            self.apply_layout(cached["positions"])
+            return
+
+        n = graph.user_count()
+        if n > 1 and (have_numpy() or n <= AUTO_LAYOUT_MAX_USERS):
+            # A cache of an older version of the graph is a good starting point
+            self.start_layout(layout, initial=cached["positions"] if cached else None)
+
+    def _layout_done(self, layout, digest, positions):
+        self.apply_layout(positions)
+        graph = self.graph
+        if graph is not None and graph.path:
+            try:
+                save_cached_layout(cache_path(graph.path), layout, digest, positions)
+            except OSError:
+                pass   # the cache is only an optimisation
+
+    def _layout_finished(self, thread):
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.aboutToQuit.disconnect(thread.stop)
+        if self._layout_thread is thread:
+            self._layout_thread = None
+
+    # ---------------------------------------------------------
+    # Incremental updates (graph events)
+    # ---------------------------------------------------------
+    def _on_graph_event(self, event, *args):
+        if event == "add_user":
+            uid = args[0]
+            self._place(uid, self.graph.get_user_name(uid), *self._free_position())
+        elif event == "add_friendship":
+            self.edge_layer.add_edge(*args)
+        elif event == "remove_friendship":
+            self.edge_layer.remove_edges([args])
+        elif event == "delete_user":
+            uid, neighbors = args
+            self.edge_layer.remove_edges([(uid, n) for n in neighbors])
+            self._unplace(uid)
+        elif event == "reset":
+            keep = {self.names[uid]: pos for uid, pos in self.positions.items()}
+            self.generation += 1
+            self.rebuild(keep)
+            return
+        self._update_scene_rect()
+
+    def _place(self, uid, name, x, y):
+        self.positions[uid] = (x, y)
+        self.names[uid] = name
+        self.index.insert(uid, x, y)
+        rect = node_rect(x, y)
+        self.node_layer.cover(rect)
+        self.node_layer.update(rect)
+
+    def _unplace(self, uid):
+        x, y = self.positions.pop(uid)
+        del self.names[uid]
+        self.index.remove(uid, x, y)
+        self.node_layer.update(node_rect(x, y))
+
+    def _free_position(self):
+        """
+        Next spot on a sunflower spiral just outside the current layout.
+
+        Each appended user gets an equal-area slot, so they never land on
+        one another and nobody already placed has to move.
+        """
+        k = self._appended
+        self._appended += 1
+        inner = self._radius + NODE_SPACING
+        r = math.sqrt(inner * inner + k * NODE_SPACING * NODE_SPACING / math.pi)
+        angle = k * GOLDEN_ANGLE
+        cx, cy = LAYOUT_CENTER
+        return cx + r * math.cos(angle), cy + r * math.sin(angle)
@@ -0,0 +1,164 @@
+# gui/task_executor.py
+
+import threading
+import weakref
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task (by Task.check / Task.report) once it is cancelled."""
+
+
+class _TaskSignals(QObject):
+    # Created on the GUI thread, so emits from pool threads are queued
+    # back to it and callbacks always run on the GUI thread.
+    progress = pyqtSignal(object)
+    result = pyqtSignal(object)
+    error = pyqtSignal(object)
+    finished = pyqtSignal()
+
+
+class Task(QRunnable):
+    """
+    One call of fn(task) on the thread pool.
+
+    Python threads cannot be killed, so cancellation is cooperative: the
+    task's results are dropped once cancelled, and long-running code can
+    stop early by calling task.check() (or task.report(), which checks
+    first) from time to time; both raise TaskCancelled.
+    """
+
+    def __init__(self, fn, key=None):
+        super().__init__()
+        self.setAutoDelete(False)   # the executor keeps the reference
+        self.fn = fn
+        self.key = key
+        self.signals = _TaskSignals()
+        self._cancelled = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+
+    def report(self, value):
+        """Send a progress value to the GUI thread (raises if cancelled)."""
+        self.check()
+        self.signals.progress.emit(value)
+
+    def run(self):
+        try:
+            self.check()
+            value = self.fn(self)
+        except TaskCancelled:
+            pass
+        except Exception as exc:   # surfaced to on_error on the GUI thread
+            self.signals.error.emit(exc)
+        else:
+            self.signals.result.emit(value)
+        finally:
+            self.signals.finished.emit()
+
+
+class TaskExecutor(QObject):
+    """
+    Runs social_graph calls on a QThreadPool so the UI never blocks.
+
+    submit(fn, key=...) calls fn(task) on a pool thread and delivers
+    on_result / on_error / on_progress on the GUI thread. Tasks sharing a
+    key are coalesced, latest wins: submitting again cancels the previous
+    task with that key (dropping it outright if it has not started), so
+    hammering a button runs and shows only the last request.
+    """
+
+    def __init__(self, pool: QThreadPool = None, parent=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._current = {}   # key -> latest Task
+        self._running = set()   # Tasks started and not yet finished
+
+    def submit(self, fn, key=None, on_result=None, on_error=None, on_progress=None) -> Task:
+        if key is not None:
+            self.cancel(key)
+
+        task = Task(fn, key)
+        if on_progress is not None:
+            task.signals.progress.connect(lambda value: self._deliver(task, on_progress, value))
+        if on_result is not None:
+            task.signals.result.connect(lambda value: self._deliver(task, on_result, value))
+        if on_error is not None:
+            task.signals.error.connect(lambda exc: self._deliver(task, on_error, exc))
+        task.signals.finished.connect(lambda: self._finished(task))
+
+        if key is not None:
+            self._current[key] = task
+        self._running.add(task)
+        self._pool.start(task)
+        return task
+
+    def cancel(self, key) -> None:
+        task = self._current.pop(key, None)
+        if task is not None:
+            self._cancel(task)
+
+    def cancel_all(self) -> None:
+        for task in list(self._running):
+            self._cancel(task)
+        self._current.clear()
+
+    def is_busy(self, key) -> bool:
+        return key in self._current
+
+    def _cancel(self, task: Task) -> None:
+        task.cancel()
+        if self._pool.tryTake(task):   # still queued: it will never run
+            self._running.discard(task)
+
+    def _deliver(self, task: Task, callback, value) -> None:
+        # Results of cancelled or superseded tasks are dropped
+        if not task.cancelled:
+            callback(value)
+
+    def _finished(self, task: Task) -> None:
+        self._running.discard(task)
+        if task.key is not None and self._current.get(task.key) is task:
+            del self._current[task.key]
+
+
+_shared = None
+
+
+def shared_executor() -> TaskExecutor:
+    """Process-wide executor used by the algorithm windows."""
+    global _shared
+    if _shared is None:
+        _shared = TaskExecutor()
+    return _shared
+
+
+_snapshots = weakref.WeakKeyDictionary()   # Graph -> CSRGraph, None once edited
+
+
+def frozen_graph(graph):
+    """
+    Read-only CSRGraph snapshot of `graph` for tasks to walk.
+
+    Graphs are only edited on the GUI thread, so call this there and
+    hand the snapshot to the task instead of the live graph: a pool
+    thread then never sees a graph (or its component index) mid-edit.
+    The snapshot is reused until the graph's next mutation.
+    """
+    if graph not in _snapshots:
+        ref = weakref.ref(graph)
+        graph.subscribe(lambda *event: _snapshots.__setitem__(ref(), None))
+        _snapshots[graph] = None
+    if _snapshots[graph] is None:
+        _snapshots[graph] = graph.to_csr()
+    return _snapshots[graph]
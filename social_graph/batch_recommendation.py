@@ -0,0 +1,272 @@
+# social_graph/batch_recommendation.py
+
+"""
+"People you may know" for every user (or a subset) in one batch.
+
+Users are processed in shards. Each shard is scored by one of two
+kernels that give identical results to recommend_friends():
+
+  python   walks the frozen CSR arrays directly, no per-user Graph calls
+  sparse   C = A[shard] · A with SciPy, then masks self and existing
+           friends; needs NumPy + SciPy, does not support max_fanout
+
+Shards can be spread over a process pool (workers > 1); the CSR arrays
+are shipped to each worker once, through the pool initializer. Results
+come back in shard order and are handed to a sink as they arrive, so
+memory stays bounded by the shards in flight.
+"""
+
+import heapq
+import json
+from array import array
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from .csr import CSRGraph
+from .graph import Graph
+
+Recommendations = List[Tuple[str, int]]
+Sink = Callable[[str, Recommendations], None]
+
+DEFAULT_SHARD_SIZE = 1024
+METHODS = ("auto", "python", "sparse")
+
+
+# =====================================================================
+# OUTPUT SINKS
+# =====================================================================
+class JsonLinesSink:
+    """
+    Sink writing one JSON object per user:
+
+        {"user": "Ann", "recommendations": [["Bob", 3], ["Cy", 1]]}
+
+    Use as a context manager, or call close() when done.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._file = open(path, "w", encoding="utf-8")
+        self.count = 0
+
+    def __call__(self, user: str, recommendations: Recommendations) -> None:
+        record = {"user": user, "recommendations": [list(rec) for rec in recommendations]}
+        self._file.write(json.dumps(record) + "\n")
+        self.count += 1
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "JsonLinesSink":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# =====================================================================
+# PUBLIC API
+# =====================================================================
+def iter_recommendations(
+    graph: Union[Graph, CSRGraph],
+    users: Optional[Iterable[str]] = None,
+    max_results: int = 5,
+    max_fanout: Optional[int] = None,
+    method: str = "auto",
+    workers: int = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Iterator[Tuple[str, Recommendations]]:
+    """
+    Yield (user, [(recommended_user, mutual_count), ...]) for each user.
+
+    `users` defaults to every user in ID order; unknown names are
+    skipped. Each list matches recommend_friends(graph, user,
+    max_results, max_fanout).
+    """
+    method = _resolve_method(method, max_fanout)
+    csr = graph.to_csr() if isinstance(graph, Graph) else graph
+    get_name = csr.get_user_name
+
+    if users is None:
+        users = csr.users_in_order()
+    ids = [csr.get_user_id(name) for name in users if csr.has_user(name)]
+    shards = [ids[i:i + shard_size] for i in range(0, len(ids), shard_size)]
+
+    state = (array("q", csr.indptr), array("i", csr.indices), _name_ranks(csr), method)
+    for shard_result in _run_shards(state, shards, max_results, max_fanout, workers):
+        for uid, top in shard_result:
+            yield get_name(uid), [(get_name(cid), count) for cid, count in top]
+
+
+def recommend_all(
+    graph: Union[Graph, CSRGraph],
+    sink: Optional[Sink] = None,
+    users: Optional[Iterable[str]] = None,
+    max_results: int = 5,
+    max_fanout: Optional[int] = None,
+    method: str = "auto",
+    workers: int = 1,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+) -> Union[int, Dict[str, Recommendations]]:
+    """
+    Batch version of recommend_friends for all users (or `users`).
+
+    With a sink (e.g. JsonLinesSink) every result is streamed to it and
+    the number of users processed is returned; without one the results
+    are collected into a {user: recommendations} dict.
+    """
+    results = iter_recommendations(graph, users, max_results, max_fanout, method, workers, shard_size)
+    if sink is None:
+        return dict(results)
+
+    count = 0
+    for user, recommendations in results:
+        sink(user, recommendations)
+        count += 1
+    return count
+
+
+# =====================================================================
+# SHARD SCHEDULING
+# =====================================================================
+def _resolve_method(method: str, max_fanout: Optional[int]) -> str:
+    if method not in METHODS:
+        raise ValueError(f"Unknown method {method!r} (expected one of {METHODS})")
+    if method == "sparse" and max_fanout is not None:
+        raise ValueError("The sparse method does not support max_fanout.")
+    if method == "sparse" and not _have_scipy():
+        raise ImportError("The sparse method requires NumPy and SciPy (pip install scipy).")
+    if method == "auto":
+        return "sparse" if max_fanout is None and _have_scipy() else "python"
+    return method
+
+
+def _have_scipy() -> bool:
+    try:
+        import numpy  # noqa: F401
+        import scipy.sparse  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _name_ranks(csr: CSRGraph) -> array:
+    """rank[uid] = position of uid in name order (tie-breaker); -1 = tombstone."""
+    ranks = array("i", [-1]) * len(csr._id_to_user)
+    for rank, name in enumerate(sorted(csr.get_all_users())):
+        ranks[csr.get_user_id(name)] = rank
+    return ranks
+
+
+def _run_shards(state, shards, k, max_fanout, workers) -> Iterator[list]:
+    if workers <= 1:
+        _init_worker(*state)
+        try:
+            for shard in shards:
+                yield _score_shard(shard, k, max_fanout)
+        finally:
+            _init_worker(None, None, None, None)
+        return
+
+    # Keep a bounded window of shards in flight so results stream out in
+    # order without the whole batch piling up in memory.
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=state) as pool:
+        pending = deque()
+        for shard in shards:
+            pending.append(pool.submit(_score_shard, shard, k, max_fanout))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+# =====================================================================
+# WORKER SIDE
+# =====================================================================
+# Set once per process by _init_worker
+_indptr: Sequence[int] = ()
+_indices: Sequence[int] = ()
+_ranks: Sequence[int] = ()
+_method = "python"
+_matrix = None   # SciPy adjacency, built lazily for the sparse method
+
+
+def _init_worker(indptr, indices, ranks, method) -> None:
+    global _indptr, _indices, _ranks, _method, _matrix
+    _indptr, _indices, _ranks, _method = indptr, indices, ranks, method
+    _matrix = None
+
+
+def _score_shard(uids: List[int], k: int, max_fanout: Optional[int]) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    if _method == "sparse":
+        return _score_shard_sparse(uids, k)
+    return [(uid, _top_k(_mutual_counts(uid, max_fanout), k)) for uid in uids]
+
+
+def _mutual_counts(uid: int, max_fanout: Optional[int]) -> Dict[int, int]:
+    indptr, indices = _indptr, _indices
+    row = indices[indptr[uid]:indptr[uid + 1]]
+
+    if max_fanout is None:
+        slices = (indices[indptr[f]:indptr[f + 1]] for f in row)
+    else:   # rows are name-ordered, so this keeps the first names
+        slices = (indices[indptr[f]:min(indptr[f + 1], indptr[f] + max_fanout)] for f in row)
+
+    # Count every friend-of-friend in one C-level pass, then drop the
+    # user and their friends instead of testing each occurrence.
+    counts = Counter(chain.from_iterable(slices))
+    counts.pop(uid, None)
+    for friend in row:
+        counts.pop(friend, None)
+    return counts
+
+
+def _top_k(counts: Dict[int, int], k: int) -> List[Tuple[int, int]]:
+    """Best k (candidate, count) by count desc, then name (same as recommend_friends)."""
+    if k <= 0:
+        return []
+    if len(counts) > k:
+        cutoff = heapq.nlargest(k, counts.values())[-1]
+        counts = {cid: count for cid, count in counts.items() if count >= cutoff}
+
+    ranks = _ranks
+    return sorted(counts.items(), key=lambda item: (-item[1], ranks[item[0]]))[:k]
+
+
+def _score_shard_sparse(uids: List[int], k: int) -> List[Tuple[int, List[Tuple[int, int]]]]:
+    global _matrix
+    import numpy as np
+    import scipy.sparse as sp
+
+    n = len(_indptr) - 1
+    if _matrix is None:
+        indptr = np.frombuffer(_indptr, dtype=np.int64)
+        indices = np.frombuffer(_indices, dtype=np.int32)
+        _matrix = sp.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, indptr), shape=(n, n)
+        )
+
+    rows = _matrix[uids]
+    counts = (rows @ _matrix).tocsr()
+
+    # Mask out each user itself and the users they are already friends with
+    own = sp.csr_matrix(
+        (np.ones(len(uids), dtype=np.int32), (np.arange(len(uids)), uids)), shape=(len(uids), n)
+    )
+    counts = counts - counts.multiply(rows + own)
+    counts.eliminate_zeros()
+
+    ranks = np.frombuffer(_ranks, dtype=np.int32)
+    results = []
+    for i, uid in enumerate(uids):
+        start, end = counts.indptr[i], counts.indptr[i + 1]
+        if k <= 0 or start == end:
+            results.append((uid, []))
+            continue
+        cols = counts.indices[start:end]
+        vals = counts.data[start:end]
+        order = np.lexsort((ranks[cols], -vals))[:k]
+        results.append((uid, [(int(cols[j]), int(vals[j])) for j in order]))
+    return results
@@ -1,13 +1,20 @@
-from collections import deque
-from typing import Dict, List, Optional, Any
+import threading
+from array import array
+from typing import Callable, Dict, Iterable, List, Optional, Any
 from time import perf_counter
-from .graph import Graph
+from .csr import GraphLike
 
 
 # =====================================================================
-# Result Container (unchanged)
+# Result Container
 # =====================================================================
 class BFSResult:
+    """
+    Outcome of a BFS. visited_order, distances and exploration_tree may
+    be given directly or as loaders (see BFSResult.lazy), in which case
+    they are converted from IDs to names the first time they are read.
+    """
+
     def __init__(
         self,
         path: List[str],
@@ -18,11 +25,56 @@ class BFSResult:
         reachable: bool = True,
     ):
         self.path = path
-        self.visited_order = visited_order
-        self.distances = distances
-        self.exploration_tree = exploration_tree
+        self._visited_order = visited_order
+        self._distances = distances
+        self._exploration_tree = exploration_tree
         self.time_ms = time_ms
         self.reachable = reachable  # False = no possible path
+        self._loaders: Dict[str, Callable[[], Any]] = {}
+
+    @classmethod
+    def lazy(
+        cls,
+        path: List[str],
+        loaders: Dict[str, Callable[[], Any]],
+        time_ms: float = 0.0,
+        reachable: bool = True,
+    ) -> "BFSResult":
+        """Result whose other fields are built by loaders[field]() on first access."""
+        result = cls(path, None, None, None, time_ms, reachable)
+        result._loaders = dict(loaders)
+        return result
+
+    def _load(self, field: str):
+        value = getattr(self, "_" + field)
+        if value is None and field in self._loaders:
+            value = self._loaders.pop(field)()
+            setattr(self, "_" + field, value)
+        return value
+
+    @property
+    def visited_order(self) -> List[str]:
+        return self._load("visited_order")
+
+    @visited_order.setter
+    def visited_order(self, value: List[str]) -> None:
+        self._visited_order = value
+
+    @property
+    def distances(self) -> Dict[str, int]:
+        return self._load("distances")
+
+    @distances.setter
+    def distances(self, value: Dict[str, int]) -> None:
+        self._distances = value
+
+    @property
+    def exploration_tree(self) -> Dict[str, Optional[str]]:
+        return self._load("exploration_tree")
+
+    @exploration_tree.setter
+    def exploration_tree(self, value: Dict[str, Optional[str]]) -> None:
+        self._exploration_tree = value
 
     def to_dict(self) -> Dict[str, Any]:
         #Convert result to JSON-friendly dict.
@@ -36,28 +88,200 @@ class BFSResult:
         }
 
 
+# =====================================================================
+# ID-BASED BFS WITH REUSABLE BUFFERS
+# =====================================================================
+class BFSBuffers:
+    """
+    Distance / parent arrays shared by successive BFS runs.
+
+    Instead of clearing them between runs, every run gets a new epoch
+    and an entry only counts as visited when its stamp equals the
+    current epoch, so starting a run costs O(1) (plus growth when the
+    graph got bigger). A buffer serves one run at a time: starting a
+    new run invalidates the previous BFSRun.
+    """
+
+    def __init__(self, capacity: int = 0) -> None:
+        self.dist = array("i")
+        self.parent = array("i")
+        self.stamp = array("I")
+        self.epoch = 0
+        self._grow(capacity)
+
+    def _grow(self, capacity: int) -> None:
+        extra = capacity - len(self.stamp)
+        if extra > 0:
+            self.dist.extend(array("i", [0]) * extra)
+            self.parent.extend(array("i", [-1]) * extra)
+            self.stamp.extend(array("I", [0]) * extra)
+
+    def begin(self, capacity: int) -> int:
+        """Start a new run over IDs < capacity; return its epoch."""
+        self._grow(capacity)
+        self.epoch += 1
+        if self.epoch > 0xFFFFFFFF:    # stamp overflow: clear once, start over
+            self.stamp = array("I", [0]) * len(self.stamp)
+            self.epoch = 1
+        return self.epoch
+
+
+class BFSRun:
+    """
+    Result of multi_source_bfs, read straight out of the buffers.
+
+    order lists every reached ID in discovery order (sources first);
+    the first `expanded` of them had their neighbors scanned.
+    """
+
+    def __init__(self, buffers: BFSBuffers, order: List[int], expanded: int) -> None:
+        self.buffers = buffers
+        self.epoch = buffers.epoch
+        self.order = order
+        self.expanded = expanded
+
+    def _check(self) -> None:
+        if self.buffers.epoch != self.epoch:
+            raise RuntimeError("BFS buffers were reused by a later run.")
+
+    def reached(self, uid: int) -> bool:
+        self._check()
+        return uid < len(self.buffers.stamp) and self.buffers.stamp[uid] == self.epoch
+
+    def distance(self, uid: int) -> Optional[int]:
+        return self.buffers.dist[uid] if self.reached(uid) else None
+
+    def parent(self, uid: int) -> Optional[int]:
+        if not self.reached(uid):
+            return None
+        p = self.buffers.parent[uid]
+        return None if p < 0 else p
+
+    def path_to(self, uid: int) -> List[int]:
+        """IDs from the nearest source to uid ([] if not reached)."""
+        if not self.reached(uid):
+            return []
+        parent = self.buffers.parent
+        path = [uid]
+        while parent[path[-1]] >= 0:
+            path.append(parent[path[-1]])
+        path.reverse()
+        return path
+
+
+_thread_buffers = threading.local()
+
+
+def _default_buffers() -> BFSBuffers:
+    """One BFSBuffers per thread, reused by every call on that thread."""
+    buffers = getattr(_thread_buffers, "buffers", None)
+    if buffers is None:
+        buffers = _thread_buffers.buffers = BFSBuffers()
+    return buffers
+
+
+PROGRESS_STEPS = 4096   # expansions between progress() calls
+
+
+def multi_source_bfs(
+    graph: GraphLike,
+    sources: Iterable[int],
+    max_depth: Optional[int] = None,
+    target: Optional[int] = None,
+    buffers: Optional[BFSBuffers] = None,
+    deterministic: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> BFSRun:
+    """
+    BFS by user ID from every source at once (each starts at distance 0).
+
+    Nodes at max_depth are reached but not expanded. With a target the
+    search stops as soon as the target is taken off the queue. Pass the
+    same `buffers` to successive calls to avoid reallocating; by default
+    a per-thread buffer is reused. progress (if given) is called every
+    PROGRESS_STEPS expansions with the number of users reached so far;
+    an exception raised from it aborts the search.
+    """
+    if buffers is None:
+        buffers = _default_buffers()
+    epoch = buffers.begin(graph.id_capacity())
+    dist, parent, stamp = buffers.dist, buffers.parent, buffers.stamp
+
+    if deterministic:
+        get_neighbors = graph.get_sorted_neighbors
+    else:
+        get_neighbors = graph.get_neighbors_unsorted
+
+    order: List[int] = []     # doubles as the queue: order[head:] is pending
+    for s in sources:
+        if stamp[s] != epoch:
+            stamp[s] = epoch
+            dist[s] = 0
+            parent[s] = -1
+            order.append(s)
+
+    head = 0
+    while head < len(order):
+        u = order[head]
+        head += 1
+        if u == target:
+            break
+        if progress is not None and head % PROGRESS_STEPS == 0:
+            progress(len(order))
+
+        d = dist[u] + 1
+        if max_depth is not None and d > max_depth:
+            continue
+
+        for v in get_neighbors(u):
+            if stamp[v] != epoch:
+                stamp[v] = epoch
+                dist[v] = d
+                parent[v] = u
+                order.append(v)
+
+    return BFSRun(buffers, order, head)
+
+
 # =====================================================================
 # MAIN BFS FUNCTION
 # =====================================================================
 def bfs_shortest_path(
-    graph: Graph,
+    graph: GraphLike,
     start_user: str,
     target_user: str,
     return_full_result: bool = True,
+    bidirectional: bool = False,
+    deterministic: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
 ) -> BFSResult | List[str]:
     """
     Compute the BFS-based shortest path between two users.
 
     Parameters:
-        graph           : Graph object
+        graph           : Graph or CSRGraph
         start_user      : starting username
         target_user     : destination username
         return_full_result : True → BFSResult, False → path only
+        bidirectional   : True → meet-in-the-middle search
+                          (see bidirectional_bfs_shortest_path)
+        deterministic   : True → visit neighbors in name order,
+                          False → skip ordering (faster, any valid path)
+        progress        : called now and then with the number of users
+                          reached; raise from it to cancel the search
 
     Returns:
         BFSResult or List[str] (path only)
+
+    Runs multi_source_bfs on IDs. A path-only call never builds the
+    name dicts; a full result converts each of them on first access.
     """
 
+    if bidirectional:
+        return bidirectional_bfs_shortest_path(
+            graph, start_user, target_user, return_full_result, deterministic, progress
+        )
+
     start_time = perf_counter()
 
     # --------------------------------------------------------
@@ -84,85 +308,195 @@ def bfs_shortest_path(
         )
 
     # --------------------------------------------------------
-    # Convert to internal IDs
+    # BFS over internal IDs
     # --------------------------------------------------------
     start_id = graph.get_user_id(start_user)
     target_id = graph.get_user_id(target_user)
+    get_name = graph.get_user_name
 
-    queue = deque([start_id])
-    visited = {start_id}
-    parent: Dict[int, Optional[int]] = {start_id: None}
-    distances: Dict[int, int] = {start_id: 0}
-    visited_order_ids: List[int] = []
+    run = multi_source_bfs(
+        graph, [start_id], target=target_id, deterministic=deterministic, progress=progress
+    )
+    path = [get_name(n) for n in run.path_to(target_id)]
+
+    if not return_full_result:
+        return path
+
+    # --------------------------------------------------------
+    # Build results (copy the IDs out of the shared buffers now,
+    # turn them into names only when a field is read)
+    # --------------------------------------------------------
+    order = run.order
+    expanded = run.expanded
+    dists = array("i", map(run.buffers.dist.__getitem__, order))
+    parents = array("i", map(run.buffers.parent.__getitem__, order))
+
+    elapsed = (perf_counter() - start_time) * 1000
+
+    return BFSResult.lazy(
+        path=path,
+        loaders={
+            "visited_order": lambda: [get_name(n) for n in order[:expanded]],
+            "distances": lambda: dict(zip(map(get_name, order), dists)),
+            "exploration_tree": lambda: {
+                get_name(n): (None if p < 0 else get_name(p))
+                for n, p in zip(order, parents)
+            },
+        },
+        time_ms=elapsed,
+        reachable=(len(path) > 0),
+    )
+
+
+# =====================================================================
+# BIDIRECTIONAL BFS
+# =====================================================================
+def bidirectional_bfs_shortest_path(
+    graph: GraphLike,
+    start_user: str,
+    target_user: str,
+    return_full_result: bool = True,
+    deterministic: bool = True,
+    progress: Optional[Callable[[int], None]] = None,
+) -> BFSResult | List[str]:
+    """
+    Shortest path by growing one BFS from each end until they meet.
+
+    The smaller frontier is expanded one full level at a time, and every
+    meeting edge found in that level is considered, so the path length
+    is always optimal. With deterministic=True neighbors are visited in
+    name order and ties between equally short paths go to the
+    lexicographically smallest name sequence, so repeated calls return
+    the same path.
+
+    The result has the usual BFSResult shape: visited_order lists nodes
+    expanded by either side, while distances / exploration_tree hold the
+    start-side search plus the nodes on the returned path. progress (if
+    given) is called after each level with the number of users expanded.
+    """
+
+    start_time = perf_counter()
+
+    if graph is None:
+        raise ValueError("Graph cannot be None.")
+
+    if not graph.has_user(start_user) or not graph.has_user(target_user):
+        return BFSResult([], [], {}, {}, reachable=False) if return_full_result else []
+
+    if start_user == target_user:
+        elapsed = (perf_counter() - start_time) * 1000
+        result = BFSResult(
+            path=[start_user],
+            visited_order=[start_user],
+            distances={start_user: 0},
+            exploration_tree={start_user: None},
+            time_ms=elapsed,
+        )
+        return result if return_full_result else result.path
+
+    start_id = graph.get_user_id(start_user)
+    target_id = graph.get_user_id(target_user)
 
-    # Faster local bindings
-    get_neighbors = graph.get_neighbors
     get_name = graph.get_user_name
 
+    fwd_parent: Dict[int, Optional[int]] = {start_id: None}
+    fwd_dist: Dict[int, int] = {start_id: 0}
+    bwd_parent: Dict[int, Optional[int]] = {target_id: None}
+    bwd_dist: Dict[int, int] = {target_id: 0}
+
+    fwd_level = [start_id]
+    bwd_level = [target_id]
+    visited_order_ids: List[int] = []
+    best_path: List[int] = []
+
     # --------------------------------------------------------
-    # BFS Loop
+    # Alternate levels, always growing the cheaper side
     # --------------------------------------------------------
-    while queue:
-        current = queue.popleft()
-        visited_order_ids.append(current)
+    while fwd_level and bwd_level and not best_path:
+        forward = len(fwd_level) <= len(bwd_level)
 
-        if current == target_id:
-            break
+        if forward:
+            fwd_level, meetings = _expand_level(
+                graph, fwd_level, fwd_parent, fwd_dist, bwd_dist,
+                visited_order_ids, deterministic,
+            )
+        else:
+            bwd_level, meetings = _expand_level(
+                graph, bwd_level, bwd_parent, bwd_dist, fwd_dist,
+                visited_order_ids, deterministic,
+            )
+
+        if progress is not None:
+            progress(len(visited_order_ids))
 
-        # Deterministic sorted neighbors
-        neighbors = sorted(get_neighbors(current), key=get_name)
+        for u, v in meetings:
+            # u was expanded by the active side, v is known to the other
+            head, tail = (u, v) if forward else (v, u)
+            candidate = _chain(fwd_parent, head)[::-1] + _chain(bwd_parent, tail)
 
-        for neighbor in neighbors:
-            if neighbor not in visited:
-                visited.add(neighbor)
-                parent[neighbor] = current
-                distances[neighbor] = distances[current] + 1
-                queue.append(neighbor)
+            if not best_path or len(candidate) < len(best_path):
+                best_path = candidate
+            elif deterministic and len(candidate) == len(best_path):
+                if [get_name(n) for n in candidate] < [get_name(n) for n in best_path]:
+                    best_path = candidate
+
+    path = [get_name(n) for n in best_path]
+
+    if not return_full_result:
+        return path
 
     # --------------------------------------------------------
-    # Build results
+    # Build results (start-side tree + the chosen path)
     # --------------------------------------------------------
-    path = _reconstruct_path(parent, target_id, get_name)
-    visited_order = [get_name(n) for n in visited_order_ids]
-    dist_named = {get_name(n): d for n, d in distances.items()}
-    tree_named = {
-        get_name(n): (None if parent[n] is None else get_name(parent[n]))
-        for n in parent
-    }
+    for i, n in enumerate(best_path):
+        fwd_dist[n] = i
+        fwd_parent[n] = best_path[i - 1] if i > 0 else None
 
     elapsed = (perf_counter() - start_time) * 1000
 
-    result = BFSResult(
+    return BFSResult(
         path=path,
-        visited_order=visited_order,
-        distances=dist_named,
-        exploration_tree=tree_named,
+        visited_order=[get_name(n) for n in visited_order_ids],
+        distances={get_name(n): d for n, d in fwd_dist.items()},
+        exploration_tree={
+            get_name(n): (None if p is None else get_name(p))
+            for n, p in fwd_parent.items()
+        },
         time_ms=elapsed,
         reachable=(len(path) > 0),
     )
 
-    return result if return_full_result else path
 
+def _expand_level(graph, level, parent, dist, other_dist, visited_order_ids, deterministic):
+    """Expand one BFS level; return (next level, meeting edges)."""
+    if deterministic:
+        get_neighbors = graph.get_sorted_neighbors
+    else:
+        get_neighbors = graph.get_neighbors_unsorted
 
-# =====================================================================
-# PATH RECONSTRUCTION HELPER
-# =====================================================================
-def _reconstruct_path(
-    parent: Dict[int, Optional[int]],
-    target_id: int,
-    get_name,
-) -> List[str]:
-    """Reconstruct shortest path via parent pointers."""
+    next_level: List[int] = []
+    meetings = []
 
-    if target_id not in parent:
-        return []
+    for u in level:
+        visited_order_ids.append(u)
+        d = dist[u] + 1
 
-    result = []
-    cur = target_id
+        for v in get_neighbors(u):
+            if v in other_dist:
+                meetings.append((u, v))
+            if v not in dist:
+                dist[v] = d
+                parent[v] = u
+                next_level.append(v)
 
+    return next_level, meetings
+
+
+def _chain(parent: Dict[int, Optional[int]], node: int) -> List[int]:
+    """IDs from `node` back to the root of its search tree."""
+    chain = []
+    cur: Optional[int] = node
     while cur is not None:
-        result.append(cur)
+        chain.append(cur)
         cur = parent[cur]
-
-    result.reverse()
-    return [get_name(n) for n in result]
+    return chain
@@ -0,0 +1,176 @@
+# social_graph/components.py
+
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Set
+
+from .dsu import DSU
+
+if TYPE_CHECKING:
+    from .csr import GraphLike
+    from .graph import Graph
+
+PROGRESS_STEPS = 4096   # users handled between progress() calls
+
+
+class ComponentIndex:
+    """
+    Connected components of a Graph, kept current as the graph changes.
+
+    Additions are folded straight into a DSU, so component count, size
+    and membership queries cost O(α(n)). A DSU cannot split, so removing
+    a friendship or deleting a user only records the touched endpoints
+    as "seeds"; the next query re-labels just the component(s) reachable
+    from those seeds with a BFS and leaves the rest of the forest alone.
+    """
+
+    def __init__(self, graph: "Graph") -> None:
+        self.graph = graph
+        self.dsu = DSU(graph.id_capacity(), compact=True)
+        self._size: Dict[int, int] = {}     # root -> live member count
+        self._count = 0                     # live components
+        self._seeds: Set[int] = set()       # endpoints of pending splits
+
+        # Bulk build: one union_edges pass, then tally roots
+        edges = array("i")
+        for uid, neighbors in enumerate(graph._adj):
+            for vid in neighbors:
+                if uid < vid:
+                    edges.append(uid)
+                    edges.append(vid)
+        self.dsu.union_edges(edges)
+
+        for uid, name in enumerate(graph._id_to_user):
+            if name is not None:
+                root = self.dsu.find(uid)
+                self._size[root] = self._size.get(root, 0) + 1
+        self._count = len(self._size)
+
+    # =====================================================================
+    # MUTATION HOOKS (called by Graph)
+    # =====================================================================
+    def on_user_added(self, uid: int) -> None:
+        self.dsu.find(uid)   # grows the DSU to cover uid
+        self._size[uid] = 1
+        self._count += 1
+
+    def on_edge_added(self, uid: int, vid: int) -> None:
+        ru, rv = self.dsu.find(uid), self.dsu.find(vid)
+        if ru == rv:
+            return
+
+        merged = self._size.pop(ru) + self._size.pop(rv)
+        self.dsu.union(ru, rv)
+        self._size[self.dsu.find(ru)] = merged
+        self._count -= 1
+
+    def on_edge_removed(self, uid: int, vid: int) -> None:
+        self._seeds.add(uid)
+        self._seeds.add(vid)
+
+    def on_user_deleted(self, uid: int, former_neighbors) -> None:
+        root = self.dsu.find(uid)
+        self._size[root] -= 1
+        if self._size[root] == 0:
+            del self._size[root]
+            self._count -= 1
+
+        self._seeds.discard(uid)
+        self._seeds.update(former_neighbors)
+
+    # =====================================================================
+    # QUERIES
+    # =====================================================================
+    def count(self) -> int:
+        self._flush()
+        return self._count
+
+    def size_of(self, uid: int) -> int:
+        self._flush()
+        return self._size[self.dsu.find(uid)]
+
+    def same(self, uid: int, vid: int) -> bool:
+        self._flush()
+        return self.dsu.find(uid) == self.dsu.find(vid)
+
+    def groups(self) -> List[List[int]]:
+        self._flush()
+        groups: Dict[int, List[int]] = {}
+        for uid, name in enumerate(self.graph._id_to_user):
+            if name is not None:
+                groups.setdefault(self.dsu.find(uid), []).append(uid)
+        return list(groups.values())
+
+    # =====================================================================
+    # LAZY SPLIT HANDLING
+    # =====================================================================
+    def _flush(self) -> None:
+        """Re-label only the components that pending removals may have split."""
+        if not self._seeds:
+            return
+
+        graph = self.graph
+        parent, rank = self.dsu.parent, self.dsu.rank
+        seeds = [s for s in self._seeds if graph._id_to_user[s] is not None]
+        self._seeds.clear()
+
+        # Retire the stale sets; every live member is reachable from a seed
+        for root in {self.dsu.find(s) for s in seeds}:
+            if root in self._size:
+                del self._size[root]
+                self._count -= 1
+
+        seen: Set[int] = set()
+        for seed in seeds:
+            if seed in seen:
+                continue
+
+            piece = [seed]
+            seen.add(seed)
+            for u in piece:   # BFS; piece grows while we walk it
+                for v in graph._adj[u]:
+                    if v not in seen:
+                        seen.add(v)
+                        piece.append(v)
+
+            # Rebuild the piece as a flat star rooted at the seed
+            for u in piece:
+                parent[u] = seed
+                rank[u] = 0
+            rank[seed] = 1 if len(piece) > 1 else 0
+            self._size[seed] = len(piece)
+            self._count += 1
+
+
+def connected_components(
+    graph: "GraphLike",
+    progress: Optional[Callable[[int], None]] = None,
+) -> List[List[int]]:
+    """
+    Connected components of any graph as lists of user IDs, from a fresh
+    DSU (no index is kept or installed on the graph).
+
+    Meant for read-only snapshots such as a CSRGraph handed to a worker
+    thread; a live Graph should use Graph.communities() instead. progress
+    (if given) is called every PROGRESS_STEPS users with the number
+    handled so far; an exception raised from it aborts the call.
+    """
+    n = graph.id_capacity()
+    get_neighbors = graph.get_neighbors_unsorted
+
+    edges = array("i")
+    for uid in range(n):
+        if progress is not None and uid and uid % PROGRESS_STEPS == 0:
+            progress(uid)
+        for vid in get_neighbors(uid):
+            if uid < vid:
+                edges.append(uid)
+                edges.append(vid)
+
+    dsu = DSU(n, compact=True)
+    dsu.union_edges(edges)
+
+    groups: Dict[int, List[int]] = {}
+    for uid in range(n):
+        if graph.get_user_name(uid) is not None:
+            groups.setdefault(dsu.find(uid), []).append(uid)
+    return list(groups.values())
@@ -0,0 +1,177 @@
+# social_graph/csr.py
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Union
+
+from .graph import Graph
+
+
+# =====================================================================
+# Frozen CSR (compressed sparse row) graph
+# =====================================================================
+class CSRGraph:
+    """
+    Read-only, array-backed snapshot of a Graph.
+
+    The neighbors of user `uid` are stored in
+    indices[indptr[uid]:indptr[uid + 1]], already ordered by username,
+    so traversals get deterministic order without sorting. Only the
+    read side of the Graph API is provided; BFS, DFS and recommendations
+    accept a CSRGraph wherever they accept a Graph.
+
+    A graph opened over a memory-mapped snapshot (see
+    snapshot.load_snapshot) holds the mapping until close(), or the end
+    of a `with` block; it cannot be read afterwards.
+    """
+
+    INDPTR_TYPECODE = "q"
+    INDICES_TYPECODE = "i"
+
+    def __init__(
+        self,
+        names: Sequence[Optional[str]],
+        indptr: Sequence[int],
+        indices: Sequence[int],
+        mapping=None,
+    ) -> None:
+        if len(indptr) != len(names) + 1:
+            raise ValueError("indptr must have exactly len(names) + 1 entries.")
+
+        self._id_to_user = names
+        self._user_to_id: Dict[str, int] = {
+            name: idx for idx, name in enumerate(names) if name
+        }
+        self.indptr = indptr
+        self.indices = indices
+        self._mapping = mapping   # mmap the arrays are views of, if any
+
+    def close(self) -> None:
+        """Release the memory-mapped file behind the arrays (no-op without one)."""
+        mapping, self._mapping = self._mapping, None
+        if mapping is None:
+            return
+
+        # Views into the map must be released before it can be closed
+        views = [self.indptr, self.indices]
+        views += getattr(self._id_to_user, "views", lambda: [])()
+        for view in views:
+            if isinstance(view, memoryview):
+                view.release()
+        mapping.close()
+
+    def __enter__(self) -> "CSRGraph":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # =====================================================================
+    # CONVERSION
+    # =====================================================================
+    @classmethod
+    def from_graph(cls, graph: Graph) -> "CSRGraph":
+        """Freeze a mutable Graph into compact CSR arrays."""
+        names = list(graph._id_to_user)
+
+        indptr = array(cls.INDPTR_TYPECODE, [0])
+        indices = array(cls.INDICES_TYPECODE)
+
+        # Graph already keeps each row in name order
+        for neighbors in graph._sorted_adj:
+            indices.extend(neighbors)
+            indptr.append(len(indices))
+
+        return cls(names, indptr, indices)
+
+    def to_graph(self) -> Graph:
+        """Thaw back into a mutable Graph with the same user IDs."""
+        g = Graph()
+        g._id_to_user = list(self._id_to_user)
+        g._user_to_id = dict(self._user_to_id)
+        g._sorted_adj = [list(self.get_neighbors(uid)) for uid in range(len(self._id_to_user))]
+        g._adj = [set(row) for row in g._sorted_adj]
+        g._tombstones = len(g._id_to_user) - len(g._user_to_id)
+        g._edge_count = self.edge_count()
+        g._live_ids = None
+        g._rebuild_degree_index()
+        return g
+
+    # =====================================================================
+    # USERS
+    # =====================================================================
+    def has_user(self, username: str) -> bool:
+        return username in self._user_to_id
+
+    def get_all_users(self) -> List[str]:
+        return list(self._user_to_id.keys())
+
+    def users_in_order(self) -> List[str]:
+        return [name for name in self._id_to_user if name]
+
+    def user_count(self) -> int:
+        return len(self._user_to_id)
+
+    def id_capacity(self) -> int:
+        """Upper bound (exclusive) on user IDs, tombstones included."""
+        return len(self._id_to_user)
+
+    def edge_count(self) -> int:
+        return len(self.indices) // 2
+
+    # =====================================================================
+    # FRIENDSHIPS
+    # =====================================================================
+    def get_friends(self, username: str) -> List[str]:
+        if not self.has_user(username):
+            return []
+
+        get_name = self._id_to_user.__getitem__
+        return [get_name(n) for n in self.get_neighbors(self._user_to_id[username])]
+
+    def are_friends(self, u: str, v: str) -> bool:
+        if not self.has_user(u) or not self.has_user(v):
+            return False
+
+        uid = self._user_to_id[u]
+        lo, hi = self.indptr[uid], self.indptr[uid + 1]
+
+        # Rows are name-ordered, so a binary search by name finds v.
+        pos = bisect_left(self.indices, v, lo, hi, key=self._id_to_user.__getitem__)
+        return pos < hi and self.indices[pos] == self._user_to_id[v]
+
+    def degree(self, username: str) -> int:
+        if not self.has_user(username):
+            return 0
+        uid = self._user_to_id[username]
+        return self.indptr[uid + 1] - self.indptr[uid]
+
+    # =====================================================================
+    # INTERNAL ACCESS HELPERS FOR BFS/DFS/Canvas
+    # =====================================================================
+    def get_user_id(self, username: str) -> int:
+        return self._user_to_id[username]
+
+    def get_user_name(self, uid: int) -> str:
+        return self._id_to_user[uid]
+
+    def get_neighbors(self, uid: int) -> Sequence[int]:
+        return self.indices[self.indptr[uid]:self.indptr[uid + 1]]
+
+    # Rows are stored name-ordered, so both views are the same slice
+    get_sorted_neighbors = get_neighbors
+    get_neighbors_unsorted = get_neighbors
+
+    def adjacency_list(self) -> Dict[str, List[str]]:
+        return {name: self.get_friends(name) for name in self._user_to_id}
+
+    def nbytes(self) -> int:
+        """Bytes held by the adjacency buffers (names excluded)."""
+        return (
+            len(self.indptr) * self.indptr.itemsize
+            + len(self.indices) * self.indices.itemsize
+        )
+
+
+# Anything the traversal functions can walk.
+GraphLike = Union[Graph, CSRGraph]
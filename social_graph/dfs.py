@@ -1,4 +1,4 @@
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, List, Optional, Any
 from time import perf_counter
 from .graph import Graph
 
@@ -27,7 +27,12 @@ class DFSResult:
 # =====================================================================
 # MAIN DFS TRAVERSAL (Tree + timestamps)
 # =====================================================================
-def dfs_traversal(graph: Graph, start_user: str, return_full: bool = True):
+def dfs_traversal(
+    graph: Graph,
+    start_user: str,
+    return_full: bool = True,
+    deterministic: bool = True,
+):
 
     start_time = perf_counter()
 
@@ -36,33 +41,48 @@ def dfs_traversal(graph: Graph, start_user: str, return_full: bool = True):
 
     start_id = graph.get_user_id(start_user)
 
-    get_neighbors = graph.get_neighbors
+    # Name-ordered neighbors come precomputed; skip ordering if not needed
+    if deterministic:
+        get_neighbors = graph.get_sorted_neighbors
+    else:
+        get_neighbors = graph.get_neighbors_unsorted
     get_name = graph.get_user_name
 
-    visited = set()
+    visited = {start_id}
     parent = {start_id: None}
-    depth = {}
-    order_ids = []
+    depth = {start_id: 0}
+    order_ids = [start_id]
 
-    tin, tout = {}, {}
-    timer = [1]
+    tin, tout = {start_id: 1}, {}
+    timer = 2
 
-    def dfs(u, d):
-        visited.add(u)
-        depth[u] = d
-        order_ids.append(u)
-        tin[u] = timer[0]
-        timer[0] += 1
+    # Explicit stack instead of recursion: no recursion limit on long
+    # chains and no call frame per node. node_stack[i] is resumed via
+    # iter_stack[i], which replays the same neighbor order as before.
+    node_stack = [start_id]
+    iter_stack = [iter(get_neighbors(start_id))]
 
-        for v in sorted(get_neighbors(u), key=get_name):
+    while node_stack:
+        u = node_stack[-1]
+
+        for v in iter_stack[-1]:
             if v not in visited:
+                visited.add(v)
                 parent[v] = u
-                dfs(v, d + 1)
-
-        tout[u] = timer[0]
-        timer[0] += 1
-
-    dfs(start_id, 0)
+                depth[v] = depth[u] + 1
+                order_ids.append(v)
+                tin[v] = timer
+                timer += 1
+
+                node_stack.append(v)
+                iter_stack.append(iter(get_neighbors(v)))
+                break
+        else:
+            # All neighbors done → finish u
+            tout[u] = timer
+            timer += 1
+            node_stack.pop()
+            iter_stack.pop()
 
     order_names = [get_name(n) for n in order_ids]
     parent_named = {get_name(k): (None if v is None else get_name(v)) for k, v in parent.items()}
@@ -78,6 +98,9 @@ def dfs_traversal(graph: Graph, start_user: str, return_full: bool = True):
 # =====================================================================
 # DFS PATH FINDER (USED BY DFS WINDOW)
 # =====================================================================
+PROGRESS_STEPS = 4096   # expansions between progress() calls
+
+
 class DFSPathResult:
     def __init__(self, path, visited_order, distances):
         self.path = path
@@ -85,52 +108,105 @@ class DFSPathResult:
         self.distances = distances
 
 
-def dfs_shortest_path(graph, start_user, target_user, return_full_result=True):
-    print(" dfs_shortest_path CALLED")
+def dfs_shortest_path(
+    graph: Graph,
+    start_user: str,
+    target_user: str,
+    return_full_result: bool = True,
+    max_depth: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+):
+    """
+    Shortest path found by iterative-deepening DFS.
+
+    DFS is re-run with depth limits 0, 1, 2, ..., each iteration with a
+    fresh best-depth memo: a node is only re-entered when reached at a
+    strictly smaller depth than before in that iteration. The first
+    limit that reaches the target is its distance, so the search never
+    dives deeper than the answer. It stops early, with no path, once an
+    iteration finishes without anything cut off by the limit (the target
+    is unreachable), or when the limit passes max_depth (if given).
+
+    progress (if given) is called every PROGRESS_STEPS expansions with
+    the number of users reached so far in the current iteration; an
+    exception raised from it aborts the search (the GUI uses this to
+    cancel).
+
+    visited_order lists users in the order the final iteration first
+    reached them (what DFSAnimator plays back); distances gives each
+    path user's hop count from the start.
+    """
 
     if not graph.has_user(start_user) or not graph.has_user(target_user):
-        return DFSPathResult([], [], {})
+        return DFSPathResult([], [], {}) if return_full_result else []
 
     start = graph.get_user_id(start_user)
     target = graph.get_user_id(target_user)
 
-    get_neighbors = graph.get_neighbors
+    get_neighbors = graph.get_sorted_neighbors
     get_name = graph.get_user_name
 
-    visited = set()
-    path = []
-    all_paths = []  # store every valid path
+    INF = float("inf")
+    cap = INF if max_depth is None else max_depth
 
-    # Full DFS that finds ALL paths
-    def dfs(u):
-        visited.add(u)
-        path.append(u)
+    best_path = [start] if start == target else []
+    visited_order_ids = [start]
+    steps = 0
+    limit = 1
 
-        if u == target:
-            all_paths.append(path.copy())
-        else:
-            for v in get_neighbors(u):
-                if v not in visited:
-                    dfs(v)
+    while not best_path and limit <= cap:
+        best_depth: Dict[int, int] = {start: 0}
+        visited_order_ids = [start]
+        cut = False   # something was left beyond the limit
 
-        # backtrack
-        visited.remove(u)
-        path.pop()
+        # Explicit stack of neighbor iterators; path[i] is at depth i
+        path = [start]
+        stack = [iter(get_neighbors(start))]
 
-    # Run full DFS
-    dfs(start)
+        while stack:
+            if progress is not None:
+                steps += 1
+                if steps % PROGRESS_STEPS == 0:
+                    progress(len(visited_order_ids))
 
-    # If no path found
-    if not all_paths:
-        return DFSPathResult([], [], {})
+            depth = len(path)   # depth a child of path[-1] would get
 
-    # Choose the SHORTEST path among all found
-    shortest = min(all_paths, key=len)
+            child = None
+            for v in stack[-1]:
+                if depth < best_depth.get(v, INF):
+                    child = v
+                    break
 
-    # Convert to names
-    shortest_named = [get_name(n) for n in shortest]
+            if child is None or depth > limit:
+                cut = cut or child is not None
+                stack.pop()
+                path.pop()
+                continue
+
+            if child not in best_depth:
+                visited_order_ids.append(child)
+            best_depth[child] = depth
+
+            if child == target:
+                best_path = path + [child]
+                break
+
+            path.append(child)
+            stack.append(iter(get_neighbors(child)))
+
+        if not cut:
+            break
+        limit += 1
+
+    path_named = [get_name(n) for n in best_path]
+
+    if not return_full_result:
+        return path_named
+
+    if not best_path:
+        return DFSPathResult([], [], {})
 
-    # visited_order for animation = shortest path only
-    visited_order_named = shortest_named.copy()
+    visited_order_named = [get_name(n) for n in visited_order_ids]
+    distances = {name: i for i, name in enumerate(path_named)}
 
-    return DFSPathResult(shortest_named, visited_order_named, {})
+    return DFSPathResult(path_named, visited_order_named, distances)
@@ -1,7 +1,7 @@
 from typing import Dict, List
-from .graph import Graph
+from .csr import GraphLike
 
-def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
+def dfs_iterative(graph: GraphLike, start_user: str, deterministic: bool = True) -> List[str]:
     if not graph.has_user(start_user):
         return []
 
@@ -11,7 +11,11 @@ def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
     visited = set()
     order_ids = []
 
-    get_neighbors = graph.get_neighbors
+    # Name-ordered neighbors come precomputed; skip ordering if not needed
+    if deterministic:
+        get_neighbors = graph.get_sorted_neighbors
+    else:
+        get_neighbors = graph.get_neighbors_unsorted
     get_name = graph.get_user_name
 
     while stack:
@@ -20,7 +24,11 @@ def dfs_iterative(graph: Graph, start_user: str) -> List[str]:
             visited.add(u)
             order_ids.append(u)
 
-            neighbors = sorted(get_neighbors(u), key=get_name, reverse=True)
+            neighbors = get_neighbors(u)
+            if deterministic:
+                # Push in reverse so the smallest name is popped first
+                neighbors = reversed(neighbors)
+
             for v in neighbors:
                 if v not in visited:
                     stack.append(v)
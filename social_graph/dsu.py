@@ -1,10 +1,17 @@
-from typing import Dict, List
+from array import array
+from typing import Dict, List, Sequence
 
 
 class DSU:
-    def __init__(self, n: int = 0):
-        self.parent = list(range(n))
-        self.rank = [0] * n
+    def __init__(self, n: int = 0, compact: bool = False):
+        # compact=True keeps parent/rank in typed arrays (4 + 1 bytes per
+        # element) instead of lists of Python ints.
+        if compact:
+            self.parent = array("i", range(n))
+            self.rank = array("b", bytes(n))
+        else:
+            self.parent = list(range(n))
+            self.rank = [0] * n
 
     # ------------------------------------------------------------------
     # Core DSU Operations
@@ -18,11 +25,16 @@ class DSU:
             self.rank.extend([0] * extend_size)
 
     def find(self, x: int) -> int:
-        self._ensure_capacity(x)
+        parent = self.parent
+        if x >= len(parent):
+            self._ensure_capacity(x)
+            return x  # brand-new singleton
 
-        if self.parent[x] != x:
-            self.parent[x] = self.find(self.parent[x])
-        return self.parent[x]
+        # Iterative path halving: each step links x to its grandparent
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
 
     def union(self, x: int, y: int) -> None:
 
@@ -41,6 +53,48 @@ class DSU:
             self.parent[rootY] = rootX
             self.rank[rootX] += 1
 
+    def union_edges(self, edge_array: Sequence[int]) -> int:
+        """
+        Union every edge of a flat edge list [u0, v0, u1, v1, ...] in one pass.
+
+        Accepts a list, array('i') or NumPy array. Capacity is grown once
+        up front and find/union are inlined, so there is no per-edge
+        method call. Returns the number of merges performed.
+        """
+        if hasattr(edge_array, "tolist"):
+            edge_array = edge_array.tolist()   # plain ints index fastest
+
+        if len(edge_array) % 2:
+            raise ValueError("edge_array must hold an even number of IDs.")
+        if not edge_array:
+            return 0
+
+        self._ensure_capacity(max(edge_array))
+        parent, rank = self.parent, self.rank
+        merges = 0
+
+        ids = iter(edge_array)
+        for x, y in zip(ids, ids):
+            while parent[x] != x:
+                parent[x] = parent[parent[x]]
+                x = parent[x]
+            while parent[y] != y:
+                parent[y] = parent[parent[y]]
+                y = parent[y]
+
+            if x == y:
+                continue
+
+            # Union by rank
+            if rank[x] < rank[y]:
+                x, y = y, x
+            parent[y] = x
+            if rank[x] == rank[y]:
+                rank[x] += 1
+            merges += 1
+
+        return merges
+
     # ------------------------------------------------------------------
     # Community Detection (Connected Components)
     # ------------------------------------------------------------------
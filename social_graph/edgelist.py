@@ -0,0 +1,224 @@
+# social_graph/edgelist.py
+
+import csv
+import gzip
+import io
+import os
+from itertools import islice
+from typing import Callable, Iterator, Optional, Tuple
+
+from .csr import GraphLike
+from .graph import Graph
+
+
+# ---------------------------------------------------------------------
+# Supported formats (any of them may be gzip-compressed, "*.gz"):
+#
+#   csv   comma-separated, RFC 4180 quoting
+#   tsv   tab-separated
+#   snap  whitespace-separated, "#" comment lines (SNAP datasets)
+#
+# Only the first two columns are used; extra columns (weights,
+# timestamps) are ignored. Users without friendships are not part of
+# an edge list and are not exported.
+# ---------------------------------------------------------------------
+FORMATS = ("csv", "tsv", "snap")
+_EXTENSIONS = {".csv": "csv", ".tsv": "tsv"}   # anything else reads as snap
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# progress(edges_read, bytes_read, total_bytes); bytes are on-disk
+# (compressed) bytes, so bytes_read / total_bytes is the fraction done.
+ProgressCallback = Callable[[int, int, int], None]
+
+
+class EdgeListError(ValueError):
+    """Raised for malformed edge-list lines or names a format cannot hold."""
+
+
+def detect_format(path: str) -> str:
+    base = path[:-3] if path.endswith(".gz") else path
+    return _EXTENSIONS.get(os.path.splitext(base)[1].lower(), "snap")
+
+
+# =====================================================================
+# READING
+# =====================================================================
+class _ByteCounter(io.RawIOBase):
+    """Wraps a binary file and remembers how many bytes were read from it."""
+
+    def __init__(self, raw) -> None:
+        self.raw = raw
+        self.bytes_read = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        n = self.raw.readinto(buffer)
+        self.bytes_read += n
+        return n
+
+
+def _open_text(raw, path: str, encoding: str) -> io.TextIOWrapper:
+    binary = raw
+    if path.endswith(".gz"):
+        binary = gzip.GzipFile(fileobj=raw, mode="rb")
+    return io.TextIOWrapper(binary, encoding=encoding, newline="")
+
+
+def _pairs(text, path: str, fmt: str, skip_header: bool) -> Iterator[Tuple[str, str]]:
+    if fmt == "snap":
+        rows = (
+            (lineno, fields)
+            for lineno, fields in enumerate((line.split() for line in text), 1)
+            if fields and not fields[0].startswith("#")
+        )
+    else:
+        reader = csv.reader(text, delimiter="," if fmt == "csv" else "\t")
+        rows = ((reader.line_num, fields) for fields in reader if fields)
+
+    if skip_header:
+        next(rows, None)
+
+    for lineno, fields in rows:
+        if len(fields) < 2:
+            raise EdgeListError(f"{path}:{lineno}: expected two users, got {fields!r}")
+        yield fields[0], fields[1]
+
+
+def _check_format(fmt: Optional[str], path: str) -> str:
+    fmt = fmt or detect_format(path)
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown edge-list format {fmt!r} (expected one of {FORMATS})")
+    return fmt
+
+
+def read_edge_list(
+    path: str,
+    fmt: Optional[str] = None,
+    skip_header: bool = False,
+    encoding: str = "utf-8",
+) -> Iterator[Tuple[str, str]]:
+    """
+    Lazily yield (u, v) name pairs from an edge-list file.
+
+    The file is streamed line by line (through gzip when the name ends
+    in ".gz"), so memory use does not depend on the file size. `fmt`
+    defaults to detect_format(path). With skip_header the first data
+    line is treated as column names.
+    """
+    fmt = _check_format(fmt, path)
+    with open(path, "rb") as raw:
+        yield from _pairs(_open_text(raw, path, encoding), path, fmt, skip_header)
+
+
+def load_edge_list(
+    graph: Graph,
+    path: str,
+    fmt: Optional[str] = None,
+    skip_header: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Stream an edge-list file into `graph`; return the friendships added.
+
+    Pairs are handed to Graph.add_friendships_bulk in chunks of
+    chunk_size, so at most one chunk of names is held besides the graph
+    itself, and progress (if given) is reported after every chunk.
+    """
+    fmt = _check_format(fmt, path)
+    total_bytes = os.path.getsize(path)
+
+    read = added = 0
+    with open(path, "rb") as f:
+        counted = _ByteCounter(f)
+        raw = io.BufferedReader(counted)
+        pairs = _pairs(_open_text(raw, path, encoding), path, fmt, skip_header)
+
+        while True:
+            chunk = list(islice(pairs, chunk_size))
+            if not chunk:
+                break
+            read += len(chunk)
+            added += graph.add_friendships_bulk(chunk)
+            if progress is not None:
+                progress(read, counted.bytes_read, total_bytes)
+
+    return added
+
+
+# =====================================================================
+# WRITING
+# =====================================================================
+def iter_edges(graph: GraphLike) -> Iterator[Tuple[str, str]]:
+    """Every friendship once, as (u, v) with u before v in user order."""
+    for u in graph.users_in_order():
+        uid = graph.get_user_id(u)
+        for vid in graph.get_sorted_neighbors(uid):
+            if vid > uid:
+                yield u, graph.get_user_name(vid)
+
+
+def _check_name(name: str, fmt: str) -> None:
+    if fmt == "tsv":
+        bad = "\t" in name or "\n" in name or "\r" in name
+    else:   # snap: one whitespace-free token that is not a comment
+        bad = len(name.split()) != 1 or name.startswith("#")
+    if bad:
+        raise EdgeListError(f"User name {name!r} cannot be written as {fmt}")
+
+
+def write_edge_list(
+    graph: GraphLike,
+    path: str,
+    fmt: Optional[str] = None,
+    header: bool = False,
+    encoding: str = "utf-8",
+) -> int:
+    """
+    Write every friendship of `graph` to `path`; return how many.
+
+    Edges are streamed from the adjacency index rather than collected
+    first. The file is written next to the target and renamed into
+    place, like the other persistence formats.
+    """
+    fmt = _check_format(fmt, path)
+    tmp_path = path + ".tmp"
+    written = 0
+    try:
+        with open(tmp_path, "wb") as raw:
+            binary = gzip.GzipFile(fileobj=raw, mode="wb") if path.endswith(".gz") else raw
+            f = io.TextIOWrapper(binary, encoding=encoding, newline="")
+            if fmt == "csv":
+                writer = csv.writer(f, lineterminator="\n")
+                if header:
+                    writer.writerow(("source", "target"))
+                for u, v in iter_edges(graph):
+                    writer.writerow((u, v))
+                    written += 1
+            else:
+                sep = "\t" if fmt == "tsv" else " "
+                if header:
+                    f.write(f"source{sep}target\n" if fmt == "tsv" else "# source target\n")
+                for u, v in iter_edges(graph):
+                    _check_name(u, fmt)
+                    _check_name(v, fmt)
+                    f.write(f"{u}{sep}{v}\n")
+                    written += 1
+
+            f.flush()
+            f.detach()
+            if binary is not raw:
+                binary.close()   # writes the gzip trailer; raw stays open
+            raw.flush()
+            os.fsync(raw.fileno())
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    os.replace(tmp_path, path)
+    return written
@@ -2,17 +2,82 @@
 
 import json
 import os
-from typing import Dict, List, Set
-
-
-GRAPH_FILE = "graph_data.json"   # persistent storage file
+from array import array
+from bisect import bisect_left, insort
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from .components import ComponentIndex
+from .wal import WriteAheadLog
+
+if TYPE_CHECKING:
+    from .csr import CSRGraph
+
+
+GRAPH_FILE = "graph_data.sgs"    # persistent storage file (binary snapshot)
+WAL_FILE = GRAPH_FILE + ".wal"   # mutations made since the last save
+LEGACY_GRAPH_FILE = "graph_data.json"   # pre-snapshot default, imported once
+
+
+# =====================================================================
+# Statistics container
+# =====================================================================
+class GraphStats:
+    def __init__(
+        self,
+        users: int,
+        friendships: int,
+        isolated: int,
+        max_degree: int,
+        degree_histogram: Dict[int, int],
+    ):
+        self.users = users
+        self.friendships = friendships
+        self.isolated = isolated
+        self.max_degree = max_degree
+        self.degree_histogram = degree_histogram   # degree -> number of users
+        self.average_degree = (2 * friendships / users) if users else 0.0
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "users": self.users,
+            "friendships": self.friendships,
+            "isolated": self.isolated,
+            "max_degree": self.max_degree,
+            "average_degree": self.average_degree,
+            "degree_histogram": self.degree_histogram,
+        }
 
 
 class Graph:
     def __init__(self) -> None:
         self._user_to_id: Dict[str, int] = {}
-        self._id_to_user: List[str] = []
+        self._id_to_user: List[Optional[str]] = []   # None = deleted (tombstone)
         self._adj: List[Set[int]] = []
+        # Same neighbors as _adj, kept ordered by username so traversals
+        # can walk them deterministically without sorting per node.
+        self._sorted_adj: List[List[int]] = []
+        self._tombstones = 0
+        self._edge_count = 0
+        # Live IDs in ID order (= matrix row order); rebuilt lazily after deletes
+        self._live_ids: Optional[List[int]] = []
+
+        # Degree index, updated on every edit so stats() is O(1)
+        self._degree_hist: Dict[int, int] = {}   # degree -> live users with it
+        self._isolated: Set[int] = set()
+        self._max_degree = 0
+
+        # Where save()/load() go by default; the WAL lives next to it
+        self._path = GRAPH_FILE
+
+        # Optional write-ahead log (see enable_wal)
+        self._wal: Optional[WriteAheadLog] = None
+        self._checkpoint_every = 0
+
+        # Optional live connected components (see enable_components)
+        self._components: Optional[ComponentIndex] = None
+
+        # Mutation listeners (see subscribe)
+        self._listeners: List[Callable[..., None]] = []
 
     # =====================================================================
     # USER MANAGEMENT
@@ -29,6 +94,16 @@ class Graph:
         self._user_to_id[username] = new_id
         self._id_to_user.append(username)
         self._adj.append(set())
+        self._sorted_adj.append([])
+        if self._live_ids is not None:
+            self._live_ids.append(new_id)
+        self._degree_hist[0] = self._degree_hist.get(0, 0) + 1
+        self._isolated.add(new_id)
+        if self._components is not None:
+            self._components.on_user_added(new_id)
+        if self._listeners:
+            self._emit("add_user", new_id)
+        self._log("add_user", username)
 
     def has_user(self, username: str) -> bool:
         return username in self._user_to_id
@@ -36,6 +111,17 @@ class Graph:
     def get_all_users(self) -> List[str]:
         return list(self._user_to_id.keys())
 
+    def id_capacity(self) -> int:
+        """Upper bound (exclusive) on user IDs, tombstones included."""
+        return len(self._id_to_user)
+
+    def tombstone_count(self) -> int:
+        return self._tombstones
+
+    def edge_count(self) -> int:
+        """Number of friendships, maintained on every edit (O(1))."""
+        return self._edge_count
+
     # =====================================================================
     # FRIENDSHIPS
     # =====================================================================
@@ -52,15 +138,121 @@ class Graph:
         uid = self._user_to_id[u]
         vid = self._user_to_id[v]
 
+        if vid in self._adj[uid]:
+            return
+
         self._adj[uid].add(vid)
         self._adj[vid].add(uid)
+        self._edge_count += 1
+        self._shift_degree(uid, len(self._adj[uid]) - 1, len(self._adj[uid]))
+        self._shift_degree(vid, len(self._adj[vid]) - 1, len(self._adj[vid]))
+
+        by_name = self._id_to_user.__getitem__
+        insort(self._sorted_adj[uid], vid, key=by_name)
+        insort(self._sorted_adj[vid], uid, key=by_name)
+        if self._components is not None:
+            self._components.on_edge_added(uid, vid)
+        if self._listeners:
+            self._emit("add_friendship", uid, vid)
+        self._log("add_friendship", u, v)
+
+    def add_friendships_bulk(self, pairs: Iterable[Tuple[str, str]]) -> int:
+        """
+        Add many friendships in one pass; return how many were new.
+
+        `pairs` may be any iterable (e.g. a generator over a huge file);
+        it is consumed once and never materialised. Names are stripped
+        and resolved to IDs once per pair; pairs with a blank name and
+        self-loops are skipped without creating anyone, otherwise unknown
+        users are created and duplicates skipped. The per-edge sorted
+        insert and degree-bucket moves of add_friendship are deferred:
+        each touched neighbor row is re-sorted once and each touched
+        user changes degree bucket once, at the end.
+        """
+        user_to_id = self._user_to_id
+        adj = self._adj
+        sorted_adj = self._sorted_adj
+        components = self._components
+        log = self._log if self._wal is not None else None
+        emit = self._emit if self._listeners else None
+        old_degree: Dict[int, int] = {}   # touched uid -> degree before the batch
+        added = 0
+
+        try:
+            for u, v in pairs:
+                uid = user_to_id.get(u)
+                if uid is None:
+                    u = u.strip()
+                    uid = user_to_id.get(u)
+                vid = user_to_id.get(v)
+                if vid is None:
+                    v = v.strip()
+                    vid = user_to_id.get(v)
+
+                # Validate the whole pair before creating either user
+                if not u or not v or u == v:
+                    continue
+                if uid is None:
+                    self.add_user(u)
+                    uid = user_to_id[u]
+                if vid is None:
+                    self.add_user(v)
+                    vid = user_to_id[v]
+
+                if vid in adj[uid]:
+                    continue
+
+                if uid not in old_degree:
+                    old_degree[uid] = len(adj[uid])
+                if vid not in old_degree:
+                    old_degree[vid] = len(adj[vid])
+
+                adj[uid].add(vid)
+                adj[vid].add(uid)
+                sorted_adj[uid].append(vid)
+                sorted_adj[vid].append(uid)
+                added += 1
+                if components is not None:
+                    components.on_edge_added(uid, vid)
+                if emit is not None:
+                    emit("add_friendship", uid, vid)
+                if log is not None:
+                    log("add_friendship", u, v)
+        finally:
+            # Also runs if `pairs` raised halfway, so the indexes always
+            # agree with whatever was added.
+            self._edge_count += added
+            by_name = self._id_to_user.__getitem__
+            for uid, old in old_degree.items():
+                sorted_adj[uid].sort(key=by_name)
+                self._shift_degree(uid, old, len(adj[uid]))
+
+        return added
+
+    @classmethod
+    def from_edge_list(
+        cls,
+        pairs: Iterable[Tuple[str, str]],
+        users: Optional[Iterable[str]] = None,
+    ) -> "Graph":
+        """
+        Build a graph from (u, v) name pairs via add_friendships_bulk.
+
+        `users` optionally lists users (including friendless ones) to add
+        first, which also fixes their IDs in that order.
+        """
+        graph = cls()
+        for name in users or ():
+            graph.add_user(name)
+        graph.add_friendships_bulk(pairs)
+        return graph
 
     def get_friends(self, username: str) -> List[str]:
         if not self.has_user(username):
             return []
 
         uid = self._user_to_id[username]
-        return sorted(self._id_to_user[n] for n in self._adj[uid])
+        return [self._id_to_user[n] for n in self._sorted_adj[uid]]
 
     def are_friends(self, u: str, v: str) -> bool:
         if not self.has_user(u) or not self.has_user(v):
@@ -74,35 +266,213 @@ class Graph:
         vid = self._user_to_id[v]
         self._adj[uid].discard(vid)
         self._adj[vid].discard(uid)
-    def delete_user(self, username: str) -> None:
+        self._edge_count -= 1
+        self._shift_degree(uid, len(self._adj[uid]) + 1, len(self._adj[uid]))
+        self._shift_degree(vid, len(self._adj[vid]) + 1, len(self._adj[vid]))
+        self._unlink_sorted(uid, vid)
+        self._unlink_sorted(vid, uid)
+        if self._components is not None:
+            self._components.on_edge_removed(uid, vid)
+        if self._listeners:
+            self._emit("remove_friendship", uid, vid)
+        self._log("remove_friendship", u, v)
+
+    def _unlink_sorted(self, uid: int, vid: int) -> None:
+        """Remove vid from uid's name-ordered neighbor list in O(log d + d)."""
+        row = self._sorted_adj[uid]
+        pos = bisect_left(row, self._id_to_user[vid], key=self._id_to_user.__getitem__)
+        del row[pos]
+
+    def delete_user(self, username: str, compact: bool = False) -> None:
+        """
+        Remove a user and all of their friendships in O(degree).
+
+        The freed ID is tombstoned rather than reused, so every other
+        user keeps its ID (canvas node maps and cached results stay
+        valid). Pass compact=True, or call compact() later, to
+        renumber IDs densely.
+        """
         if username not in self._user_to_id:
             return
 
-        uid = self._user_to_id[username]
+        uid = self._user_to_id.pop(username)
+        former_neighbors = self._adj[uid]
+
+        # Only the deleted user's neighbors refer to it
+        for n in former_neighbors:
+            self._adj[n].discard(uid)
+            self._unlink_sorted(n, uid)
+            self._shift_degree(n, len(self._adj[n]) + 1, len(self._adj[n]))
+
+        self._shift_degree(uid, len(former_neighbors), None)
+
+        self._adj[uid] = set()
+        self._sorted_adj[uid] = []
+        self._id_to_user[uid] = None
+        self._tombstones += 1
+        self._edge_count -= len(former_neighbors)
+        self._live_ids = None
+        if self._components is not None:
+            self._components.on_user_deleted(uid, former_neighbors)
+        if self._listeners:
+            self._emit("delete_user", uid, former_neighbors)
+        self._log("delete_user", username)
+
+        if compact:
+            self.compact()
+
+    def compact(self) -> Dict[int, int]:
+        """
+        Drop tombstoned IDs and renumber the remaining users densely.
+
+        This is O(V+E) and changes user IDs, so run it offline (e.g.
+        before saving). Returns the old ID -> new ID mapping.
+        """
+        remap: Dict[int, int] = {}
+        for old_id, name in enumerate(self._id_to_user):
+            if name is not None:
+                remap[old_id] = len(remap)
+
+        if len(remap) == len(self._id_to_user):
+            return remap  # nothing to reclaim
+
+        self._id_to_user = [name for name in self._id_to_user if name is not None]
+        self._user_to_id = {name: idx for idx, name in enumerate(self._id_to_user)}
+        self._adj = [
+            {remap[n] for n in self._adj[old_id]}
+            for old_id in remap
+        ]
+        # Names are unchanged, so the name order of each row survives
+        self._sorted_adj = [
+            [remap[n] for n in self._sorted_adj[old_id]]
+            for old_id in remap
+        ]
+        self._tombstones = 0
+        self._live_ids = None
+        self._isolated = {remap[uid] for uid in self._isolated}
+        if self._components is not None:
+            self._components = ComponentIndex(self)   # IDs changed
+        self._emit("reset")
+        return remap
 
-        # 1. Remove the user from mapping structures
-        del self._user_to_id[username]
-        self._id_to_user.pop(uid)
-        self._adj.pop(uid)
+    # =====================================================================
+    # DEGREE INDEX & STATISTICS
+    # =====================================================================
+    def degree(self, username: str) -> int:
+        if not self.has_user(username):
+            return 0
+        return len(self._adj[self._user_to_id[username]])
+
+    def isolated_users(self) -> List[str]:
+        """Users with no friends, in name order (O(k log k) for k of them)."""
+        return sorted(self._id_to_user[uid] for uid in self._isolated)
+
+    def stats(self) -> GraphStats:
+        """
+        Summary statistics read straight from the maintained counters.
+
+        Cost depends only on the number of distinct degrees (for the
+        histogram copy), not on the number of users or friendships.
+        """
+        return GraphStats(
+            users=len(self._user_to_id),
+            friendships=self._edge_count,
+            isolated=len(self._isolated),
+            max_degree=self._max_degree,
+            degree_histogram=dict(sorted(self._degree_hist.items())),
+        )
+
+    def _shift_degree(self, uid: int, old: int, new: Optional[int]) -> None:
+        """Move uid from degree bucket `old` to `new` (None = user deleted)."""
+        hist = self._degree_hist
+        hist[old] -= 1
+        if not hist[old]:
+            del hist[old]
+        if old == 0:
+            self._isolated.discard(uid)
+
+        if new is not None:
+            hist[new] = hist.get(new, 0) + 1
+            if new == 0:
+                self._isolated.add(uid)
+            if new > self._max_degree:
+                self._max_degree = new
+
+        # The top bucket emptied: walk down to the next non-empty one
+        while self._max_degree and self._max_degree not in hist:
+            self._max_degree -= 1
+
+    def _rebuild_degree_index(self) -> None:
+        self._degree_hist = {}
+        self._isolated = set()
+        for uid, name in enumerate(self._id_to_user):
+            if name is None:
+                continue
+            d = len(self._adj[uid])
+            self._degree_hist[d] = self._degree_hist.get(d, 0) + 1
+            if d == 0:
+                self._isolated.add(uid)
+        self._max_degree = max(self._degree_hist, default=0)
 
-        # 2. Rebuild ID mappings because indices shifted!
-        new_user_to_id = {}
-        for new_id, name in enumerate(self._id_to_user):
-            new_user_to_id[name] = new_id
-        self._user_to_id = new_user_to_id
+    # =====================================================================
+    # MUTATION EVENTS
+    # =====================================================================
+    def subscribe(self, callback: Callable[..., None]) -> Callable[..., None]:
+        """
+        Call callback(event, *args) after every change to the graph:
+
+            "add_user", uid                  "add_friendship", uid, vid
+            "delete_user", uid, neighbors    "remove_friendship", uid, vid
+            "reset"                          (IDs renumbered or reloaded)
+
+        Returns the callback, so it can be passed to unsubscribe().
+        """
+        self._listeners.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[..., None]) -> None:
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _emit(self, event: str, *args) -> None:
+        for callback in list(self._listeners):
+            callback(event, *args)
+
+    # =====================================================================
+    # CONNECTED COMPONENTS
+    # =====================================================================
+    def enable_components(self) -> ComponentIndex:
+        """
+        Keep a live DSU of connected components, updated on every edit.
+
+        Building it is O(V+E) once; afterwards the queries below are
+        O(α(n)) except right after removals, which re-label only the
+        affected component. The query methods enable it on first use.
+        Like the rest of Graph it is not thread-safe, queries included
+        (they may re-label pending splits): use it from the thread that
+        edits the graph, and give other threads a to_csr() snapshot.
+        """
+        if self._components is None:
+            self._components = ComponentIndex(self)
+        return self._components
+
+    def component_count(self) -> int:
+        return self.enable_components().count()
+
+    def component_size(self, username: str) -> int:
+        if not self.has_user(username):
+            return 0
+        return self.enable_components().size_of(self._user_to_id[username])
 
-        # 3. Fix adjacency lists: remove deleted user & shift indices > uid
-        new_adj = []
-        for neighbors in self._adj:
-            updated = set()
-            for n in neighbors:
-                if n == uid:
-                    continue  # remove deleted user
-                # shift indices
-                updated.add(n - 1 if n > uid else n)
-            new_adj.append(updated)
+    def same_component(self, u: str, v: str) -> bool:
+        if not self.has_user(u) or not self.has_user(v):
+            return False
+        return self.enable_components().same(self._user_to_id[u], self._user_to_id[v])
 
-        self._adj = new_adj
+    def communities(self) -> List[List[str]]:
+        """Every connected component as a list of usernames."""
+        groups = self.enable_components().groups()
+        return [[self._id_to_user[uid] for uid in group] for group in groups]
 
     # =====================================================================
     # INTERNAL ACCESS HELPERS FOR BFS/DFS/Canvas
@@ -116,26 +486,105 @@ class Graph:
     def get_neighbors(self, uid: int) -> List[int]:
         return list(self._adj[uid])
 
+    def get_sorted_neighbors(self, uid: int) -> List[int]:
+        """Neighbor IDs in username order. Shared list — do not modify."""
+        return self._sorted_adj[uid]
+
+    def get_neighbors_unsorted(self, uid: int) -> Set[int]:
+        """Neighbor IDs in no particular order. Shared set — do not modify."""
+        return self._adj[uid]
+
     # =====================================================================
     # ADJACENCY REPRESENTATIONS
     # =====================================================================
     def adjacency_list(self) -> Dict[str, List[str]]:
         result = {}
         for username, uid in self._user_to_id.items():
-            result[username] = sorted(self._id_to_user[v] for v in self._adj[uid])
+            result[username] = [self._id_to_user[v] for v in self._sorted_adj[uid]]
         return result
 
     def adjacency_matrix(self) -> List[List[int]]:
-        n = len(self._id_to_user)
-        matrix = [[0] * n for _ in range(n)]
-        for u in range(n):
-            for v in self._adj[u]:
-                matrix[u][v] = 1
-                matrix[v][u] = 1
-        return matrix
+        """
+        Full dense V×V matrix (rows/columns follow users_in_order()).
+
+        Only sensible for small graphs; prefer adjacency_matrix_window,
+        adjacency_coo or to_scipy_sparse on anything large.
+        """
+        n = self.user_count()
+        return self.adjacency_matrix_window(0, n, 0, n)
+
+    def adjacency_matrix_window(
+        self, row_start: int, row_stop: int, col_start: int, col_stop: int
+    ) -> List[List[int]]:
+        """
+        Dense tile [row_start:row_stop, col_start:col_stop] of the matrix.
+
+        Costs O(tile area + friendships of the tile's rows), independent
+        of the total number of users.
+        """
+        live = self._live_id_list()
+        n = len(live)
+        row_start, row_stop = max(0, row_start), min(n, row_stop)
+        col_start, col_stop = max(0, col_start), min(n, col_stop)
+        width = max(0, col_stop - col_start)
+
+        tile = []
+        for r in range(row_start, row_stop):
+            row = [0] * width
+            for v in self._adj[live[r]]:
+                c = self._position(v)
+                if col_start <= c < col_stop:
+                    row[c - col_start] = 1
+            tile.append(row)
+        return tile
+
+    def adjacency_coo(self) -> Tuple[array, array]:
+        """
+        Sparse (row, col) coordinates of every 1 in the matrix.
+
+        Both directions of each friendship are listed, rows ascending,
+        using users_in_order() positions; 2E entries instead of V².
+        """
+        rows, cols = array("i"), array("i")
+        for r, uid in enumerate(self._live_id_list()):
+            for v in self._adj[uid]:
+                rows.append(r)
+                cols.append(self._position(v))
+        return rows, cols
+
+    def to_scipy_sparse(self, fmt: str = "csr"):
+        """Adjacency as a SciPy sparse matrix (requires scipy)."""
+        try:
+            from scipy.sparse import coo_matrix
+        except ImportError as exc:
+            raise ImportError("to_scipy_sparse() requires SciPy (pip install scipy).") from exc
+
+        rows, cols = self.adjacency_coo()
+        n = self.user_count()
+        matrix = coo_matrix(([1] * len(rows), (rows, cols)), shape=(n, n), dtype="int8")
+        return matrix.asformat(fmt)
+
+    def user_count(self) -> int:
+        return len(self._user_to_id)
+
+    def _live_id_list(self) -> List[int]:
+        if self._live_ids is None:
+            self._live_ids = [uid for uid, name in enumerate(self._id_to_user) if name is not None]
+        return self._live_ids
+
+    def _position(self, uid: int) -> int:
+        """Row/column of a user ID in the matrix (IDs shift only past tombstones)."""
+        if not self._tombstones:
+            return uid
+        return bisect_left(self._live_id_list(), uid)
+
+    def to_csr(self) -> "CSRGraph":
+        """Freeze into a compact, read-only CSRGraph (see social_graph.csr)."""
+        from .csr import CSRGraph
+        return CSRGraph.from_graph(self)
 
     def users_in_order(self) -> List[str]:
-        return list(self._id_to_user)
+        return [name for name in self._id_to_user if name is not None]
 
     def print_adjacency_list(self) -> str:
         lines = []
@@ -145,10 +594,11 @@ class Graph:
             lines.append(f"{user}: {friends}")
         return "\n".join(lines)
 
-    def print_adjacency_matrix(self) -> str:
-        matrix = self.adjacency_matrix()
+    def print_adjacency_matrix(self, max_users: Optional[int] = None) -> str:
+        """Text matrix; max_users limits it to the top-left corner."""
         users = self.users_in_order()
-        n = len(users)
+        n = len(users) if max_users is None else min(len(users), max_users)
+        matrix = self.adjacency_matrix_window(0, n, 0, n)
         header = "    " + "  ".join(f"{i:2d}" for i in range(n))
         lines = [header, ""]
         for i in range(n):
@@ -159,24 +609,180 @@ class Graph:
     # =====================================================================
     # PERSISTENCE (SAVE & LOAD)
     # =====================================================================
-    def save(self):
+    @property
+    def path(self) -> str:
+        """File this graph saves to and loads from (WAL: path + ".wal")."""
+        return self._path
+
+    def _bind_path(self, path: Optional[str]) -> str:
+        """Adopt `path` as the graph's file, moving an open WAL along with it."""
+        if path is None or path == self._path:
+            return self._path
+
+        self._path = path
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = WriteAheadLog(path + ".wal", fsync=self._wal.fsync)
+        return path
+
+    def save(self, path: Optional[str] = None, format: Optional[str] = None):
+        """
+        Write a full snapshot atomically, then clear the write-ahead log.
+
+        `path` defaults to the graph's current path (GRAPH_FILE unless
+        set by an earlier save/load); passing one rebinds the graph to it.
+        The file is a binary snapshot (see social_graph.snapshot) unless
+        format="json" or the path ends in ".json"; use export_json() for
+        a JSON copy that leaves the graph's own file alone.
+        """
+        if path not in (None, self._path) and self._wal is not None and self._wal.entries:
+            # Records already synced belong to the old file: fold them
+            # into its snapshot before the log moves to the new one
+            self.save()
+        path = self._bind_path(path)
+        if (format or _format_for(path)) == "json":
+            self._write_json(path)
+        else:
+            from .snapshot import save_snapshot
+            save_snapshot(self, path)
+
+        # Everything logged so far is now in the snapshot
+        (self._wal or WriteAheadLog(path + ".wal")).truncate()
+
+    def load(self, path: Optional[str] = None):
+        """
+        Read the graph's file (binary snapshot or JSON, detected from its
+        contents), then replay edits logged to path + ".wal" since.
+
+        With the default path, a graph_data.json left by older versions
+        (plus its log) is imported when no snapshot exists yet, and
+        written straight back as the snapshot.
+        """
+        path = self._bind_path(path)
+        legacy = not os.path.exists(path) and path == GRAPH_FILE and os.path.exists(LEGACY_GRAPH_FILE)
+        source = LEGACY_GRAPH_FILE if legacy else path
+
+        if os.path.exists(source):
+            if _is_snapshot(source):
+                from .snapshot import load_snapshot_graph
+                self._adopt(load_snapshot_graph(source))
+            else:
+                self._read_json(source)
+
+            if self._components is not None:
+                self._components = ComponentIndex(self)
+            self._emit("reset")
+
+        # Re-apply edits logged after the last save (without re-logging them)
+        wal, self._wal = self._wal, None
+        try:
+            pending = WriteAheadLog(source + ".wal").replay(self)
+        finally:
+            self._wal = wal
+        if self._wal is not None:
+            self._wal.entries = pending
+
+        if legacy:
+            self.save()
+
+    def export_json(self, path: str) -> None:
+        """Write the graph as JSON for other tools; the graph's path and WAL are untouched."""
+        self._write_json(path)
+
+    def _write_json(self, path: str) -> None:
         data = {
             "users": self._id_to_user,
             "adj": [list(neigh) for neigh in self._adj]
         }
-        with open(GRAPH_FILE, "w") as f:
+        tmp_file = path + ".tmp"
+        with open(tmp_file, "w") as f:
             json.dump(data, f, indent=4)
+            f.flush()
+            os.fsync(f.fileno())
 
-    def load(self):
-        if not os.path.exists(GRAPH_FILE):
-            return  # first run → no saved data
+        # Readers see either the old or the new file, never half of one
+        os.replace(tmp_file, path)
 
-        with open(GRAPH_FILE, "r") as f:
+    def _read_json(self, path: str) -> None:
+        with open(path, "r") as f:
             data = json.load(f)
 
-        # restore users
+        # restore users (null entries are tombstoned IDs)
         self._id_to_user = data["users"]
-        self._user_to_id = {name: idx for idx, name in enumerate(self._id_to_user)}
+        self._user_to_id = {
+            name: idx for idx, name in enumerate(self._id_to_user) if name is not None
+        }
+        self._tombstones = len(self._id_to_user) - len(self._user_to_id)
+        self._live_ids = None
 
         # restore adjacency
         self._adj = [set(neigh) for neigh in data["adj"]]
+        self._edge_count = sum(len(neigh) for neigh in self._adj) // 2
+        self._rebuild_degree_index()
+        by_name = self._id_to_user.__getitem__
+        self._sorted_adj = [sorted(neigh, key=by_name) for neigh in self._adj]
+
+    def _adopt(self, other: "Graph") -> None:
+        """Take over the users and friendships of a freshly loaded Graph."""
+        self._id_to_user = other._id_to_user
+        self._user_to_id = other._user_to_id
+        self._adj = other._adj
+        self._sorted_adj = other._sorted_adj
+        self._tombstones = other._tombstones
+        self._edge_count = other._edge_count
+        self._live_ids = None
+        self._rebuild_degree_index()
+
+    # =====================================================================
+    # WRITE-AHEAD LOG
+    # =====================================================================
+    def enable_wal(self, checkpoint_every: int = 1000, fsync: bool = False) -> None:
+        """
+        Log every mutation to path + ".wal" as it happens.
+
+        sync() then costs one appended line per edit, and only rewrites
+        the full snapshot once checkpoint_every records have piled up.
+        Call after load() so replayed records count toward the next
+        checkpoint.
+        """
+        if self._wal is None:
+            wal_path = self._path + ".wal"
+            self._wal = WriteAheadLog(wal_path, fsync=fsync)
+            if os.path.exists(wal_path):
+                with open(wal_path, "r", encoding="utf-8") as f:
+                    self._wal.entries = sum(1 for line in f if line.strip())
+        self._wal.fsync = fsync
+        self._checkpoint_every = checkpoint_every
+
+    def sync(self) -> None:
+        """Make all edits durable: O(1) with a WAL, a full save() without."""
+        if self._wal is None or self._wal.entries >= self._checkpoint_every:
+            self.save()
+
+    def close(self) -> None:
+        """
+        Fold pending log records into a snapshot and release the log file.
+
+        Logging stops here: later edits stay in memory until the next
+        save(), so a stale reference can never append to a log that a
+        fresh load of the same file now owns.
+        """
+        if self._wal is not None:
+            if self._wal.entries:
+                self.save()
+            self._wal.close()
+            self._wal = None
+
+    def _log(self, op: str, *args) -> None:
+        if self._wal is not None:
+            self._wal.append(op, *args)
+
+
+def _format_for(path: str) -> str:
+    return "json" if path.lower().endswith(".json") else "binary"
+
+
+def _is_snapshot(path: str) -> bool:
+    from .snapshot import MAGIC
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
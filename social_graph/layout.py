@@ -0,0 +1,491 @@
+# social_graph/layout.py
+
+"""
+Graph layouts: user name -> (x, y) positions for the canvas.
+
+Pure Python (no Qt), so layouts can run in a worker thread and be
+tested without a display. Every layout works on a plain snapshot of
+the graph (see layout_input) rather than on the Graph itself, so the
+GUI can keep editing the graph while a layout runs.
+
+  circle   users evenly spaced on a circle, in name order
+  force    force-directed (Fruchterman–Reingold); repulsion uses a
+           Barnes–Hut quadtree, O(n log n) per iteration, vectorized
+           with NumPy when it is installed
+
+Final positions can be cached next to the graph file (cache_path) and
+reused on the next launch as long as the graph is unchanged.
+"""
+
+import hashlib
+import json
+import math
+import os
+import random
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+Position = Tuple[float, float]
+Positions = Dict[str, Position]
+Edges = List[Tuple[int, int]]
+
+DEFAULT_CENTER = (400.0, 300.0)
+DEFAULT_SPACING = 65.0     # roughly 2.5 node radii
+
+
+# =====================================================================
+# INPUT SNAPSHOT
+# =====================================================================
+def layout_input(graph) -> Tuple[List[str], Edges]:
+    """
+    Copy what a layout needs out of `graph`: the user names (sorted)
+    and every friendship once, as index pairs into that list.
+    """
+    names = sorted(graph.get_all_users())
+    index = {name: i for i, name in enumerate(names)}
+    get_id, get_name = graph.get_user_id, graph.get_user_name
+
+    edges = []
+    for i, name in enumerate(names):
+        for vid in graph.get_neighbors_unsorted(get_id(name)):
+            j = index[get_name(vid)]
+            if i < j:
+                edges.append((i, j))
+    return names, edges
+
+
+def fingerprint(names: Sequence[str], edges: Edges) -> str:
+    """Digest of users and friendships; changes whenever the graph does."""
+    digest = hashlib.sha1()
+    for name in names:
+        digest.update(name.encode("utf-8") + b"\0")
+    digest.update(b"\1")
+    for i, j in sorted(edges):
+        digest.update(f"{i},{j};".encode("ascii"))
+    return digest.hexdigest()
+
+
+# =====================================================================
+# LAYOUTS
+# =====================================================================
+class Layout:
+    """
+    Base class. Subclasses implement iterate(); compute() runs it to the
+    end. params() is stored with cached positions, so a cache made with
+    different settings is not reused.
+    """
+
+    name = ""
+
+    def iterate(self, names: Sequence[str], edges: Edges, initial: Optional[Positions] = None) -> Iterator[Positions]:
+        """Yield intermediate positions; the last one yielded is final."""
+        raise NotImplementedError
+
+    def compute(self, names: Sequence[str], edges: Edges, initial: Optional[Positions] = None) -> Positions:
+        positions = {}
+        for positions in self.iterate(names, edges, initial):
+            pass
+        return positions
+
+    def params(self) -> dict:
+        return {}
+
+
+class CircleLayout(Layout):
+    """Users on one circle, name order; grows so nodes never overlap."""
+
+    name = "circle"
+
+    def __init__(self, center: Position = DEFAULT_CENTER, min_radius: float = 220.0, spacing: float = DEFAULT_SPACING):
+        self.center = center
+        self.min_radius = min_radius
+        self.spacing = spacing
+
+    def iterate(self, names, edges, initial=None):
+        cx, cy = self.center
+        n = len(names)
+        radius = max(self.min_radius, n * self.spacing / (2 * math.pi))
+
+        positions = {}
+        for i, name in enumerate(names):
+            angle = (2 * math.pi * i) / max(1, n)
+            positions[name] = (cx + radius * math.cos(angle), cy + radius * math.sin(angle))
+        yield positions
+
+    def params(self):
+        return {"center": list(self.center), "min_radius": self.min_radius, "spacing": self.spacing}
+
+
+class ForceDirectedLayout(Layout):
+    """
+    Fruchterman–Reingold spring embedder.
+
+    Friends attract (d² / k), everyone repels (k² / d) and a weak
+    gravity keeps separate components near the center. Repulsion is
+    approximated with Barnes–Hut: a quadtree cell whose size / distance
+    is below `theta` acts as one body at its center of mass (keep theta
+    under 1/sqrt(2), so a cell is never "far" from a point inside it).
+    Each step moves a node at most the current temperature, which cools
+    linearly to zero over `iterations` steps.
+
+    Users in `initial` start from those positions (e.g. a cached layout
+    of an older version of the graph); the rest start at random, seeded
+    by `seed`, so results are reproducible. use_numpy=None picks the
+    NumPy kernel when NumPy is installed.
+    """
+
+    name = "force"
+
+    def __init__(
+        self,
+        iterations: int = 200,
+        spacing: float = DEFAULT_SPACING * 1.5,
+        theta: float = 0.7,
+        gravity: float = 0.05,
+        center: Position = DEFAULT_CENTER,
+        seed: int = 0,
+        yield_every: int = 5,
+        use_numpy: Optional[bool] = None,
+    ):
+        self.iterations = iterations
+        self.spacing = spacing
+        self.theta = theta
+        self.gravity = gravity
+        self.center = center
+        self.seed = seed
+        self.yield_every = max(1, yield_every)
+        self.use_numpy = have_numpy() if use_numpy is None else use_numpy
+
+    def params(self):
+        return {
+            "iterations": self.iterations, "spacing": self.spacing, "theta": self.theta,
+            "gravity": self.gravity, "center": list(self.center), "seed": self.seed,
+        }
+
+    def iterate(self, names, edges, initial=None):
+        n = len(names)
+        if n == 0:
+            yield {}
+            return
+
+        cx, cy = self.center
+        xs, ys = self._initial_positions(names, initial)
+        step = _numpy_step if self.use_numpy else _python_step
+
+        if self.use_numpy:
+            import numpy as np
+            pos = np.column_stack([np.asarray(xs, dtype=float) - cx, np.asarray(ys, dtype=float) - cy])
+            edge_array = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+            state, graph_edges = pos, edge_array
+        else:
+            state = ([x - cx for x in xs], [y - cy for y in ys])
+            graph_edges = edges
+
+        t0 = self.spacing * math.sqrt(n) / 4
+        for it in range(self.iterations):
+            temperature = t0 * (1 - it / self.iterations)
+            state = step(state, graph_edges, self.spacing, self.theta, self.gravity, temperature)
+            if (it + 1) % self.yield_every == 0 or it + 1 == self.iterations:
+                yield self._positions(names, state)
+
+        if self.iterations <= 0:
+            yield self._positions(names, state)
+
+    def _initial_positions(self, names, initial):
+        rng = random.Random(self.seed)
+        cx, cy = self.center
+        spread = self.spacing * math.sqrt(len(names))
+        initial = initial or {}
+
+        xs, ys = [], []
+        for name in names:
+            if name in initial:
+                x, y = initial[name]
+            else:
+                x = cx + rng.uniform(-spread, spread)
+                y = cy + rng.uniform(-spread, spread)
+            xs.append(x)
+            ys.append(y)
+        return xs, ys
+
+    def _positions(self, names, state) -> Positions:
+        cx, cy = self.center
+        if self.use_numpy:
+            xs, ys = state[:, 0].tolist(), state[:, 1].tolist()
+        else:
+            xs, ys = state
+        return {name: (cx + x, cy + y) for name, x, y in zip(names, xs, ys)}
+
+
+LAYOUTS = {
+    CircleLayout.name: CircleLayout,
+    ForceDirectedLayout.name: ForceDirectedLayout,
+}
+
+
+def get_layout(name: str, **kwargs) -> Layout:
+    if name not in LAYOUTS:
+        raise ValueError(f"Unknown layout {name!r} (expected one of {sorted(LAYOUTS)})")
+    return LAYOUTS[name](**kwargs)
+
+
+def have_numpy() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# =====================================================================
+# FORCE KERNELS
+# =====================================================================
+MIN_DIST2 = 1e-4      # squared distance floor, avoids blow-ups on overlap
+MAX_TREE_DEPTH = 24   # coincident points stop splitting here
+
+
+def _python_step(state, edges, k, theta, gravity, temperature):
+    xs, ys = state
+    n = len(xs)
+    k2 = k * k
+    fx = [-gravity * x for x in xs]
+    fy = [-gravity * y for y in ys]
+
+    tree = _BHTree(xs, ys)
+    for i in range(n):
+        rx, ry = tree.repulsion(i, k2, theta)
+        fx[i] += rx
+        fy[i] += ry
+
+    for i, j in edges:
+        dx, dy = xs[j] - xs[i], ys[j] - ys[i]
+        scale = math.sqrt(dx * dx + dy * dy) / k
+        fx[i] += dx * scale
+        fy[i] += dy * scale
+        fx[j] -= dx * scale
+        fy[j] -= dy * scale
+
+    for i in range(n):
+        length = math.sqrt(fx[i] * fx[i] + fy[i] * fy[i])
+        if length > 0:
+            move = min(length, temperature) / length
+            xs[i] += fx[i] * move
+            ys[i] += fy[i] * move
+    return xs, ys
+
+
+class _BHTree:
+    """Barnes–Hut quadtree over point lists (pure-Python kernel)."""
+
+    def __init__(self, xs, ys):
+        self.xs, self.ys = xs, ys
+        # Per node: center of mass, mass, cell size, children or None, points (leaves)
+        self.com_x, self.com_y, self.mass, self.size = [], [], [], []
+        self.children, self.points = [], []
+
+        x0, y0 = min(xs), min(ys)
+        size = max(max(xs) - x0, max(ys) - y0, 1e-9) * 1.0001
+        self._build(list(range(len(xs))), x0, y0, size)
+
+    def _build(self, root_points, x0, y0, size):
+        xs, ys = self.xs, self.ys
+        stack = [(self._new_node(root_points, size), root_points, x0, y0, size, 0)]
+        while stack:
+            node, points, x0, y0, size, depth = stack.pop()
+            if len(points) == 1 or depth >= MAX_TREE_DEPTH:
+                self.points[node] = points
+                continue
+
+            half = size / 2
+            mx, my = x0 + half, y0 + half
+            quadrants = ([], [], [], [])
+            for p in points:
+                quadrants[(xs[p] > mx) + 2 * (ys[p] > my)].append(p)
+
+            children = []
+            for q, members in enumerate(quadrants):
+                if members:
+                    child = self._new_node(members, half)
+                    children.append(child)
+                    stack.append((child, members, x0 + half * (q & 1), y0 + half * (q >> 1), half, depth + 1))
+            self.children[node] = children
+
+    def _new_node(self, points, size):
+        xs, ys = self.xs, self.ys
+        m = len(points)
+        self.com_x.append(sum(xs[p] for p in points) / m)
+        self.com_y.append(sum(ys[p] for p in points) / m)
+        self.mass.append(m)
+        self.size.append(size)
+        self.children.append(None)
+        self.points.append(None)
+        return len(self.mass) - 1
+
+    def repulsion(self, i, k2, theta):
+        x, y = self.xs[i], self.ys[i]
+        theta2 = theta * theta
+        fx = fy = 0.0
+        stack = [0]
+        while stack:
+            node = stack.pop()
+            dx, dy = x - self.com_x[node], y - self.com_y[node]
+            d2 = dx * dx + dy * dy
+            children = self.children[node]
+
+            if children is None:
+                # Leaf: exact forces from its points
+                for p in self.points[node]:
+                    if p != i:
+                        dx, dy = x - self.xs[p], y - self.ys[p]
+                        f = k2 / max(dx * dx + dy * dy, MIN_DIST2)
+                        fx += dx * f
+                        fy += dy * f
+            elif self.size[node] ** 2 < theta2 * d2:
+                f = k2 * self.mass[node] / d2
+                fx += dx * f
+                fy += dy * f
+            else:
+                stack.extend(children)
+        return fx, fy
+
+
+def _numpy_step(pos, edges, k, theta, gravity, temperature):
+    import numpy as np
+
+    n = len(pos)
+    force = -gravity * pos
+    force += _numpy_repulsion(pos, k * k, theta)
+
+    if len(edges):
+        src, dst = edges[:, 0], edges[:, 1]
+        delta = pos[dst] - pos[src]
+        pull = delta * (np.sqrt((delta ** 2).sum(axis=1)) / k)[:, None]
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(src, weights=pull[:, axis], minlength=n)
+            force[:, axis] -= np.bincount(dst, weights=pull[:, axis], minlength=n)
+
+    length = np.sqrt((force ** 2).sum(axis=1))
+    move = np.divide(np.minimum(length, temperature), length, out=np.zeros(n), where=length > 0)
+    return pos + force * move[:, None]
+
+
+def _numpy_repulsion(pos, k2, theta):
+    """
+    Barnes–Hut repulsion for all points at once.
+
+    The tree is built one level at a time (every point in a crowded
+    cell is bucketed into its child quadrant in a single vectorized
+    pass), then traversed breadth-first as a frontier of (point, node)
+    pairs: pairs that are far enough or reach a leaf are applied, the
+    rest are expanded into their children.
+    """
+    import numpy as np
+
+    n = len(pos)
+    lo = pos.min(axis=0)
+    root_size = max(float((pos.max(axis=0) - lo).max()), 1e-9) * 1.0001
+
+    node_lo = [lo[None, :]]
+    node_size = [np.array([root_size])]
+    parents, quads = [], []            # per level: parent node and quadrant of each new node
+    member_pts, member_nodes = [np.arange(n)], [np.zeros(n, dtype=np.int64)]
+    point_node = np.zeros(n, dtype=np.int64)
+    n_nodes = 1
+
+    all_lo, all_size = node_lo[0], node_size[0]
+    active = np.arange(n)
+    for _ in range(MAX_TREE_DEPTH):
+        nodes = point_node[active]
+        crowded = np.bincount(nodes, minlength=n_nodes)[nodes] > 1
+        active, nodes = active[crowded], nodes[crowded]
+        if not active.size:
+            break
+
+        half = all_size[nodes] / 2
+        mid = all_lo[nodes] + half[:, None]
+        quad = (pos[active, 0] > mid[:, 0]).astype(np.int64) + 2 * (pos[active, 1] > mid[:, 1])
+        keys, inverse = np.unique(nodes * 4 + quad, return_inverse=True)
+
+        parent, q = keys // 4, keys % 4
+        child_half = all_size[parent] / 2
+        offset = np.column_stack([q & 1, q >> 1]) * child_half[:, None]
+        new_ids = n_nodes + np.arange(len(keys))
+
+        all_lo = np.vstack([all_lo, all_lo[parent] + offset])
+        all_size = np.concatenate([all_size, child_half])
+        parents.append(parent)
+        quads.append(q)
+        point_node[active] = new_ids[inverse]
+        member_pts.append(active)
+        member_nodes.append(new_ids[inverse])
+        n_nodes += len(keys)
+
+    children = np.full((n_nodes, 4), -1, dtype=np.int64)
+    start = 1
+    for parent, q in zip(parents, quads):
+        children[parent, q] = np.arange(start, start + len(parent))
+        start += len(parent)
+    is_leaf = (children < 0).all(axis=1)
+
+    pts_all, nodes_all = np.concatenate(member_pts), np.concatenate(member_nodes)
+    mass = np.bincount(nodes_all, minlength=n_nodes).astype(float)
+    com = np.column_stack([
+        np.bincount(nodes_all, weights=pos[pts_all, axis], minlength=n_nodes) / mass
+        for axis in (0, 1)
+    ])
+
+    force = np.zeros_like(pos)
+    theta2 = theta * theta
+    pts = np.arange(n)
+    nds = np.zeros(n, dtype=np.int64)
+    while pts.size:
+        delta = pos[pts] - com[nds]
+        d2 = (delta ** 2).sum(axis=1)
+        leaf = is_leaf[nds]
+        accept = leaf | (all_size[nds] ** 2 < theta2 * d2)
+        use = accept & (point_node[pts] != nds)   # a point's own leaf holds only itself (or overlaps)
+
+        f = delta[use] * (k2 * mass[nds[use]] / np.maximum(d2[use], MIN_DIST2))[:, None]
+        for axis in (0, 1):
+            force[:, axis] += np.bincount(pts[use], weights=f[:, axis], minlength=n)
+
+        expand = ~accept
+        ch = children[nds[expand]].ravel()
+        pts = np.repeat(pts[expand], 4)[ch >= 0]
+        nds = ch[ch >= 0]
+    return force
+
+
+# =====================================================================
+# POSITION CACHE
+# =====================================================================
+def cache_path(graph_path: str) -> str:
+    """Layout cache kept alongside a graph file (JSON, but not named *.json)."""
+    return graph_path + ".layout"
+
+
+def save_cached_layout(path: str, layout: Layout, digest: str, positions: Positions) -> None:
+    """Write positions atomically, tagged with the layout and graph fingerprint."""
+    data = {
+        "layout": layout.name,
+        "params": layout.params(),
+        "fingerprint": digest,
+        "positions": {name: [x, y] for name, (x, y) in positions.items()},
+    }
+    tmp_file = path + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump(data, f)
+    os.replace(tmp_file, path)
+
+
+def load_cached_layout(path: str) -> Optional[dict]:
+    """
+    The cache written by save_cached_layout (positions as name -> (x, y)),
+    or None if there is none or it cannot be read.
+    """
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+        data["positions"] = {name: (float(x), float(y)) for name, (x, y) in data["positions"].items()}
+    except (OSError, ValueError, KeyError, TypeError, AttributeError):
+        return None
+    return data
@@ -1,33 +1,158 @@
-from collections import Counter
-from typing import List, Tuple
-from .graph import Graph
+import heapq
+from collections import deque
+from itertools import islice
+from typing import Callable, Dict, List, Optional, Tuple
+from .csr import GraphLike
+
+PROGRESS_STEPS = 4096   # users handled between progress() calls
 
 # Recommend friends based on mutual friends
-def recommend_friends(graph: Graph, username: str, max_results: int = 5) -> List[Tuple[str, int]]:
-    # Returns a list of tuples: [(recommended_user, mutual_friend_count)]
+def recommend_friends(
+    graph: GraphLike,
+    username: str,
+    max_results: int = 5,
+    max_fanout: Optional[int] = None,
+) -> List[Tuple[str, int]]:
+    """
+    Returns a list of tuples: [(recommended_user, mutual_friend_count)],
+    highest count first, ties broken by name.
 
-    if not graph.has_user(username):
-        return[]
-    
-    # current friends of user
-    direct_friends = set(graph.get_friends(username))
-
-    # mutual friends
-    mutual_counts: Counter[str] = Counter()
-
-    for friend in direct_friends:
-        friends_of_friend = graph.get_friends(friend)
-        for canditate in friends_of_friend:
-            if canditate == username:
-                continue
-            if canditate in direct_friends:
-                continue
-            mutual_counts[canditate] += 1
+    Counting runs on IDs; only the candidates that can still make the
+    top max_results (count >= the k-th largest count, found with a heap)
+    are turned into names for the final ordering. max_fanout caps how
+    many of each friend's friends are scanned (the first ones in name
+    order), bounding the cost for users whose friends are hubs; counts
+    are then lower bounds.
+    """
+
+    if not graph.has_user(username) or max_results <= 0:
+        return []
+
+    uid = graph.get_user_id(username)
+    get_name = graph.get_user_name
+    mutual_counts = _mutual_counts(graph, uid, max_fanout)
+
+    if len(mutual_counts) > max_results:
+        cutoff = heapq.nlargest(max_results, mutual_counts.values())[-1]
+        pool = [(cid, count) for cid, count in mutual_counts.items() if count >= cutoff]
+    else:
+        pool = list(mutual_counts.items())
 
     # Sort by highest mutual friends, then alphabetically
-    sorted_candidates = sorted(
-        mutual_counts.items(),
-        key = lambda item: (-item[1], item[0])
-    )
+    ranked = sorted((-count, get_name(cid)) for cid, count in pool)
+    return [(name, -neg_count) for neg_count, name in ranked[:max_results]]
+
+
+# Rank every non-friend by a blend of mutual friends and BFS distance
+def recommend_by_score(
+    graph: GraphLike,
+    username: str,
+    max_results: int = 10,
+    max_hops: Optional[int] = None,
+    mutual_weight: float = 0.7,
+    distance_weight: float = 0.3,
+    progress: Optional[Callable[[int], None]] = None,
+) -> List[Tuple[str, float, int, Optional[int]]]:
+    """
+    Top-k recommendations scored as
+
+        mutual_weight * mutual_count + distance_weight / (1 + distance)
+
+    One single-source BFS gives every distance and one friends-of-friends
+    pass gives every mutual count, so a call costs O(V+E) instead of one
+    BFS per candidate. With max_hops set the BFS stops at that radius and
+    only users inside it are ranked; otherwise unreachable users are
+    ranked too, with distance None. The best max_results are picked with
+    a heap and returned as (user, score, mutual_count, distance), highest
+    score first, ties broken by name. progress (if given) is called every
+    PROGRESS_STEPS users with the number handled in the current pass; an
+    exception raised from it aborts the call.
+    """
+
+    if not graph.has_user(username):
+        return []
+
+    uid = graph.get_user_id(username)
+    get_name = graph.get_user_name
+
+    distances = _hop_distances(graph, uid, max_hops, progress)
+    mutual_counts = _mutual_counts(graph, uid, progress=progress)
+    friends = set(graph.get_neighbors_unsorted(uid))
+
+    if max_hops is None:
+        candidates = (graph.get_user_id(name) for name in graph.get_all_users())
+    else:
+        candidates = iter(distances)
+
+    scored = []
+    for i, cid in enumerate(candidates, 1):
+        if progress is not None and i % PROGRESS_STEPS == 0:
+            progress(i)
+        if cid == uid or cid in friends:
+            continue
+
+        mutual = mutual_counts.get(cid, 0)
+        distance = distances.get(cid)
+        distance_score = 0 if distance is None else 1 / (1 + distance)
+        score = (mutual * mutual_weight) + (distance_score * distance_weight)
+        scored.append((score, cid, mutual, distance))
+
+    top = heapq.nsmallest(max_results, scored, key=lambda item: (-item[0], get_name(item[1])))
+    return [(get_name(cid), score, mutual, distance) for score, cid, mutual, distance in top]
+
+
+def _hop_distances(
+    graph: GraphLike,
+    uid: int,
+    max_hops: Optional[int],
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[int, int]:
+    """Single-source BFS hop counts, stopping after max_hops levels."""
+    get_neighbors = graph.get_neighbors_unsorted
+
+    distances = {uid: 0}
+    queue = deque([uid])
+
+    expanded = 0
+    while queue:
+        u = queue.popleft()
+        expanded += 1
+        if progress is not None and expanded % PROGRESS_STEPS == 0:
+            progress(expanded)
+
+        d = distances[u] + 1
+        if max_hops is not None and d > max_hops:
+            break  # queue is in distance order, so everything left is too far
+
+        for v in get_neighbors(u):
+            if v not in distances:
+                distances[v] = d
+                queue.append(v)
+
+    return distances
+
+
+def _mutual_counts(
+    graph: GraphLike,
+    uid: int,
+    max_fanout: Optional[int] = None,
+    progress: Optional[Callable[[int], None]] = None,
+) -> Dict[int, int]:
+    """Mutual-friend count for every friend-of-friend of uid (by ID)."""
+    get_neighbors = graph.get_neighbors_unsorted
+    friends = set(get_neighbors(uid))
+
+    if max_fanout is not None:
+        get_sorted = graph.get_sorted_neighbors
+        get_neighbors = lambda friend: islice(get_sorted(friend), max_fanout)
+
+    counts: Dict[int, int] = {}
+    for i, friend in enumerate(friends, 1):
+        if progress is not None and i % PROGRESS_STEPS == 0:
+            progress(i)
+        for candidate in get_neighbors(friend):
+            if candidate == uid or candidate in friends:
+                continue
+            counts[candidate] = counts.get(candidate, 0) + 1
 
-    return sorted_candidates[:max_results]
\ No newline at end of file
+    return counts
@@ -0,0 +1,185 @@
+# social_graph/snapshot.py
+
+import mmap
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from typing import Iterator, List, Optional, Union
+
+from .csr import CSRGraph
+from .graph import Graph
+
+
+SNAPSHOT_FILE = "graph_data.sgs"   # default binary snapshot file
+
+# ---------------------------------------------------------------------
+# File layout (version 1, little-endian, every section 8-byte aligned):
+#
+#   header       magic "SGSNAP\0\0", u32 version, u32 flags,
+#                u64 id_count, u64 index_count, u64 name_bytes
+#   name_offsets (id_count + 1) x u64   byte offsets into the name blob
+#   indptr       (id_count + 1) x i64   CSR row pointers
+#   indices      index_count x i32      CSR neighbor IDs (name-ordered)
+#   names        name_bytes of UTF-8    empty name = tombstoned ID
+# ---------------------------------------------------------------------
+MAGIC = b"SGSNAP\0\0"
+VERSION = 1
+_HEADER = struct.Struct("<8sIIQQQ")
+
+_OFFSET_TYPECODE = "q"
+_LITTLE_ENDIAN = sys.byteorder == "little"
+
+
+class SnapshotError(ValueError):
+    """Raised when a snapshot file is truncated, foreign or too new."""
+
+
+# =====================================================================
+# LAZY NAME TABLE
+# =====================================================================
+class _NameTable(Sequence):
+    """Decodes user names out of the snapshot's string table on demand."""
+
+    def __init__(self, offsets: Sequence[int], blob: Union[bytes, memoryview]):
+        self._offsets = offsets
+        self._blob = blob
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    def __getitem__(self, uid: int) -> Optional[str]:
+        start, end = self._offsets[uid], self._offsets[uid + 1]
+        if start == end:
+            return None  # tombstone
+        return bytes(self._blob[start:end]).decode("utf-8")
+
+    def __iter__(self) -> Iterator[Optional[str]]:
+        for uid in range(len(self)):
+            yield self[uid]
+
+    def views(self) -> list:
+        """Buffers this table reads from (released by CSRGraph.close)."""
+        return [self._offsets, self._blob]
+
+
+# =====================================================================
+# WRITE
+# =====================================================================
+def save_snapshot(graph: Union[Graph, CSRGraph], path: str = SNAPSHOT_FILE) -> None:
+    """
+    Write a binary snapshot of `graph` to `path`.
+
+    The file is written next to the target and renamed into place, so a
+    crash mid-write never leaves a half-written snapshot behind.
+    """
+    csr = graph.to_csr() if isinstance(graph, Graph) else graph
+
+    offsets = array(_OFFSET_TYPECODE, [0])
+    encoded: List[bytes] = []
+    total = 0
+    for name in csr._id_to_user:
+        data = name.encode("utf-8") if name else b""
+        encoded.append(data)
+        total += len(data)
+        offsets.append(total)
+
+    indptr = array(CSRGraph.INDPTR_TYPECODE, csr.indptr)
+    indices = array(CSRGraph.INDICES_TYPECODE, csr.indices)
+
+    if not _LITTLE_ENDIAN:
+        for buf in (offsets, indptr, indices):
+            buf.byteswap()
+
+    header = _HEADER.pack(MAGIC, VERSION, 0, len(offsets) - 1, len(indices), total)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        for buf in (offsets, indptr, indices):
+            f.write(buf.tobytes())
+            f.write(b"\0" * _padding(len(buf) * buf.itemsize))
+        for data in encoded:
+            f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+
+    os.replace(tmp_path, path)
+
+
+# =====================================================================
+# READ
+# =====================================================================
+def load_snapshot(path: str = SNAPSHOT_FILE, use_mmap: bool = True) -> CSRGraph:
+    """
+    Open a snapshot as a read-only CSRGraph.
+
+    With use_mmap=True (default) the adjacency arrays are zero-copy views
+    over a memory-mapped file, so startup cost does not grow with the
+    number of friendships; pages are read in as traversals touch them.
+    The mapping stays open until the result's close() (or use it as a
+    context manager). Call .to_graph() on the result for a mutable Graph.
+    """
+    mapping = None
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size < _HEADER.size:
+            raise SnapshotError(f"{path}: file too short for a snapshot header")
+
+        if use_mmap and _LITTLE_ENDIAN:
+            mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            buf = memoryview(mapping)
+        else:
+            buf = memoryview(f.read())
+
+    magic, version, _flags, id_count, index_count, name_bytes = _HEADER.unpack_from(buf)
+    if magic != MAGIC:
+        raise SnapshotError(f"{path}: not a graph snapshot")
+    if version > VERSION:
+        raise SnapshotError(f"{path}: snapshot version {version} is newer than supported ({VERSION})")
+
+    pos = _HEADER.size
+    offsets, pos = _section(buf, pos, id_count + 1, _OFFSET_TYPECODE)
+    indptr, pos = _section(buf, pos, id_count + 1, CSRGraph.INDPTR_TYPECODE)
+    indices, pos = _section(buf, pos, index_count, CSRGraph.INDICES_TYPECODE)
+
+    if pos + name_bytes > len(buf):
+        raise SnapshotError(f"{path}: snapshot is truncated")
+
+    names = _NameTable(offsets, buf[pos:pos + name_bytes])
+    buf.release()   # the sections above are views of their own
+    return CSRGraph(names, indptr, indices, mapping=mapping)
+
+
+def load_snapshot_graph(path: str = SNAPSHOT_FILE) -> Graph:
+    """
+    Load a snapshot straight into a mutable Graph.
+
+    The file is mapped rather than read into one big bytes object, and
+    unmapped again once the Graph has copied what it needs.
+    """
+    with load_snapshot(path) as csr:
+        return csr.to_graph()
+
+
+# =====================================================================
+# HELPERS
+# =====================================================================
+def _padding(nbytes: int) -> int:
+    return -nbytes % 8
+
+
+def _section(buf: memoryview, pos: int, count: int, typecode: str):
+    """Return (typed view of `count` items at pos, next aligned pos)."""
+    itemsize = array(typecode).itemsize
+    end = pos + count * itemsize
+    if end > len(buf):
+        raise SnapshotError("snapshot is truncated")
+
+    if _LITTLE_ENDIAN:
+        view = buf[pos:end].cast(typecode)
+    else:
+        view = array(typecode, buf[pos:end].tobytes())
+        view.byteswap()
+
+    return view, end + _padding(end - pos)
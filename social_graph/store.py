@@ -0,0 +1,186 @@
+# social_graph/store.py
+
+import os
+import threading
+from collections import OrderedDict
+from time import monotonic
+from typing import List, Optional
+
+from .graph import Graph
+from .layout import cache_path
+
+
+GRAPH_SUFFIX = ".sgs"     # binary snapshot (see Graph.save)
+WAL_SUFFIX = GRAPH_SUFFIX + ".wal"
+
+
+class GraphStore:
+    """
+    Several named graphs under one directory, loaded on demand.
+
+    Graph "region-eu" lives in <root_dir>/region-eu.sgs with its
+    write-ahead log next to it. At most max_resident graphs stay in
+    memory; opening one more evicts the least recently used, and with
+    idle_timeout (seconds) graphs nobody touched for that long are
+    evicted too. Eviction checkpoints pending log records into the
+    graph's file, so an evicted graph reloads without any replay.
+
+    Every resident graph logs its edits (see Graph.enable_wal), so they
+    are durable after graph.sync() whether or not it is ever evicted.
+    All methods are safe to call from several threads; the graphs they
+    return are not. A graph handle is only valid while it is resident:
+    once evicted it no longer logs, so call get() again rather than
+    keeping references around.
+    """
+
+    def __init__(
+        self,
+        root_dir: str,
+        max_resident: int = 8,
+        idle_timeout: Optional[float] = None,
+        checkpoint_every: int = 1000,
+    ) -> None:
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+
+        self.root_dir = root_dir
+        self.max_resident = max_resident
+        self.idle_timeout = idle_timeout
+        self.checkpoint_every = checkpoint_every
+
+        self._resident: "OrderedDict[str, Graph]" = OrderedDict()   # LRU first
+        self._last_used = {}
+        self._lock = threading.RLock()
+        os.makedirs(root_dir, exist_ok=True)
+
+    # =====================================================================
+    # LOOKUP
+    # =====================================================================
+    def path_for(self, name: str) -> str:
+        if not name or name in (".", "..") or os.path.basename(name) != name:
+            raise ValueError(f"Invalid graph name: {name!r}")
+        return os.path.join(self.root_dir, name + GRAPH_SUFFIX)
+
+    def exists(self, name: str) -> bool:
+        path = self.path_for(name)
+        with self._lock:
+            return name in self._resident or os.path.exists(path) or os.path.exists(path + ".wal")
+
+    def names(self) -> List[str]:
+        """Every stored graph, resident or not, in name order."""
+        with self._lock:
+            found = set(self._resident)
+            for entry in os.listdir(self.root_dir):
+                for suffix in (GRAPH_SUFFIX, WAL_SUFFIX):
+                    if entry.endswith(suffix):
+                        found.add(entry[:-len(suffix)])
+            return sorted(found)
+
+    def resident(self) -> List[str]:
+        """Graphs currently in memory, least recently used first."""
+        with self._lock:
+            return list(self._resident)
+
+    def get(self, name: str, create: bool = False) -> Graph:
+        """
+        Return graph `name`, loading it from disk if it is not resident.
+
+        Raises KeyError for an unknown name unless create is set.
+        """
+        with self._lock:
+            self.evict_idle()
+
+            graph = self._resident.get(name)
+            if graph is not None:
+                self._resident.move_to_end(name)
+                self._last_used[name] = monotonic()
+                return graph
+
+            if not create and not self.exists(name):
+                raise KeyError(name)
+            return self._admit(name)
+
+    def create(self, name: str) -> Graph:
+        with self._lock:
+            if self.exists(name):
+                raise ValueError(f"Graph already exists: {name!r}")
+            return self._admit(name)
+
+    def _admit(self, name: str) -> Graph:
+        path = self.path_for(name)
+        graph = Graph()
+        graph.load(path)
+        if not os.path.exists(path):
+            graph.save()   # a new graph exists from the start, even if left empty
+        graph.enable_wal(checkpoint_every=self.checkpoint_every)
+
+        self._resident[name] = graph
+        self._last_used[name] = monotonic()
+        while len(self._resident) > self.max_resident:
+            self.evict(next(iter(self._resident)))
+        return graph
+
+    # =====================================================================
+    # EVICTION & DURABILITY
+    # =====================================================================
+    def evict(self, name: str) -> bool:
+        """
+        Checkpoint graph `name` and drop it from memory; False if not resident.
+
+        Handles returned by get() before this are closed (see Graph.close)
+        and must not be edited any more.
+        """
+        with self._lock:
+            graph = self._resident.pop(name, None)
+            if graph is None:
+                return False
+            del self._last_used[name]
+            graph.close()
+            return True
+
+    def evict_idle(self, now: Optional[float] = None) -> List[str]:
+        """Evict graphs unused for idle_timeout seconds; return their names."""
+        if self.idle_timeout is None:
+            return []
+
+        with self._lock:
+            now = monotonic() if now is None else now
+            idle = [n for n, t in self._last_used.items() if now - t >= self.idle_timeout]
+            for name in idle:
+                self.evict(name)
+            return idle
+
+    def flush(self) -> None:
+        """Checkpoint every resident graph (they stay resident)."""
+        with self._lock:
+            for graph in self._resident.values():
+                graph.save()
+
+    def close(self) -> None:
+        """Evict everything; the store stays usable afterwards."""
+        with self._lock:
+            for name in list(self._resident):
+                self.evict(name)
+
+    def drop(self, name: str) -> None:
+        """Forget graph `name` and delete its files."""
+        with self._lock:
+            graph = self._resident.pop(name, None)
+            self._last_used.pop(name, None)
+            if graph is not None and graph._wal is not None:
+                graph._wal.close()
+                graph._wal = None
+
+            path = self.path_for(name)
+            for file in (path, path + ".wal", cache_path(path)):
+                if os.path.exists(file):
+                    os.remove(file)
+
+    def __contains__(self, name: str) -> bool:
+        return self.exists(name)
+
+    def __enter__(self) -> "GraphStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -0,0 +1,93 @@
+# social_graph/wal.py
+
+import json
+import os
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .graph import Graph
+
+
+# Graph methods a log record may name, in the form [op, *args]
+REPLAYABLE_OPS = ("add_user", "add_friendship", "remove_friendship", "delete_user")
+
+
+class WriteAheadLog:
+    """
+    Append-only log of Graph mutations, one JSON record per line.
+
+    Records refer to users by name, so replaying a log on top of any
+    snapshot that already contains some of its effects converges to the
+    same final graph. A record cut short by a crash (the last line) is
+    ignored on replay.
+    """
+
+    def __init__(self, path: str, fsync: bool = False) -> None:
+        self.path = path
+        self.fsync = fsync
+        self.entries = 0            # records appended since the last checkpoint
+        self._file = None
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+    def append(self, op: str, *args) -> None:
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+
+        self._file.write(json.dumps([op, *args]) + "\n")
+        self._file.flush()
+        if self.fsync:
+            os.fsync(self._file.fileno())
+        self.entries += 1
+
+    def truncate(self) -> None:
+        """Forget every record (called once a full snapshot is on disk)."""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self.entries = 0
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+    def replay(self, graph: "Graph") -> int:
+        """Apply every logged mutation to `graph`; return how many ran."""
+        if not os.path.exists(self.path):
+            return 0
+
+        with open(self.path, "r", encoding="utf-8") as f:
+            lines = f.read().split("\n")
+
+        applied = 0
+        for lineno, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                op, *args = json.loads(line)
+            except ValueError:
+                if lineno == len(lines):
+                    # Torn final write from a crash: drop it so new
+                    # records do not get glued onto the partial line.
+                    self._rewrite(lines[:lineno - 1])
+                    break
+                raise ValueError(f"{self.path}:{lineno}: corrupt log record")
+
+            if op not in REPLAYABLE_OPS:
+                raise ValueError(f"{self.path}:{lineno}: unknown operation {op!r}")
+
+            getattr(graph, op)(*args)
+            applied += 1
+
+        self.entries = applied
+        return applied
+
+    def _rewrite(self, lines) -> None:
+        self.close()
+        with open(self.path, "w", encoding="utf-8") as f:
+            f.write("".join(line + "\n" for line in lines if line.strip()))
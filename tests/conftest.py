@@ -0,0 +1,17 @@
+import pytest
+
+from social_graph.graph import Graph
+
+
+@pytest.fixture
+def sample_graph():
+    """Small graph shared by the CSR, snapshot and recommendation tests."""
+    g = Graph()
+    g.add_friendship("Alice", "Bob")
+    g.add_friendship("Alice", "Charlie")
+    g.add_friendship("Bob", "David")
+    g.add_friendship("Charlie", "David")
+    g.add_friendship("Charlie", "Eve")
+    g.add_friendship("Eve", "Frank")
+    g.add_user("Zed")
+    return g
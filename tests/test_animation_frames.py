@@ -0,0 +1,41 @@
+import random
+
+import pytest
+
+from gui.animation_frames import plan_frames, ADAPTIVE_THRESHOLD
+from social_graph.bfs import bfs_shortest_path
+from social_graph.graph import Graph
+
+
+def test_short_orders_keep_one_node_per_frame():
+    ids = list(range(ADAPTIVE_THRESHOLD))
+    assert plan_frames(ids, [0] * len(ids)) == [[i] for i in ids]
+    assert plan_frames(ids, mode="budget", max_frames=7) == [ids[i:i + 9] for i in range(0, 60, 9)]
+
+    # Long orders: whole levels per frame, or a bounded number of frames
+    many = list(range(5000))
+    assert len(plan_frames(many, [i // 500 for i in many])) == 10
+    assert len(plan_frames(many)) <= 120
+
+    with pytest.raises(ValueError):
+        plan_frames(ids, mode="level")
+    with pytest.raises(ValueError):
+        plan_frames(ids, mode="fast")
+
+
+def test_bfs_frames_follow_levels():
+    rng = random.Random(5)
+    g = Graph.from_edge_list((f"U{rng.randrange(400)}", f"U{rng.randrange(400)}") for _ in range(1200))
+    users = sorted(g.get_all_users())
+    result = bfs_shortest_path(g, users[0], users[-1])
+
+    order = result.visited_order
+    frames = plan_frames(order, [result.distances[name] for name in order], mode="level")
+
+    assert [name for frame in frames for name in frame] == order
+    assert len(frames) == len({result.distances[name] for name in order})
+    for frame in frames:
+        assert len({result.distances[name] for name in frame}) == 1
+
+    budget = plan_frames(order, mode="budget", max_frames=10)
+    assert len(budget) <= 10 and [n for f in budget for n in f] == order
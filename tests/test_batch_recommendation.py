@@ -0,0 +1,49 @@
+import json
+import random
+
+import pytest
+
+from social_graph.batch_recommendation import JsonLinesSink, iter_recommendations, recommend_all
+from social_graph.graph import Graph
+from social_graph.recommendation import recommend_friends
+
+
+def _random_graph():
+    rng = random.Random(8)
+    g = Graph.from_edge_list((f"U{rng.randrange(80)}", f"U{rng.randrange(80)}") for _ in range(500))
+    g.delete_user("U7")   # tombstones must not show up anywhere
+    g.add_user("Loner")
+    return g
+
+
+@pytest.mark.parametrize("kwargs", [{}, {"max_fanout": 3}, {"workers": 2, "shard_size": 16}])
+def test_batch_matches_single_user_recommendations(kwargs):
+    g = _random_graph()
+    fanout = kwargs.get("max_fanout")
+
+    results = recommend_all(g, max_results=4, method="python", **kwargs)
+    assert list(results) == g.users_in_order()
+    for user, recs in results.items():
+        assert recs == recommend_friends(g, user, max_results=4, max_fanout=fanout)
+
+
+def test_sparse_method_matches_python():
+    pytest.importorskip("scipy")
+    g = _random_graph()
+    assert recommend_all(g, method="sparse") == recommend_all(g, method="python")
+
+
+def test_subset_and_json_lines_sink(tmp_path):
+    g = _random_graph()
+    path = tmp_path / "pymk.jsonl"
+
+    with JsonLinesSink(str(path)) as sink:
+        assert recommend_all(g.to_csr(), sink, users=["U3", "nobody", "U1"], method="python") == 2
+
+    lines = [json.loads(line) for line in path.read_text().splitlines()]
+    assert [line["user"] for line in lines] == ["U3", "U1"]
+    assert [tuple(rec) for rec in lines[0]["recommendations"]] == recommend_friends(g, "U3")
+
+    assert next(iter_recommendations(g, users=["Loner"])) == ("Loner", [])
+    with pytest.raises(ValueError):
+        recommend_all(g, method="sparse", max_fanout=2)
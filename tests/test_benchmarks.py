@@ -0,0 +1,36 @@
+from benchmarks.generators import GENERATORS, build_graph
+from benchmarks.harness import compare_results, percentile, run_benchmark
+from benchmarks.suite import run_suite
+
+
+def test_generators_are_seeded_and_in_range():
+    for generate in GENERATORS.values():
+        edges = list(generate(200, seed=7))
+        assert edges == list(generate(200, seed=7))
+        assert edges and all(0 <= u < 200 and 0 <= v < 200 and u != v for u, v in edges)
+
+
+def test_percentile_interpolates():
+    assert percentile([1.0, 2.0, 3.0, 4.0, 5.0], 50) == 3.0
+    assert percentile([0.0, 10.0], 95) == 9.5
+    assert percentile([], 99) == 0.0
+
+
+def test_run_benchmark_and_compare():
+    result = run_benchmark("noop", lambda i: i, {"n": 1}, runs=5, warmup=1)
+    assert len(result.samples_ms) == 5
+    assert result.key == "noop[n=1]"
+
+    before = {"a": {"p50_ms": 1.0}, "b": {"p50_ms": 1.0}}
+    after = {"a": {"p50_ms": 1.05}, "b": {"p50_ms": 1.5}}
+    assert [line.split(":")[0] for line in compare_results(before, after, 0.10)] == ["b"]
+
+
+def test_suite_smoke():
+    results = run_suite([60], ["ba"], runs=2, warmup=0, log=lambda *_: None)
+    names = {r.name for r in results}
+    assert {"bfs_shortest_path", "load_snapshot_mmap", "delete_user"} <= names
+    assert build_graph(3, [(0, 1)]).are_friends("User_0", "User_1")
+
+    small = run_suite([10], ["er"], runs=20, only=["delete_user"], log=lambda *_: None)
+    assert small == []                   # too few users to delete one per call
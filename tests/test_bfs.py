@@ -33,3 +33,127 @@ def test_bfs_same_node():
 
     result = bfs_shortest_path(g, "A", "A")
     assert result.path == ["A"]
+
+
+def test_bidirectional_matches_bfs_length():
+    import random
+    from social_graph.bfs import bidirectional_bfs_shortest_path
+
+    rng = random.Random(7)
+    g = Graph()
+    for i in range(60):
+        g.add_user(f"U{i}")
+    for _ in range(90):
+        g.add_friendship(f"U{rng.randrange(60)}", f"U{rng.randrange(60)}")
+
+    for _ in range(40):
+        s, t = f"U{rng.randrange(60)}", f"U{rng.randrange(60)}"
+        one_sided = bfs_shortest_path(g, s, t)
+        both = bidirectional_bfs_shortest_path(g, s, t)
+
+        assert len(both.path) == len(one_sided.path)
+        assert both.reachable == one_sided.reachable
+        for a, b in zip(both.path, both.path[1:]):
+            assert g.are_friends(a, b)
+
+
+def test_bidirectional_deterministic_tie_break():
+    g = Graph()
+    # Two equally short routes A-B-D and A-C-D
+    g.add_friendship("A", "C")
+    g.add_friendship("C", "D")
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "D")
+
+    result = bfs_shortest_path(g, "A", "D", bidirectional=True)
+    assert result.path == ["A", "B", "D"]
+    assert result.distances["D"] == 2
+    assert result.exploration_tree["D"] == "B"
+
+
+def _reference_bfs(g, start, target):
+    """The original dict-based BFS, for comparison."""
+    from collections import deque
+
+    queue, parent, dist, order = deque([start]), {start: None}, {start: 0}, []
+    while queue:
+        cur = queue.popleft()
+        order.append(cur)
+        if cur == target:
+            break
+        for nxt in g.get_friends(cur):
+            if nxt not in parent:
+                parent[nxt], dist[nxt] = cur, dist[cur] + 1
+                queue.append(nxt)
+    path = []
+    if target in parent:
+        node = target
+        while node is not None:
+            path.append(node)
+            node = parent[node]
+    return path[::-1], order, dist, parent
+
+
+def test_bfs_matches_reference_and_fields_load_lazily():
+    import random
+
+    rng = random.Random(2)
+    g = Graph.from_edge_list((f"U{rng.randrange(50)}", f"U{rng.randrange(50)}") for _ in range(70))
+
+    for _ in range(30):
+        s, t = f"U{rng.randrange(50)}", f"U{rng.randrange(50)}"
+        if s == t or not (g.has_user(s) and g.has_user(t)):
+            continue
+        path, order, dist, parent = _reference_bfs(g, s, t)
+
+        result = bfs_shortest_path(g, s, t)
+        assert result._distances is None          # nothing converted yet
+        assert result.path == path
+        assert result.visited_order == order
+        assert result.distances == dist
+        assert result.exploration_tree == parent
+        assert bfs_shortest_path(g, s, t, return_full_result=False) == path
+
+
+def test_multi_source_bfs_with_reused_buffers():
+    import pytest
+    from social_graph.bfs import BFSBuffers, multi_source_bfs
+
+    g = Graph.from_edge_list([("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("X", "Y")])
+    uid = g.get_user_id
+    buffers = BFSBuffers()
+
+    run = multi_source_bfs(g, [uid("A"), uid("E")], buffers=buffers)
+    assert [run.distance(uid(n)) for n in "ABCDE"] == [0, 1, 2, 1, 0]
+    assert run.distance(uid("X")) is None
+    assert run.path_to(uid("C")) == [uid("A"), uid("B"), uid("C")]
+
+    capped = multi_source_bfs(g, [uid("A")], max_depth=1, buffers=buffers)
+    assert sorted(capped.order) == [uid("A"), uid("B")]
+    assert capped.distance(uid("E")) is None      # stale stamps from the first run ignored
+    with pytest.raises(RuntimeError):
+        run.distance(uid("A"))                    # buffers now belong to `capped`
+
+    g.add_friendship("E", "Z")                    # buffers grow with the graph
+    assert multi_source_bfs(g.to_csr(), [uid("D")], buffers=buffers).distance(uid("Z")) == 2
+
+
+def test_progress_callback_can_cancel_bfs_and_recommendations():
+    import pytest
+    from social_graph.recommendation import recommend_by_score
+
+    g = Graph.from_edge_list(("Hub", f"L{i}") for i in range(10000))
+    g.add_friendship("X", "Y")
+
+    class Cancelled(Exception):
+        pass
+
+    def cancel(reached):
+        raise Cancelled
+
+    for bidirectional in (False, True):
+        assert bfs_shortest_path(g, "Hub", "Y", bidirectional=bidirectional, progress=lambda n: None).path == []
+        with pytest.raises(Cancelled):
+            bfs_shortest_path(g, "L0", "Y", bidirectional=bidirectional, progress=cancel)
+    with pytest.raises(Cancelled):
+        recommend_by_score(g, "L0", progress=cancel)
@@ -0,0 +1,94 @@
+import random
+
+from social_graph.graph import Graph
+
+
+def _reference_components(g):
+    seen, groups = set(), []
+    for user in g.get_all_users():
+        if user in seen:
+            continue
+        group, stack = [], [user]
+        seen.add(user)
+        while stack:
+            u = stack.pop()
+            group.append(u)
+            for v in g.get_friends(u):
+                if v not in seen:
+                    seen.add(v)
+                    stack.append(v)
+        groups.append(sorted(group))
+    return sorted(groups)
+
+
+def test_components_follow_additions():
+    g = Graph()
+    g.enable_components()
+    g.add_friendship("A", "B")
+    g.add_friendship("C", "D")
+    g.add_user("E")
+
+    assert g.component_count() == 3
+    assert g.component_size("A") == 2
+    assert not g.same_component("A", "C")
+
+    g.add_friendship("B", "C")
+    assert g.component_count() == 2
+    assert g.component_size("D") == 4
+    assert g.same_component("A", "D")
+
+
+def test_components_split_on_removal_and_delete():
+    g = Graph()
+    for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E")]:
+        g.add_friendship(a, b)
+    assert g.component_count() == 1
+
+    g.remove_friendship("B", "C")
+    assert g.component_count() == 2
+    assert g.component_size("A") == 2
+
+    g.delete_user("D")
+    assert g.component_count() == 3
+    assert g.component_size("C") == 1
+    assert sorted(map(sorted, g.communities())) == [["A", "B"], ["C"], ["E"]]
+
+
+def test_components_random_churn():
+    rng = random.Random(11)
+    names = [f"U{i}" for i in range(50)]
+    g = Graph()
+    g.enable_components()
+
+    for step in range(600):
+        action = rng.random()
+        if action < 0.6:
+            g.add_friendship(rng.choice(names), rng.choice(names))
+        elif action < 0.9:
+            g.remove_friendship(rng.choice(names), rng.choice(names))
+        else:
+            g.delete_user(rng.choice(names))
+
+        if step % 25 == 0:
+            expected = _reference_components(g)
+            assert g.component_count() == len(expected)
+            assert sorted(map(sorted, g.communities())) == expected
+            for group in expected:
+                assert g.component_size(group[0]) == len(group)
+
+
+def test_connected_components_of_a_snapshot():
+    from social_graph.components import PROGRESS_STEPS, connected_components
+
+    rng = random.Random(4)
+    g = Graph.from_edge_list((f"U{rng.randrange(9000)}", f"U{rng.randrange(9000)}") for _ in range(4000))
+    g.delete_user("U1")
+    csr = g.to_csr()
+
+    groups = [sorted(map(csr.get_user_name, group)) for group in connected_components(csr)]
+    assert sorted(groups) == _reference_components(g)
+    assert g._components is None          # nothing installed on the live graph
+
+    calls = []
+    connected_components(csr, progress=calls.append)
+    assert calls == list(range(PROGRESS_STEPS, csr.id_capacity(), PROGRESS_STEPS))
@@ -0,0 +1,49 @@
+from social_graph.graph import Graph
+from social_graph.csr import CSRGraph
+from social_graph.bfs import bfs_shortest_path
+from social_graph.dfs_iterative import dfs_iterative
+from social_graph.recommendation import recommend_friends
+
+
+def test_csr_preserves_structure(sample_graph):
+    g = sample_graph
+    csr = g.to_csr()
+
+    assert isinstance(csr, CSRGraph)
+    assert csr.user_count() == g.user_count() == 7
+    assert csr.edge_count() == g.edge_count() == 6
+    for name in ("Alice", "Charlie", "Zed", "Nobody"):
+        assert csr.degree(name) == g.degree(name)
+    assert csr.adjacency_list() == g.adjacency_list()
+    assert csr.are_friends("Alice", "Bob")
+    assert not csr.are_friends("Alice", "Eve")
+    assert csr.get_friends("Zed") == []
+
+
+def test_csr_rows_are_name_ordered():
+    g = Graph()
+    g.add_friendship("A", "D")
+    g.add_friendship("A", "B")
+    g.add_friendship("A", "C")
+
+    csr = g.to_csr()
+    row = csr.get_neighbors(csr.get_user_id("A"))
+    assert [csr.get_user_name(n) for n in row] == ["B", "C", "D"]
+
+
+def test_algorithms_accept_csr(sample_graph):
+    g = sample_graph
+    csr = g.to_csr()
+
+    assert bfs_shortest_path(csr, "Alice", "Eve").path == bfs_shortest_path(g, "Alice", "Eve").path
+    assert dfs_iterative(csr, "Alice") == dfs_iterative(g, "Alice")
+    assert recommend_friends(csr, "Alice") == recommend_friends(g, "Alice")
+
+
+def test_csr_round_trip(sample_graph):
+    g = sample_graph
+    thawed = g.to_csr().to_graph()
+
+    assert thawed.adjacency_list() == g.adjacency_list()
+    thawed.add_friendship("Zed", "Alice")
+    assert thawed.are_friends("Alice", "Zed")
@@ -133,3 +133,120 @@ def test_dfs_timestamp_rules():
 
     # first node visited must have smallest tin
     assert tin["A"] == min(tin.values())
+
+
+# ------------------------------------------------------------------
+# Non-deterministic fast path still visits the same nodes
+# ------------------------------------------------------------------
+def test_dfs_unordered_fast_path():
+    from social_graph.dfs_iterative import dfs_iterative
+
+    g = Graph()
+    g.add_friendship("A", "C")
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "D")
+    g.add_user("E")
+
+    assert dfs_iterative(g, "A") == ["A", "B", "D", "C"]
+    assert sorted(dfs_iterative(g, "A", deterministic=False)) == ["A", "B", "C", "D"]
+    fast = dfs_traversal(g, "A", deterministic=False)
+    assert sorted(fast.order) == ["A", "B", "C", "D"]
+
+
+# ------------------------------------------------------------------
+# Bounded DFS path search
+# ------------------------------------------------------------------
+def test_dfs_shortest_path_prefers_short_route():
+    from social_graph.dfs import dfs_shortest_path
+
+    g = Graph()
+    # DFS meets the long route A-B-C-D-E first; the shortcut A-Z-E wins
+    for a, b in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("A", "Z"), ("Z", "E")]:
+        g.add_friendship(a, b)
+
+    result = dfs_shortest_path(g, "A", "E")
+
+    assert result.path == ["A", "Z", "E"]
+    assert result.visited_order[:2] == ["A", "B"]
+    assert result.distances == {"A": 0, "Z": 1, "E": 2}
+    assert dfs_shortest_path(g, "A", "E", max_depth=1).path == []
+
+
+def test_dfs_shortest_path_dense_graph_is_fast():
+    from social_graph.bfs import bfs_shortest_path
+    from social_graph.dfs import dfs_shortest_path
+
+    g = Graph()
+    n = 120
+    for i in range(n):
+        for j in range(i + 1, n):
+            if (i * 7 + j * 13) % 5 == 0:
+                g.add_friendship(f"U{i}", f"U{j}")
+    g.add_user("Lonely")
+
+    result = dfs_shortest_path(g, "U0", f"U{n - 1}")
+    assert len(result.path) == len(bfs_shortest_path(g, "U0", f"U{n - 1}").path)
+    assert dfs_shortest_path(g, "U0", "Lonely").path == []
+
+
+def test_dfs_shortest_path_progress_can_abort():
+    from social_graph.dfs import dfs_shortest_path, PROGRESS_STEPS
+
+    # A wide star with the target in another component: one iteration
+    # expands every leaf, then stops (nothing was cut off by the limit)
+    g = Graph()
+    for i in range(PROGRESS_STEPS * 2):
+        g.add_friendship("Hub", f"U{i:05d}")
+    g.add_friendship("X", "Y")
+
+    reached = []
+    result = dfs_shortest_path(g, "Hub", "Nobody", progress=reached.append)
+    assert result.path == [] and reached == []   # unknown target: no search
+
+    assert dfs_shortest_path(g, "Hub", "Y", progress=reached.append).path == []
+    assert reached and reached == sorted(reached)
+
+    class Stop(Exception):
+        pass
+
+    def stop(_):
+        raise Stop()
+
+    with pytest.raises(Stop):
+        dfs_shortest_path(g, "Hub", "Y", progress=stop)
+
+
+def test_dfs_shortest_path_matches_bfs_on_random_graphs():
+    import random
+    from social_graph.bfs import bfs_shortest_path
+    from social_graph.dfs import dfs_shortest_path
+
+    rng = random.Random(11)
+    g = Graph.from_edge_list((f"U{rng.randrange(2000)}", f"U{rng.randrange(2000)}") for _ in range(3000))
+    users = sorted(g.get_all_users())
+    for _ in range(20):
+        a, b = rng.choice(users), rng.choice(users)
+        result = dfs_shortest_path(g, a, b)
+        expected = bfs_shortest_path(g, a, b).path
+        assert len(result.path) == len(expected)
+        if result.path:
+            assert result.path[0] == a and result.path[-1] == b
+            assert all(g.are_friends(u, v) for u, v in zip(result.path, result.path[1:]))
+            assert result.visited_order[0] == a and b in result.visited_order
+
+
+# ------------------------------------------------------------------
+# Long chains no longer hit the recursion limit
+# ------------------------------------------------------------------
+def test_dfs_long_chain():
+    g = Graph()
+    n = sys.getrecursionlimit() * 3
+    for i in range(n - 1):
+        g.add_friendship(f"U{i:06d}", f"U{i + 1:06d}")
+
+    result = dfs_traversal(g, "U000000")
+
+    assert len(result.order) == n
+    assert result.depth[f"U{n - 1:06d}"] == n - 1
+    assert result.tin["U000000"] == 1
+    assert result.tout["U000000"] == 2 * n
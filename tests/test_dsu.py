@@ -0,0 +1,54 @@
+from array import array
+
+import pytest
+
+from social_graph.dsu import DSU
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_union_and_find(compact):
+    dsu = DSU(5, compact=compact)
+    dsu.union(0, 1)
+    dsu.union(3, 4)
+
+    assert dsu.find(0) == dsu.find(1)
+    assert dsu.find(3) == dsu.find(4)
+    assert dsu.find(0) != dsu.find(3)
+    assert sorted(map(sorted, dsu.get_components().values())) == [[0, 1], [2], [3, 4]]
+
+
+def test_find_grows_capacity():
+    dsu = DSU()
+    assert dsu.find(7) == 7
+    assert len(dsu.parent) == 8
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_deep_chain_has_no_recursion_limit(compact):
+    n = 50_000
+    dsu = DSU(n, compact=compact)
+    # Link by hand into one long chain, as an uncompressed tree could be
+    for i in range(1, n):
+        dsu.parent[i] = i - 1
+
+    assert dsu.find(n - 1) == 0
+
+
+def test_union_edges_matches_union():
+    edges = [0, 1, 1, 2, 5, 6, 2, 0, 8, 9, 6, 7]
+
+    bulk = DSU()
+    merges = bulk.union_edges(array("i", edges))
+
+    single = DSU()
+    for u, v in zip(edges[::2], edges[1::2]):
+        single.union(u, v)
+
+    assert merges == 5   # 2-0 closes a cycle
+    assert sorted(map(sorted, bulk.get_components().values())) == \
+        sorted(map(sorted, single.get_components().values()))
+
+
+def test_union_edges_rejects_odd_length():
+    with pytest.raises(ValueError):
+        DSU(3).union_edges([0, 1, 2])
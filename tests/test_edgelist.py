@@ -0,0 +1,55 @@
+import gzip
+
+import pytest
+
+from social_graph.edgelist import (
+    EdgeListError, detect_format, load_edge_list, read_edge_list, write_edge_list,
+)
+from social_graph.graph import Graph
+
+
+def _sample():
+    return Graph.from_edge_list([("Ann", "Bob"), ("Bob", "Cy"), ("Ann", "Cy"), ("Cy", "Dee")])
+
+
+@pytest.mark.parametrize("name", ["g.csv", "g.tsv", "g.txt", "g.csv.gz", "g.edges.gz"])
+def test_round_trip(tmp_path, name):
+    g = _sample()
+    path = str(tmp_path / name)
+    assert write_edge_list(g, path, header=True) == 4
+
+    restored = Graph()
+    added = load_edge_list(restored, path, skip_header=detect_format(path) != "snap", chunk_size=3)
+    assert added == 4
+    assert restored.adjacency_list() == g.adjacency_list()
+
+
+def test_snap_comments_extra_columns_and_progress(tmp_path):
+    path = tmp_path / "web.txt.gz"
+    with gzip.open(path, "wt") as f:
+        f.write("# Directed graph\n# FromNodeId\tToNodeId\n")
+        f.write("1\t2\n2 1\n\n3\t4\t0.5\n5 5\n")
+
+    assert list(read_edge_list(str(path))) == [("1", "2"), ("2", "1"), ("3", "4"), ("5", "5")]
+
+    calls = []
+    g = Graph()
+    assert load_edge_list(g, str(path), chunk_size=2, progress=lambda *a: calls.append(a)) == 2
+    assert [c[0] for c in calls] == [2, 4]
+    assert calls[-1][1] == calls[-1][2] == path.stat().st_size
+
+
+def test_malformed_input_and_unwritable_names(tmp_path):
+    path = tmp_path / "bad.csv"
+    path.write_text("a,b\nlonely\n")
+    with pytest.raises(EdgeListError, match="bad.csv:2"):
+        load_edge_list(Graph(), str(path))
+
+    g = Graph.from_edge_list([("Ann Lee", "Bob")])
+    with pytest.raises(EdgeListError):
+        write_edge_list(g, str(tmp_path / "g.txt"))
+    assert not (tmp_path / "g.txt").exists()
+    assert not (tmp_path / "g.txt.tmp").exists()
+
+    write_edge_list(g, str(tmp_path / "g.csv"))
+    assert list(read_edge_list(str(tmp_path / "g.csv"))) == [("Ann Lee", "Bob")]
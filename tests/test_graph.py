@@ -12,3 +12,171 @@ def test():
 
 if __name__ == "__main__":
     test()
+
+
+def test_delete_user_keeps_other_ids_stable():
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "C")
+    g.add_friendship("C", "D")
+    ids_before = {u: g.get_user_id(u) for u in ("A", "C", "D")}
+
+    g.delete_user("B")
+
+    assert not g.has_user("B")
+    assert g.get_friends("A") == []
+    assert g.get_friends("C") == ["D"]
+    assert {u: g.get_user_id(u) for u in ("A", "C", "D")} == ids_before
+    assert g.get_user_name(ids_before["D"]) == "D"
+    assert g.tombstone_count() == 1
+    assert g.users_in_order() == ["A", "C", "D"]
+    assert len(g.adjacency_matrix()) == 3
+
+
+def test_compact_reclaims_tombstones():
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "C")
+    g.add_friendship("A", "C")
+
+    g.delete_user("A", compact=True)
+
+    assert g.tombstone_count() == 0
+    assert g.id_capacity() == 2
+    assert g.users_in_order() == ["B", "C"]
+    assert g.get_user_id("B") == 0
+    assert g.are_friends("B", "C")
+
+
+def test_sorted_neighbor_index_tracks_mutations():
+    import random
+
+    rng = random.Random(3)
+    names = [f"user{rng.randrange(1000):03d}" for _ in range(40)]
+    g = Graph()
+    for _ in range(150):
+        g.add_friendship(rng.choice(names), rng.choice(names))
+    for _ in range(40):
+        g.remove_friendship(rng.choice(names), rng.choice(names))
+    for name in rng.sample(sorted(set(names)), 5):
+        g.delete_user(name)
+
+    for user in g.get_all_users():
+        uid = g.get_user_id(user)
+        expected = sorted(g.get_neighbors(uid), key=g.get_user_name)
+        assert g.get_sorted_neighbors(uid) == expected
+
+
+def test_edge_count_and_sparse_views():
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_friendship("B", "C")
+    g.add_friendship("C", "D")
+    g.add_friendship("A", "B")      # duplicate
+    assert g.edge_count() == 3
+
+    g.delete_user("B")              # tombstone shifts later positions
+    assert g.edge_count() == 1
+
+    dense = g.adjacency_matrix()
+    assert dense == [[0, 0, 0], [0, 0, 1], [0, 1, 0]]
+    assert g.adjacency_matrix_window(1, 3, 2, 3) == [[1], [0]]
+
+    rows, cols = g.adjacency_coo()
+    assert sorted(zip(rows, cols)) == [(1, 2), (2, 1)]
+    assert g.print_adjacency_matrix(max_users=2).count("\n") == 3
+
+
+def test_degree_index_stats():
+    import random
+
+    rng = random.Random(5)
+    names = [f"U{i}" for i in range(30)]
+    g = Graph()
+    for name in names:
+        g.add_user(name)
+
+    for _ in range(300):
+        action = rng.random()
+        if action < 0.6:
+            g.add_friendship(rng.choice(names), rng.choice(names))
+        elif action < 0.9:
+            g.remove_friendship(rng.choice(names), rng.choice(names))
+        else:
+            g.delete_user(rng.choice(names))
+
+        users = g.get_all_users()
+        degrees = [g.degree(u) for u in users]
+        stats = g.stats()
+        assert stats.users == len(users)
+        assert stats.friendships == sum(degrees) // 2
+        assert stats.max_degree == max(degrees, default=0)
+        assert stats.isolated == degrees.count(0)
+        assert sum(stats.degree_histogram.values()) == len(users)
+        assert g.isolated_users() == sorted(u for u in users if g.degree(u) == 0)
+
+
+def test_bulk_ingestion_matches_incremental():
+    import random
+
+    rng = random.Random(11)
+    pairs = [(f"U{rng.randrange(40)}", f"U{rng.randrange(40)}") for _ in range(400)]
+    pairs += [(" U1 ", "U2"), ("", "U3"), ("U4", "U4")]
+
+    one_by_one = Graph()
+    one_by_one.add_user("Lonely")
+    for u, v in pairs:
+        if u.strip() and v.strip():
+            one_by_one.add_friendship(u.strip(), v.strip())
+
+    bulk = Graph()
+    bulk.add_user("Lonely")
+    bulk.add_friendship("U1", "U2")
+    comps = bulk.enable_components()
+    added = bulk.add_friendships_bulk(iter(pairs))
+
+    assert added == one_by_one.edge_count() - 1
+    assert bulk.adjacency_list() == one_by_one.adjacency_list()
+    assert bulk.stats().to_dict() == one_by_one.stats().to_dict()
+    for name in bulk.get_all_users():
+        uid = bulk.get_user_id(name)
+        assert [bulk.get_user_name(n) for n in bulk.get_sorted_neighbors(uid)] == sorted(bulk.get_friends(name))
+    assert comps.count() == one_by_one.component_count()
+
+    built = Graph.from_edge_list(iter([("A", "B"), ("B", "A")]), users=["Z", "A"])
+    assert built.users_in_order() == ["Z", "A", "B"]
+    assert built.edge_count() == 1
+
+
+def test_bulk_skips_bad_pairs_without_creating_users():
+    g = Graph()
+    assert g.add_friendships_bulk([("X", "X"), ("Y", "  "), ("  ", "Z"), (" W ", "W")]) == 0
+    assert g.get_all_users() == []
+
+    g.add_friendship("X", "X")
+    assert g.get_all_users() == []
+
+
+def test_mutation_events():
+    g = Graph()
+    events = []
+    listener = g.subscribe(lambda *event: events.append(event))
+
+    g.add_friendship("A", "B")
+    g.add_friendships_bulk([("B", "C"), ("A", "B")])
+    g.remove_friendship("A", "B")
+    g.delete_user("B")
+    g.compact()
+
+    a, b, c = 0, 1, 2
+    assert events == [
+        ("add_user", a), ("add_user", b), ("add_friendship", a, b),
+        ("add_user", c), ("add_friendship", b, c),
+        ("remove_friendship", a, b),
+        ("delete_user", b, {c}),
+        ("reset",),
+    ]
+
+    g.unsubscribe(listener)
+    g.add_user("D")
+    assert len(events) == 8
@@ -0,0 +1,109 @@
+import math
+import random
+
+import pytest
+
+from social_graph.graph import Graph
+from social_graph.layout import (
+    CircleLayout, ForceDirectedLayout, get_layout, layout_input, fingerprint,
+    cache_path, save_cached_layout, load_cached_layout, _BHTree,
+    _python_step, _numpy_step, _numpy_repulsion,
+)
+
+
+def _two_cliques():
+    pairs = [(f"A{i}", f"A{j}") for i in range(6) for j in range(i + 1, 6)]
+    pairs += [(f"B{i}", f"B{j}") for i in range(6) for j in range(i + 1, 6)]
+    pairs.append(("A0", "B0"))
+    return Graph.from_edge_list(pairs)
+
+
+def test_circle_layout_and_registry():
+    names, edges = layout_input(_two_cliques())
+    positions = get_layout("circle", center=(0, 0), min_radius=200).compute(names, edges)
+    assert set(positions) == set(names)
+    assert all(math.isclose(math.hypot(x, y), 200) for x, y in positions.values())
+
+    with pytest.raises(ValueError):
+        get_layout("spiral")
+
+
+def test_barnes_hut_matches_exact_repulsion():
+    rng = random.Random(3)
+    xs = [rng.uniform(0, 100) for _ in range(300)]
+    ys = [rng.uniform(0, 100) for _ in range(300)]
+    tree = _BHTree(xs, ys)
+
+    for i in (0, 17, 299):
+        exact = [0.0, 0.0]
+        for p in range(300):
+            if p != i:
+                dx, dy = xs[i] - xs[p], ys[i] - ys[p]
+                exact[0] += dx / (dx * dx + dy * dy)
+                exact[1] += dy / (dx * dx + dy * dy)
+        assert tree.repulsion(i, 1.0, 0.0) == pytest.approx(exact)
+        approx = tree.repulsion(i, 1.0, 0.7)
+        assert math.hypot(approx[0] - exact[0], approx[1] - exact[1]) < 0.1 * math.hypot(*exact)
+
+
+def test_numpy_kernel_matches_python_kernel():
+    np = pytest.importorskip("numpy")
+
+    rng = random.Random(8)
+    xs = [rng.uniform(-300, 300) for _ in range(400)]
+    ys = [rng.uniform(-300, 300) for _ in range(400)]
+    pos = np.column_stack([xs, ys])
+    edges = [(rng.randrange(400), rng.randrange(400)) for _ in range(600)]
+    edges = [(i, j) for i, j in edges if i != j]
+
+    # theta=0 opens every cell, so both kernels compute exact forces
+    tree = _BHTree(xs, ys)
+    exact = np.array([tree.repulsion(i, 50.0 ** 2, 0.0) for i in range(400)])
+    assert np.allclose(_numpy_repulsion(pos, 50.0 ** 2, 0.0), exact)
+
+    approx = _numpy_repulsion(pos, 50.0 ** 2, 0.7)
+    error = np.sqrt(((approx - exact) ** 2).sum(axis=1)) / np.sqrt((exact ** 2).sum(axis=1))
+    assert np.median(error) < 0.05
+
+    py_xs, py_ys = _python_step((list(xs), list(ys)), edges, 50.0, 0.0, 0.05, 10.0)
+    stepped = _numpy_step(pos, np.array(edges).reshape(-1, 2), 50.0, 0.0, 0.05, 10.0)
+    assert np.allclose(stepped, np.column_stack([py_xs, py_ys]))
+
+
+def test_force_layout_separates_communities():
+    names, edges = layout_input(_two_cliques())
+    layout = ForceDirectedLayout(iterations=120, use_numpy=False)
+    frames = list(layout.iterate(names, edges))
+    assert len(frames) == 120 // layout.yield_every
+    final = frames[-1]
+    assert final == layout.compute(names, edges)   # seeded, so reproducible
+
+    def centroid(prefix):
+        pts = [final[n] for n in names if n.startswith(prefix)]
+        return sum(p[0] for p in pts) / len(pts), sum(p[1] for p in pts) / len(pts)
+
+    def spread(prefix):
+        cx, cy = centroid(prefix)
+        return max(math.hypot(final[n][0] - cx, final[n][1] - cy) for n in names if n.startswith(prefix))
+
+    gap = math.dist(centroid("A"), centroid("B"))
+    assert gap > spread("A") and gap > spread("B")
+
+
+def test_layout_cache_round_trip(tmp_path):
+    g = _two_cliques()
+    names, edges = layout_input(g)
+    layout = CircleLayout()
+    positions = layout.compute(names, edges)
+
+    path = cache_path(str(tmp_path / "graph.sgs"))
+    assert load_cached_layout(path) is None
+    save_cached_layout(path, layout, fingerprint(names, edges), positions)
+
+    cached = load_cached_layout(path)
+    assert cached["layout"] == "circle" and cached["params"] == layout.params()
+    assert cached["positions"] == positions
+    assert cached["fingerprint"] == fingerprint(*layout_input(g))
+
+    g.add_friendship("A1", "B1")
+    assert cached["fingerprint"] != fingerprint(*layout_input(g))
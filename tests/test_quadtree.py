@@ -0,0 +1,43 @@
+import random
+
+from gui.quadtree import QuadTree
+
+
+def test_query_matches_brute_force_and_root_grows():
+    rng = random.Random(4)
+    points = {i: (rng.uniform(-500, 1500), rng.uniform(-500, 1500)) for i in range(2000)}
+    points[2000] = points[2001] = (10.0, 10.0)          # duplicates are fine
+
+    tree = QuadTree((0, 0, 100, 100), capacity=8)
+    for item, (x, y) in points.items():
+        tree.insert(item, x, y)
+    assert len(tree) == len(points)
+
+    for _ in range(50):
+        x0, y0 = rng.uniform(-600, 1500), rng.uniform(-600, 1500)
+        rect = (x0, y0, x0 + rng.uniform(0, 800), y0 + rng.uniform(0, 800))
+        expected = {i for i, (x, y) in points.items() if rect[0] <= x <= rect[2] and rect[1] <= y <= rect[3]}
+        assert set(tree.query(rect)) == expected
+
+
+def test_nearest_and_remove():
+    tree = QuadTree((0, 0, 10, 10), capacity=2)
+    for item, (x, y) in {"a": (1, 1), "b": (5, 5), "c": (9, 9), "d": (5.5, 5)}.items():
+        tree.insert(item, x, y)
+
+    assert tree.nearest(5.4, 5.1, 2) == "d"
+    assert tree.nearest(3, 3, 1) is None
+
+    assert tree.remove("d", 5.5, 5)
+    assert not tree.remove("d", 5.5, 5)
+    assert tree.nearest(5.4, 5.1, 2) == "b"
+    assert len(tree) == 3
+    assert sorted(tree.query((0, 0, 10, 10))) == ["a", "b", "c"]
+
+
+def test_remove_after_root_growth_on_boundary():
+    tree = QuadTree((0, 0, 10, 10), capacity=1)
+    tree.insert("edge", 0, 0)
+    tree.insert("far", -25, 40)
+    assert tree.remove("edge", 0, 0)
+    assert tree.query((-100, -100, 100, 100)) == ["far"]
@@ -0,0 +1,54 @@
+from social_graph.graph import Graph
+from social_graph.bfs import bfs_shortest_path
+from social_graph.recommendation import recommend_friends, recommend_by_score
+
+
+def test_recommend_friends_mutual_counts(sample_graph):
+    g = sample_graph
+    assert recommend_friends(g, "Alice") == [("David", 2), ("Eve", 1)]
+
+
+def test_recommend_by_score_matches_per_candidate_bfs(sample_graph):
+    g = sample_graph
+    friends = set(g.get_friends("Alice"))
+
+    expected = []
+    for other in set(g.get_all_users()) - friends - {"Alice"}:
+        mutual = len(friends.intersection(g.get_friends(other)))
+        distance = bfs_shortest_path(g, "Alice", other).distances.get(other)
+        distance_score = 0 if distance is None else 1 / (1 + distance)
+        expected.append((other, mutual * 0.7 + distance_score * 0.3, mutual, distance))
+    expected.sort(key=lambda x: (-x[1], x[0]))
+
+    assert recommend_by_score(g, "Alice") == expected
+    assert recommend_by_score(g, "Alice", max_results=1) == expected[:1]
+
+
+def test_recommend_by_score_max_hops(sample_graph):
+    g = sample_graph
+
+    names = [rec[0] for rec in recommend_by_score(g, "Alice", max_hops=2)]
+    assert names == ["David", "Eve"]
+
+
+def test_recommend_friends_matches_name_based_counting():
+    import random
+    from collections import Counter
+
+    rng = random.Random(3)
+    g = Graph.from_edge_list((f"U{rng.randrange(60)}", f"U{rng.randrange(60)}") for _ in range(400))
+
+    for user in g.get_all_users():
+        friends = set(g.get_friends(user))
+        counts = Counter(c for f in friends for c in g.get_friends(f) if c != user and c not in friends)
+        expected = sorted(counts.items(), key=lambda item: (-item[1], item[0]))
+        for k in (1, 3, 50):
+            assert recommend_friends(g, user, max_results=k) == expected[:k]
+        assert recommend_friends(g.to_csr(), user, max_results=3) == expected[:3]
+
+
+def test_recommend_friends_fanout_cap(sample_graph):
+    g = sample_graph
+    # Charlie's friends in name order are Alice, David, Eve: a cap of 2 never reaches Eve
+    assert recommend_friends(g, "Alice", max_fanout=2) == [("David", 2)]
+    assert recommend_friends(g, "Alice", max_results=0) == []
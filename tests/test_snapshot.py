@@ -0,0 +1,57 @@
+import pytest
+
+from social_graph.bfs import bfs_shortest_path
+from social_graph.snapshot import (
+    SnapshotError, load_snapshot, load_snapshot_graph, save_snapshot,
+)
+
+
+@pytest.mark.parametrize("use_mmap", [True, False])
+def test_snapshot_round_trip(tmp_path, use_mmap, sample_graph):
+    g = sample_graph
+    g.add_friendship("Zed", "Chloé")      # names are stored as UTF-8
+    path = str(tmp_path / "graph.sgs")
+    save_snapshot(g, path)
+
+    csr = load_snapshot(path, use_mmap=use_mmap)
+
+    assert csr.adjacency_list() == g.adjacency_list()
+    assert csr.edge_count() == 7
+    assert bfs_shortest_path(csr, "Alice", "Eve").path == bfs_shortest_path(g, "Alice", "Eve").path
+
+
+def test_mapped_snapshot_can_be_closed(tmp_path, sample_graph):
+    g = sample_graph
+    path = str(tmp_path / "graph.sgs")
+    save_snapshot(g, path)
+
+    with load_snapshot(path) as csr:
+        assert csr.adjacency_list() == g.adjacency_list()
+    with pytest.raises(ValueError):
+        csr.get_neighbors(0)              # the mapping is gone
+
+    csr.close()                           # closing twice is harmless
+    load_snapshot(path, use_mmap=False).close()
+
+
+def test_snapshot_keeps_tombstones(tmp_path, sample_graph):
+    g = sample_graph
+    eve_id = g.get_user_id("Eve")
+    g.delete_user("Bob")
+    path = str(tmp_path / "graph.sgs")
+    save_snapshot(g, path)
+
+    loaded = load_snapshot_graph(path)
+
+    assert not loaded.has_user("Bob")
+    assert loaded.get_user_id("Eve") == eve_id
+    assert loaded.tombstone_count() == 1
+    assert loaded.adjacency_list() == g.adjacency_list()
+
+
+def test_snapshot_rejects_foreign_file(tmp_path):
+    path = tmp_path / "graph.sgs"
+    path.write_bytes(b"{" + b"\0" * 64)
+
+    with pytest.raises(SnapshotError):
+        load_snapshot(str(path))
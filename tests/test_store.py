@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from social_graph.store import GraphStore
+
+
+def test_lazy_load_and_lru_eviction(tmp_path):
+    store = GraphStore(str(tmp_path), max_resident=2)
+    for name in ("eu", "us", "apac"):
+        store.create(name).add_friendship(f"{name}-1", f"{name}-2")
+
+    assert store.resident() == ["us", "apac"]            # "eu" evicted first
+    assert os.path.exists(tmp_path / "eu.sgs")
+    assert not os.path.exists(tmp_path / "eu.sgs.wal")  # checkpointed on evict
+
+    eu = store.get("eu")                                 # reloaded on demand
+    assert eu.are_friends("eu-1", "eu-2")
+    assert store.resident() == ["apac", "eu"]
+    assert store.names() == ["apac", "eu", "us"]
+
+    with pytest.raises(KeyError):
+        store.get("latam")
+    with pytest.raises(ValueError):
+        store.create("eu")
+    with pytest.raises(ValueError):
+        store.get("../escape", create=True)
+
+
+def test_idle_eviction_flush_and_drop(tmp_path):
+    store = GraphStore(str(tmp_path), idle_timeout=60)
+    g = store.get("eu", create=True)
+    g.add_user("Solo")
+    g.sync()                                             # logged, not yet saved
+
+    assert store.evict_idle(now=0) == []
+    assert store.evict_idle(now=float("inf")) == ["eu"]
+    assert store.get("eu").has_user("Solo")
+
+    store.flush()
+    assert os.path.exists(tmp_path / "eu.sgs")
+
+    store.drop("eu")
+    assert "eu" not in store
+    assert os.listdir(tmp_path) == []
+
+
+def test_new_empty_graph_survives_eviction(tmp_path):
+    store = GraphStore(str(tmp_path), max_resident=1)
+    store.create("empty")
+    store.create("other")
+    assert store.get("empty").user_count() == 0
+
+
+def test_evicted_handle_stops_logging(tmp_path):
+    store = GraphStore(str(tmp_path), max_resident=1)
+    a = store.get("eu", create=True)
+    a.add_user("Real")
+    store.get("us", create=True)                         # evicts "eu"
+
+    a.add_user("ghost")                                  # stale handle
+    assert not os.path.exists(tmp_path / "eu.sgs.wal")
+    eu = store.get("eu")
+    assert eu.has_user("Real") and not eu.has_user("ghost")
+
+
+def test_layout_cache_is_not_a_graph(tmp_path):
+    from social_graph.layout import CircleLayout, cache_path, save_cached_layout
+
+    store = GraphStore(str(tmp_path))
+    g = store.get("eu", create=True)
+    g.add_friendship("A", "B")
+    save_cached_layout(cache_path(g.path), CircleLayout(), "digest", {"A": (0, 0), "B": (1, 0)})
+    store.flush()
+
+    assert store.names() == ["eu"]
+    store.drop("eu")
+    assert os.listdir(tmp_path) == []
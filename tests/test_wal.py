@@ -0,0 +1,169 @@
+import os
+
+from social_graph.graph import GRAPH_FILE, WAL_FILE, Graph
+
+
+def test_edits_are_logged_and_replayed(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.save()
+
+    g.enable_wal(checkpoint_every=100)
+    g.add_friendship("B", "C")
+    g.add_user("D")
+    g.remove_friendship("A", "B")
+    g.delete_user("C")
+    g.sync()                          # below the threshold → log only
+
+    with open(WAL_FILE) as f:
+        assert len(f.read().splitlines()) == 5
+
+    restored = Graph()
+    restored.load()
+    assert restored.adjacency_list() == g.adjacency_list()
+    assert restored.tombstone_count() == 1
+
+
+def test_checkpoint_truncates_log(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    g = Graph()
+    g.enable_wal(checkpoint_every=2)
+    g.add_user("A")
+    g.sync()
+    assert os.path.exists(WAL_FILE)
+    assert not os.path.exists(GRAPH_FILE)
+
+    g.add_user("B")
+    g.sync()
+    assert not os.path.exists(WAL_FILE)
+
+    restored = Graph()
+    restored.load()
+    assert sorted(restored.get_all_users()) == ["A", "B"]
+
+
+def test_torn_final_record_is_ignored(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    with open(WAL_FILE, "w") as f:
+        f.write('["add_friendship", "A", "B"]\n["add_us')
+
+    g = Graph()
+    g.load()
+    g.enable_wal()
+    g.add_user("C")
+
+    restored = Graph()
+    restored.load()
+    assert sorted(restored.get_all_users()) == ["A", "B", "C"]
+    assert restored.are_friends("A", "B")
+
+
+def test_bulk_friendships_are_logged(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+
+    g = Graph()
+    g.enable_wal()
+    g.add_friendships_bulk([("A", "B"), ("B", "A"), ("B", "C")])
+
+    restored = Graph()
+    restored.load()
+    assert restored.adjacency_list() == g.adjacency_list()
+
+
+def test_explicit_paths_keep_graphs_apart(tmp_path):
+    eu, us = str(tmp_path / "eu.json"), str(tmp_path / "us.json")
+
+    a = Graph()
+    a.add_friendship("A", "B")
+    a.save(eu)
+    a.enable_wal()
+    a.add_user("C")
+
+    b = Graph()
+    b.add_friendship("X", "Y")
+    b.save(us)
+
+    assert a.path == eu and os.path.exists(eu + ".wal")
+    restored = Graph()
+    restored.load(eu)
+    assert restored.get_all_users() == ["A", "B", "C"]
+    restored.load(us)  # rebinding to another file replaces nothing else
+    assert restored.path == us
+
+    a.close()
+    assert not os.path.exists(eu + ".wal")
+
+
+def test_save_writes_binary_snapshot_and_replays_log_on_top(tmp_path, monkeypatch):
+    from social_graph.snapshot import MAGIC
+
+    monkeypatch.chdir(tmp_path)
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.add_user("Gone")
+    g.delete_user("Gone")
+    g.save()
+    with open(GRAPH_FILE, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+
+    g.enable_wal()
+    g.add_friendship("B", "C")
+    g.sync()
+
+    restored = Graph()
+    restored.load()
+    assert restored.adjacency_list() == g.adjacency_list()
+    assert restored.tombstone_count() == 1
+
+    g.export_json("copy.json")            # JSON only as an explicit export
+    assert g.path == GRAPH_FILE and os.path.exists(WAL_FILE)
+    from_json = Graph()
+    from_json.load("copy.json")
+    assert from_json.adjacency_list() == g.adjacency_list()
+
+
+def test_legacy_json_file_is_imported(tmp_path, monkeypatch):
+    from social_graph.graph import LEGACY_GRAPH_FILE
+
+    monkeypatch.chdir(tmp_path)
+    old = Graph()
+    old.add_friendship("A", "B")
+    old.export_json(LEGACY_GRAPH_FILE)
+    with open(LEGACY_GRAPH_FILE + ".wal", "w") as f:
+        f.write('["add_user", "C"]\n')
+
+    g = Graph()
+    g.load()
+    assert sorted(g.get_all_users()) == ["A", "B", "C"]
+    assert os.path.exists(GRAPH_FILE)      # written back as a snapshot
+
+    restored = Graph()
+    restored.load()
+    assert restored.adjacency_list() == g.adjacency_list()
+
+
+def test_saving_elsewhere_keeps_the_old_file_complete(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    g = Graph()
+    g.add_friendship("A", "B")
+    g.save("a.sgs")
+    g.enable_wal()
+    g.add_friendship("B", "C")
+    g.sync()                              # durable for a.sgs
+
+    g.save("b.sgs")
+    g.add_user("D")                       # logged for b.sgs only
+    g.sync()
+
+    old = Graph()
+    old.load("a.sgs")
+    assert old.are_friends("B", "C") and not old.has_user("D")
+    assert not os.path.exists("a.sgs.wal")   # checkpointed before moving
+
+    new = Graph()
+    new.load("b.sgs")
+    assert new.adjacency_list() == g.adjacency_list()